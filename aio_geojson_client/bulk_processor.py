@@ -0,0 +1,115 @@
+"""Bulk processor."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+import logging
+import mmap
+import os
+from typing import TYPE_CHECKING, Generic
+
+from .consts import T_FEED_ENTRY, T_FILTER_DEFINITION, UPDATE_ERROR
+
+if TYPE_CHECKING:
+    from .feed import GeoJsonFeed
+
+_LOGGER = logging.getLogger(__name__)
+
+# Feed of the worker process, with the filter overrides and selection.
+_worker_feed: GeoJsonFeed | None = None
+_worker_filter_overrides = None
+_worker_nearest: int | None = None
+
+
+def _initialise_worker(
+    feed_factory: Callable[[], GeoJsonFeed],
+    filter_overrides: T_FILTER_DEFINITION,
+    nearest: int | None,
+):
+    """Create the feed of this worker process once."""
+    global _worker_feed, _worker_filter_overrides, _worker_nearest  # noqa: PLW0603
+    _worker_feed = feed_factory()
+    _worker_filter_overrides = filter_overrides
+    _worker_nearest = nearest
+
+
+def _process(document: str | bytes) -> tuple[str, list | None]:
+    """Process a document with the feed of this worker process."""
+    status, entries = _worker_feed.process(
+        document, _worker_filter_overrides, nearest=_worker_nearest
+    )
+    for entry in entries or []:
+        # Shared caches stay with the worker process.
+        entry.distance_cache = None
+        entry.geometry_interner = None
+    return status, entries
+
+
+def _process_file(path: str | os.PathLike) -> tuple[str, list | None]:
+    """Process a memory-mapped document file."""
+    try:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return _process(b"")
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _process(mapped)
+    except OSError as os_error:
+        _LOGGER.warning("Unable to read %s: %s", path, os_error)
+        return UPDATE_ERROR, None
+
+
+class BulkProcessor(Generic[T_FEED_ENTRY]):
+    """Processes local GeoJSON documents with a feed, across processes.
+
+    Each worker process creates its own feed with the feed factory, which
+    must be picklable (for example a module-level function, or a partial of
+    a feed class without web session). Documents are parsed, wrapped into
+    entries and filtered exactly like an update, and results are returned in
+    the order of the documents as soon as they are available.
+    """
+
+    def __init__(
+        self,
+        feed_factory: Callable[[], GeoJsonFeed],
+        filter_overrides: T_FILTER_DEFINITION = None,
+        *,
+        nearest: int | None = None,
+        max_workers: int | None = None,
+        chunk_size: int = 1,
+    ):
+        """Initialise bulk processor."""
+        self._executor: Executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialise_worker,
+            initargs=(feed_factory, filter_overrides, nearest),
+        )
+        self._chunk_size = chunk_size
+
+    def __repr__(self):
+        """Return string representation of this bulk processor."""
+        return f"<{self.__class__.__name__}(chunk_size={self._chunk_size})>"
+
+    def __enter__(self) -> BulkProcessor[T_FEED_ENTRY]:
+        """Enter the context of this bulk processor."""
+        return self
+
+    def __exit__(self, *args):
+        """Shut down the worker processes when leaving the context."""
+        self.close()
+
+    def process_files(
+        self, paths: Iterable[str | os.PathLike]
+    ) -> Iterator[tuple[str, list[T_FEED_ENTRY] | None]]:
+        """Process document files, and return status and entries per file."""
+        return self._executor.map(_process_file, paths, chunksize=self._chunk_size)
+
+    def process_buffers(
+        self, buffers: Iterable[str | bytes]
+    ) -> Iterator[tuple[str, list[T_FEED_ENTRY] | None]]:
+        """Process documents, and return status and entries per document."""
+        return self._executor.map(_process, buffers, chunksize=self._chunk_size)
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown()
@@ -0,0 +1,224 @@
+"""Change stream. This allows consuming feed manager changes as async iterator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Self
+
+from .consts import (
+    DEFAULT_CHANGE_STREAM_SIZE,
+    OVERFLOW_BLOCK,
+    OVERFLOW_COALESCE,
+    OVERFLOW_DROP_OLDEST,
+)
+from .feed_entry import FeedEntry
+from .status_update import StatusUpdate
+
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_COALESCE, OVERFLOW_DROP_OLDEST)
+
+
+class ChangeEvent:
+    """Change event base class."""
+
+    def __repr__(self):
+        """Return string representation of this event."""
+        return f"<{self.__class__.__name__}()>"
+
+
+class EntryChangeEvent(ChangeEvent):
+    """Change event concerning a single feed entry."""
+
+    def __init__(self, external_id: str, entry: FeedEntry | None):
+        """Initialise this change event."""
+        self._external_id = external_id
+        self._entry = entry
+
+    def __repr__(self):
+        """Return string representation of this event."""
+        return f"<{self.__class__.__name__}(id={self.external_id})>"
+
+    @property
+    def external_id(self) -> str:
+        """Return the external id of the changed entry."""
+        return self._external_id
+
+    @property
+    def entry(self) -> FeedEntry | None:
+        """Return the changed entry."""
+        return self._entry
+
+
+class EntryCreatedEvent(EntryChangeEvent):
+    """A new entry appeared in the feed."""
+
+
+class EntryUpdatedEvent(EntryChangeEvent):
+    """An existing entry is still in the feed."""
+
+
+class EntryRemovedEvent(EntryChangeEvent):
+    """An entry is not in the feed anymore."""
+
+
+class StatusEvent(ChangeEvent):
+    """An update cycle has completed."""
+
+    def __init__(self, status_update: StatusUpdate):
+        """Initialise this change event."""
+        self._status_update = status_update
+
+    def __repr__(self):
+        """Return string representation of this event."""
+        return f"<{self.__class__.__name__}({self.status_update})>"
+
+    @property
+    def status_update(self) -> StatusUpdate:
+        """Return the status update."""
+        return self._status_update
+
+
+class ChangeSubscription:
+    """Bounded, independently consumed stream of change events."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CHANGE_STREAM_SIZE,
+        overflow: str = OVERFLOW_BLOCK,
+        on_close: Callable[[ChangeSubscription], None] | None = None,
+    ):
+        """Initialise this subscription."""
+        if max_size < 1:
+            raise ValueError(f"Invalid maximum size: {max_size}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+        self._max_size = max_size
+        self._overflow = overflow
+        self._on_close = on_close
+        self._events = OrderedDict()
+        self._condition = asyncio.Condition()
+        self._sequence = 0
+        self._closed = False
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._max_lag = 0
+
+    def __repr__(self):
+        """Return string representation of this subscription."""
+        return f"<{self.__class__.__name__}(overflow={self._overflow}, lag={self.lag})>"
+
+    def __aiter__(self):
+        """Return this subscription as async iterator."""
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        """Wait for and return the next change event."""
+        async with self._condition:
+            while not self._events:
+                if self._closed:
+                    raise StopAsyncIteration
+                await self._condition.wait()
+            _, event = self._events.popitem(last=False)
+            self._delivered += 1
+            self._condition.notify_all()
+            return event
+
+    async def __aenter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close this subscription when leaving context."""
+        await self.close()
+
+    async def close(self):
+        """Stop receiving events; already queued events can still be consumed."""
+        async with self._condition:
+            if not self._closed:
+                self._closed = True
+                self._condition.notify_all()
+        if self._on_close:
+            self._on_close(self)
+            self._on_close = None
+
+    async def publish(self, event: ChangeEvent):
+        """Queue event, applying the overflow policy if the queue is full."""
+        async with self._condition:
+            if self._closed:
+                return
+            if self._overflow == OVERFLOW_COALESCE:
+                key = ChangeSubscription._coalesce_key(event)
+                if key in self._events:
+                    self._coalesce(key, event)
+                    self._condition.notify_all()
+                    return
+            else:
+                self._sequence += 1
+                key = self._sequence
+            if self._overflow == OVERFLOW_DROP_OLDEST:
+                while len(self._events) >= self._max_size:
+                    self._events.popitem(last=False)
+                    self._dropped += 1
+            else:
+                # Apply backpressure until the consumer catches up.
+                while len(self._events) >= self._max_size and not self._closed:
+                    await self._condition.wait()
+                if self._closed:
+                    return
+            self._events[key] = event
+            self._max_lag = max(self._max_lag, len(self._events))
+            self._condition.notify_all()
+
+    def _coalesce(self, key, event: ChangeEvent):
+        """Merge event with the event already queued for the same entry."""
+        previous = self._events.pop(key)
+        self._coalesced += 1
+        if isinstance(previous, EntryCreatedEvent):
+            if isinstance(event, EntryRemovedEvent):
+                # Consumer has never seen this entry.
+                return
+            event = EntryCreatedEvent(event.external_id, event.entry)
+        elif isinstance(previous, EntryRemovedEvent) and isinstance(
+            event, EntryCreatedEvent
+        ):
+            event = EntryUpdatedEvent(event.external_id, event.entry)
+        self._events[key] = event
+
+    @staticmethod
+    def _coalesce_key(event: ChangeEvent):
+        """Return the key under which events are coalesced."""
+        if isinstance(event, EntryChangeEvent):
+            return "entry", event.external_id
+        return (event.__class__.__name__,)
+
+    @property
+    def closed(self) -> bool:
+        """Return if this subscription is closed."""
+        return self._closed
+
+    @property
+    def lag(self) -> int:
+        """Return the number of queued events not yet consumed."""
+        return len(self._events)
+
+    @property
+    def max_lag(self) -> int:
+        """Return the highest number of queued events observed."""
+        return self._max_lag
+
+    @property
+    def delivered(self) -> int:
+        """Return the number of events delivered to the consumer."""
+        return self._delivered
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of events dropped due to overflow."""
+        return self._dropped
+
+    @property
+    def coalesced(self) -> int:
+        """Return the number of events merged into already queued events."""
+        return self._coalesced
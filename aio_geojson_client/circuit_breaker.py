@@ -0,0 +1,81 @@
+"""Circuit breaker."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _HostState:
+    """Circuit state of a single host."""
+
+    __slots__ = ("failures", "opened_at", "trial_in_progress")
+
+    def __init__(self):
+        """Initialise host state."""
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trial_in_progress = False
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker, to be shared by all feeds.
+
+    After a number of consecutive failures the circuit of a host opens, and
+    requests to that host fail fast. Once the recovery timeout has passed, a
+    single trial request is let through; its success closes the circuit
+    again, its failure keeps the circuit open for another recovery timeout.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        """Initialise circuit breaker (recovery timeout in seconds)."""
+        if failure_threshold < 1:
+            raise ValueError(f"Invalid failure threshold: {failure_threshold}")
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._hosts: dict[str, _HostState] = {}
+
+    def __repr__(self):
+        """Return string representation of this circuit breaker."""
+        return f"<{self.__class__.__name__}(failure_threshold={self._failure_threshold}, recovery_timeout={self._recovery_timeout})>"
+
+    def allow_request(self, host: str) -> bool:
+        """Check if a request to the host may be sent."""
+        state = self._hosts.get(host)
+        if state is None or state.opened_at is None:
+            return True
+        if state.trial_in_progress:
+            return False
+        if time.monotonic() - state.opened_at >= self._recovery_timeout:
+            state.trial_in_progress = True
+            return True
+        return False
+
+    def record_success(self, host: str):
+        """Record a successful request to the host."""
+        if self._hosts.pop(host, None):
+            _LOGGER.debug("Circuit for %s closed", host)
+
+    def record_failure(self, host: str):
+        """Record a failed request to the host."""
+        state = self._hosts.setdefault(host, _HostState())
+        state.failures += 1
+        state.trial_in_progress = False
+        if state.opened_at is not None or state.failures >= self._failure_threshold:
+            if state.opened_at is None:
+                _LOGGER.warning(
+                    "Circuit for %s opened after %s failures", host, state.failures
+                )
+            state.opened_at = time.monotonic()
+
+    def release(self, host: str):
+        """Release the trial request to the host if it did not complete."""
+        if state := self._hosts.get(host):
+            state.trial_in_progress = False
+
+    def is_open(self, host: str) -> bool:
+        """Check if the circuit of the host is open."""
+        state = self._hosts.get(host)
+        return state is not None and state.opened_at is not None
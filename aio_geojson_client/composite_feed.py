@@ -0,0 +1,156 @@
+"""Composite GeoJSON Feed."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import logging
+import math
+from typing import Generic
+
+from .consts import (
+    T_FEED_ENTRY,
+    T_FILTER_DEFINITION,
+    UPDATE_ERROR,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+)
+from .feed import GeoJsonFeed
+
+_LOGGER = logging.getLogger(__name__)
+
+# Approximate length of one degree of latitude in km.
+KM_PER_DEGREE = 111.195
+
+
+class CompositeGeoJsonFeed(Generic[T_FEED_ENTRY]):
+    """Feed merging the entries of several GeoJSON feeds.
+
+    All feeds are updated concurrently, and the entries are merged into a
+    single list. Entries are deduplicated by external id, with earlier feeds
+    taking precedence. If a dedupe distance (in km) is defined, entries close
+    to an entry from another feed are considered duplicates as well.
+
+    A feed that reports no new data contributes its previous entries, and a
+    feed that fails only loses its own entries.
+    """
+
+    def __init__(self, feeds: list[GeoJsonFeed], dedupe_distance: float | None = None):
+        """Initialise this composite feed."""
+        self._feeds = feeds
+        self._dedupe_distance = dedupe_distance
+        self._feed_entries: list[list[T_FEED_ENTRY] | None] = [None] * len(feeds)
+        self._last_timestamp = None
+
+    def __repr__(self):
+        """Return string representation of this feed."""
+        return f"<{self.__class__.__name__}(feeds={self._feeds}, dedupe_distance={self._dedupe_distance})>"
+
+    async def update(
+        self, *, nearest: int | None = None
+    ) -> tuple[str, list[T_FEED_ENTRY] | None]:
+        """Update from all feeds and return merged entries."""
+        return await self._update_internal(lambda feed: feed.update(), nearest)
+
+    async def update_override(
+        self,
+        filter_overrides: T_FILTER_DEFINITION = None,
+        *,
+        nearest: int | None = None,
+    ) -> tuple[str, list[T_FEED_ENTRY] | None]:
+        """Update from all feeds and return merged entries with ability to override filter conditions."""
+        # Unsupported overrides are a configuration error, not a failed feed.
+        for feed in self._feeds:
+            feed.validate_filter_definition(filter_overrides)
+        return await self._update_internal(
+            lambda feed: feed.update_override(filter_overrides=filter_overrides),
+            nearest,
+        )
+
+    async def _update_internal(
+        self,
+        update_function: Callable[
+            [GeoJsonFeed], Awaitable[tuple[str, list[T_FEED_ENTRY] | None]]
+        ],
+        nearest: int | None = None,
+    ) -> tuple[str, list[T_FEED_ENTRY] | None]:
+        """Update all feeds concurrently and merge their entries."""
+        results = await asyncio.gather(
+            *(update_function(feed) for feed in self._feeds), return_exceptions=True
+        )
+        statuses = set()
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Updating %s failed with %s", self._feeds[index], repr(result)
+                )
+                status, entries = UPDATE_ERROR, None
+            else:
+                status, entries = result
+            statuses.add(status)
+            if status == UPDATE_OK:
+                self._feed_entries[index] = entries or []
+            elif status == UPDATE_ERROR:
+                self._feed_entries[index] = None
+        if statuses == {UPDATE_ERROR}:
+            self._last_timestamp = None
+            return UPDATE_ERROR, None
+        if statuses == {UPDATE_OK_NO_DATA}:
+            return UPDATE_OK_NO_DATA, None
+        timestamps = [
+            feed.last_timestamp for feed in self._feeds if feed.last_timestamp
+        ]
+        self._last_timestamp = max(timestamps) if timestamps else None
+        if nearest is not None:
+            return UPDATE_OK, GeoJsonFeed.select_nearest(self._merge(), nearest)
+        return UPDATE_OK, self._merge()
+
+    def _merge(self) -> list[T_FEED_ENTRY]:
+        """Merge the entries of all feeds, removing duplicates."""
+        merged = []
+        external_ids = set()
+        # Coordinates of merged entries by latitude band.
+        bands: dict[int, list[tuple[tuple[float, float], int]]] = {}
+        band_size = (
+            self._dedupe_distance / KM_PER_DEGREE if self._dedupe_distance else None
+        )
+        for index, entries in enumerate(self._feed_entries):
+            for entry in entries or []:
+                if entry.external_id in external_ids:
+                    continue
+                coordinates = entry.coordinates if band_size else None
+                if coordinates and coordinates[0] is not None:
+                    band = math.floor(coordinates[0] / band_size)
+                    if self._is_near_duplicate(coordinates, index, band, bands):
+                        _LOGGER.debug("Skipping duplicate entry %s", entry)
+                        continue
+                    bands.setdefault(band, []).append((coordinates, index))
+                external_ids.add(entry.external_id)
+                merged.append(entry)
+        return merged
+
+    def _is_near_duplicate(
+        self,
+        coordinates: tuple[float, float],
+        index: int,
+        band: int,
+        bands: dict[int, list[tuple[tuple[float, float], int]]],
+    ) -> bool:
+        """Check if an entry from another feed is within the dedupe distance."""
+        from haversine import haversine  # noqa: PLC0415
+
+        for neighbour_band in (band - 1, band, band + 1):
+            for other_coordinates, other_index in bands.get(neighbour_band, []):
+                if (
+                    other_index != index
+                    and haversine(coordinates, other_coordinates)
+                    <= self._dedupe_distance
+                ):
+                    return True
+        return False
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        """Return the latest timestamp extracted from all feeds."""
+        return self._last_timestamp
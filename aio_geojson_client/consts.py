@@ -1,9 +1,12 @@
 """Constants."""
 
-from typing import TypeVar
+from __future__ import annotations
 
-from .feed_entry import FeedEntry
-from .filter_definition import GeoJsonFeedFilterDefinition
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from .feed_entry import FeedEntry
+    from .filter_definition import GeoJsonFeedFilterDefinition
 
 DEFAULT_REQUEST_TIMEOUT = 10
 
@@ -11,5 +14,14 @@ UPDATE_OK = "OK"
 UPDATE_OK_NO_DATA = "OK_NO_DATA"
 UPDATE_ERROR = "ERROR"
 
-T_FILTER_DEFINITION = TypeVar("T_FILTER_DEFINITION", bound=GeoJsonFeedFilterDefinition)
-T_FEED_ENTRY = TypeVar("T_FEED_ENTRY", bound=FeedEntry)
+DEFAULT_CHANGE_STREAM_SIZE = 100
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_COALESCE = "coalesce"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+
+# Bounds are forward references, so that importing the constants is cheap.
+T_FILTER_DEFINITION = TypeVar(
+    "T_FILTER_DEFINITION", bound="GeoJsonFeedFilterDefinition"
+)
+T_FEED_ENTRY = TypeVar("T_FEED_ENTRY", bound="FeedEntry")
@@ -0,0 +1,165 @@
+"""Content encoding."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import importlib.util
+import logging
+from typing import Any
+import zlib
+
+_LOGGER = logging.getLogger(__name__)
+
+ENCODING_IDENTITY = "identity"
+ENCODING_GZIP = "gzip"
+ENCODING_DEFLATE = "deflate"
+ENCODING_BROTLI = "br"
+ENCODING_ZSTD = "zstd"
+
+# Keys of the transfer statistics of a feed.
+TRANSFER_COMPRESSED_BYTES = "compressed_bytes"
+TRANSFER_UNCOMPRESSED_BYTES = "uncompressed_bytes"
+
+# Most efficient encodings first.
+DEFAULT_ENCODINGS = (ENCODING_ZSTD, ENCODING_BROTLI, ENCODING_GZIP)
+
+# Optional libraries providing an encoding, in order of preference.
+ENCODING_MODULES = {
+    ENCODING_BROTLI: ("brotli", "brotlicffi"),
+    ENCODING_ZSTD: ("compression.zstd", "zstandard"),
+}
+
+
+def _find_module(names: tuple[str, ...]) -> str | None:
+    """Return the first of the modules that is installed, without importing it."""
+    for name in names:
+        try:
+            if importlib.util.find_spec(name) is not None:
+                return name
+        except ModuleNotFoundError:
+            # The parent package does not exist.
+            continue
+    return None
+
+
+class ContentDecoder:
+    """Incremental decoder of a response body in a content encoding.
+
+    Errors of the underlying decompressor are raised as `ValueError`.
+    """
+
+    def __init__(
+        self,
+        encoding: str,
+        decompress: Callable[[bytes], bytes],
+        flush: Callable[[], bytes] | None = None,
+        error: type[Exception] | tuple[type[Exception], ...] = (),
+    ):
+        """Initialise content decoder."""
+        self._encoding = encoding
+        self._decompress = decompress
+        self._flush = flush
+        self._error = error
+
+    def __repr__(self):
+        """Return string representation of this decoder."""
+        return f"<{self.__class__.__name__}(encoding={self._encoding})>"
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """Decode the next chunk of the body."""
+        try:
+            return self._decompress(chunk)
+        except self._error as error:
+            raise ValueError(f"Invalid {self._encoding} content: {error}") from error
+
+    def flush(self) -> bytes:
+        """Decode what remains at the end of the body."""
+        if self._flush is None:
+            return b""
+        try:
+            return self._flush()
+        except self._error as error:
+            raise ValueError(f"Invalid {self._encoding} content: {error}") from error
+
+
+class ContentNegotiation:
+    """Negotiates efficient content encodings with servers.
+
+    Encodings are requested in order of preference, leaving out those whose
+    optional library (`brotli` or `brotlicffi` for `br`, `zstandard` or the
+    standard library of Python 3.14 for `zstd`) is not installed. Responses
+    are decoded incrementally while they arrive.
+    """
+
+    def __init__(self, encodings: Iterable[str] = DEFAULT_ENCODINGS):
+        """Initialise content negotiation."""
+        self._modules: dict[str, str] = {}
+        self._encodings = []
+        for encoding in encodings:
+            if encoding in (ENCODING_GZIP, ENCODING_DEFLATE, ENCODING_IDENTITY):
+                self._encodings.append(encoding)
+            elif encoding in ENCODING_MODULES:
+                module = _find_module(ENCODING_MODULES[encoding])
+                if module is None:
+                    _LOGGER.debug("No library installed for %s encoding", encoding)
+                    continue
+                self._modules[encoding] = module
+                self._encodings.append(encoding)
+            else:
+                raise ValueError(f"Unsupported content encoding {encoding}")
+
+    def __repr__(self):
+        """Return string representation of this negotiation."""
+        return f"<{self.__class__.__name__}(encodings={self._encodings})>"
+
+    @property
+    def encodings(self) -> list[str]:
+        """Return the available encodings in order of preference."""
+        return self._encodings
+
+    @property
+    def accept_encoding(self) -> str:
+        """Return the value of the Accept-Encoding request header."""
+        if not self._encodings:
+            return ENCODING_IDENTITY
+        count = len(self._encodings)
+        # Decreasing quality values express the order of preference.
+        return ", ".join(
+            encoding if index == 0 else f"{encoding};q={(count - index) / count:.2g}"
+            for index, encoding in enumerate(self._encodings)
+        )
+
+    def decoder(self, content_encoding: str | None) -> ContentDecoder:
+        """Create a decoder for the Content-Encoding of a response."""
+        encoding = (content_encoding or ENCODING_IDENTITY).strip().lower()
+        if encoding == ENCODING_IDENTITY:
+            return ContentDecoder(encoding, bytes)
+        if encoding in (ENCODING_GZIP, ENCODING_DEFLATE):
+            decompressor = zlib.decompressobj(
+                zlib.MAX_WBITS | (16 if encoding == ENCODING_GZIP else 0)
+            )
+            return ContentDecoder(
+                encoding, decompressor.decompress, decompressor.flush, zlib.error
+            )
+        if encoding in self._modules:
+            return self._library_decoder(encoding, self._modules[encoding])
+        raise ValueError(f"Unsupported content encoding {encoding}")
+
+    @staticmethod
+    def _library_decoder(encoding: str, module_name: str) -> ContentDecoder:
+        """Create a decoder backed by an optional library."""
+        module: Any = importlib.import_module(module_name)
+        if encoding == ENCODING_BROTLI:
+            decompressor = module.Decompressor()
+            # brotlicffi names the method like the other decompressors.
+            decompress = getattr(decompressor, "process", None) or (
+                decompressor.decompress
+            )
+            return ContentDecoder(encoding, decompress, error=module.error)
+        if module_name == "zstandard":
+            decompressor = module.ZstdDecompressor().decompressobj()
+            return ContentDecoder(
+                encoding, decompressor.decompress, error=module.ZstdError
+            )
+        decompressor = module.ZstdDecompressor()
+        return ContentDecoder(encoding, decompressor.decompress, error=module.ZstdError)
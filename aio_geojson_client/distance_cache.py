@@ -0,0 +1,160 @@
+"""Distance cache."""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+import logging
+from weakref import ref
+
+from .geojson_distance_helper import GeoJsonDistanceHelper
+from .geometries import Geometry, Point, Polygon
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 4096
+
+KIND_DISTANCE = "distance"
+KIND_INSIDE = "inside"
+
+
+def geometry_fingerprint(geometry: Geometry) -> bytes | None:
+    """Calculate a stable fingerprint of the geometry's coordinates."""
+    if isinstance(geometry, Point):
+        tag = b"P"
+        points = [geometry]
+    elif isinstance(geometry, Polygon):
+        tag = b"A"
+        points = geometry.points
+    else:
+        return None
+    coordinates = array("d")
+    for point in points:
+        coordinates.append(point.latitude)
+        coordinates.append(point.longitude)
+    return blake2b(tag + coordinates.tobytes(), digest_size=16).digest()
+
+
+class DistanceCache:
+    """Bounded LRU cache of distances between home coordinates and geometries.
+
+    Entries keep identical geometries across updates, so caching their
+    distances avoids recalculating them on every update. The cache is keyed
+    by geometry fingerprint and home coordinates, and can be shared by all
+    feeds. Fingerprints are kept per geometry instance while it is alive, so
+    geometries shared by a geometry interner are only fingerprinted once.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialise distance cache."""
+        if max_size < 1:
+            raise ValueError(f"Invalid maximum size {max_size}")
+        self._max_size = max_size
+        self._results: OrderedDict[tuple, float | bool] = OrderedDict()
+        self._fingerprints: dict[int, tuple[ref, bytes | None]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        """Return string representation of this cache."""
+        return f"<{self.__class__.__name__}(size={len(self._results)}, max_size={self._max_size})>"
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._results)
+
+    def distance_to_geometry(
+        self, coordinates: tuple[float, float], geometry: Geometry
+    ) -> float:
+        """Return the distance in km between coordinates and geometry."""
+        fingerprint = self._fingerprint(geometry)
+        if fingerprint is None:
+            return GeoJsonDistanceHelper.distance_to_geometry(coordinates, geometry)
+        key = (KIND_DISTANCE, fingerprint, tuple(coordinates))
+        distance = self._lookup(key)
+        if distance is None:
+            if isinstance(geometry, Polygon):
+                distance = (
+                    0.0
+                    if self._is_inside(coordinates, geometry, fingerprint)
+                    else GeoJsonDistanceHelper.distance_to_outline(
+                        coordinates, geometry
+                    )
+                )
+            else:
+                distance = GeoJsonDistanceHelper.distance_to_geometry(
+                    coordinates, geometry
+                )
+            self._store(key, distance)
+        return distance
+
+    def is_inside(self, coordinates: tuple[float, float], polygon: Polygon) -> bool:
+        """Return if the coordinates are inside the polygon."""
+        return self._is_inside(coordinates, polygon, self._fingerprint(polygon))
+
+    def _fingerprint(self, geometry: Geometry) -> bytes | None:
+        """Return the geometry's fingerprint, calculated once per instance."""
+        key = id(geometry)
+        cached = self._fingerprints.get(key)
+        if cached is not None and cached[0]() is geometry:
+            return cached[1]
+        fingerprint = geometry_fingerprint(geometry)
+        fingerprints = self._fingerprints
+        try:
+            reference = ref(geometry, lambda _: fingerprints.pop(key, None))
+        except TypeError:
+            # Geometries that cannot be referenced weakly are not kept.
+            return fingerprint
+        fingerprints[key] = reference, fingerprint
+        return fingerprint
+
+    def _is_inside(
+        self, coordinates: tuple[float, float], polygon: Polygon, fingerprint: bytes
+    ) -> bool:
+        """Return if the coordinates are inside the polygon with the fingerprint."""
+        key = (KIND_INSIDE, fingerprint, tuple(coordinates))
+        inside = self._lookup(key)
+        if inside is None:
+            inside = polygon.is_inside(Point(coordinates[0], coordinates[1]))
+            self._store(key, inside)
+        return inside
+
+    def _lookup(self, key: tuple) -> float | bool | None:
+        """Look up a result, and mark it as recently used."""
+        result = self._results.get(key)
+        if result is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def _store(self, key: tuple, result: float | bool):
+        """Store a result, evicting the least recently used one if full."""
+        self._results[key] = result
+        if len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached results and reset statistics."""
+        self._results.clear()
+        self._fingerprints.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Return the number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of lookups that had to be calculated."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the share of lookups answered from the cache."""
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else None
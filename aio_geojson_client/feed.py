@@ -4,16 +4,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from datetime import datetime
+import heapq
+from http import HTTPStatus
 import logging
-from typing import Generic
-
-import aiohttp
-from aiohttp import ClientSession, client_exceptions
-import geojson
-from geojson import Feature, FeatureCollection
+import time
+from typing import TYPE_CHECKING, Generic
+from urllib.parse import urlsplit
+import zlib
 
+from .circuit_breaker import CircuitBreaker
 from .consts import (
     DEFAULT_REQUEST_TIMEOUT,
     T_FEED_ENTRY,
@@ -22,9 +23,40 @@ from .consts import (
     UPDATE_OK,
     UPDATE_OK_NO_DATA,
 )
+from .content_encoding import (
+    TRANSFER_COMPRESSED_BYTES,
+    TRANSFER_UNCOMPRESSED_BYTES,
+    ContentNegotiation,
+)
+from .distance_cache import DistanceCache
+from .filter_definition import GeoJsonFeedFilterDefinition
+from .filter_pipeline import (
+    BoundingBoxFilterStage,
+    FilterPipeline,
+    FilterStage,
+    GeofenceFilterStage,
+    GeometryFilterStage,
+    PropertyFilterStage,
+    RadiusFilterStage,
+    TimeWindowFilterStage,
+)
+from .geometry_interner import GeometryInterner
+from .mirror import Mirror
+from .pagination import Pagination
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .simplification import PolygonSimplifier
+from .traffic_archive import TrafficArchive
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession
+    from geojson import Feature, FeatureCollection
 
 _LOGGER = logging.getLogger(__name__)
 
+# Result of a request not sent due to the rate limit, keeping the previous data.
+_RATE_LIMITED = UPDATE_OK_NO_DATA, None, False
+
 
 class GeoJsonFeed(Generic[T_FEED_ENTRY], ABC):
     """Geo JSON feed base class."""
@@ -35,12 +67,63 @@ class GeoJsonFeed(Generic[T_FEED_ENTRY], ABC):
         home_coordinates: tuple[float, float],
         url: str,
         filter_radius: float | None = None,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        mirror_urls: list[str] | None = None,
+        hedge_percentile: float | None = None,
+        pagination: Pagination | None = None,
+        rate_limiter: RateLimiter | None = None,
+        filter_definition: GeoJsonFeedFilterDefinition | None = None,
+        distance_cache: DistanceCache | None = None,
+        incremental: bool = False,
+        detach_entries: bool = False,
+        simplify_tolerance: float | None = None,
+        geometry_interner: GeometryInterner | None = None,
+        skip_unchanged: bool = False,
+        traffic_archive: TrafficArchive | None = None,
+        accept_encodings: list[str] | None = None,
     ):
         """Initialise this service."""
         self._websession = websession
         self._home_coordinates = home_coordinates
         self._filter_radius = filter_radius
         self._url = url
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._mirrors = [
+            Mirror(mirror_url) for mirror_url in [url, *(mirror_urls or [])]
+        ]
+        self._hedge_percentile = hedge_percentile
+        self._pagination = pagination
+        self._rate_limiter = rate_limiter
+        self.validate_filter_definition(filter_definition)
+        self._filter_definition = filter_definition
+        self._filter_pipeline: FilterPipeline | None = None
+        self._distance_cache = distance_cache
+        self._incremental = incremental
+        self._detach_entries = detach_entries
+        self._geometry_interner = geometry_interner
+        self._skip_unchanged = skip_unchanged
+        self._traffic_archive = traffic_archive
+        self._content_negotiation = (
+            ContentNegotiation(accept_encodings)
+            if accept_encodings is not None
+            else None
+        )
+        # Compressed and uncompressed bytes received during the last update.
+        self._transfer_statistics: dict[str, int] | None = None
+        # CRC32 and length of the previous document, and the criteria it was
+        # filtered with.
+        self._content_fingerprint: tuple[int, int] | None = None
+        self._content_criteria: Hashable = None
+        self._simplifier = (
+            PolygonSimplifier(simplify_tolerance) if simplify_tolerance else None
+        )
+        self._incremental_entries: dict[
+            Hashable, tuple[datetime | None, T_FEED_ENTRY, bool]
+        ] = {}
+        self._incremental_filter_key: Hashable = None
         self._last_timestamp = None
 
     def __repr__(self):
@@ -58,27 +141,102 @@ class GeoJsonFeed(Generic[T_FEED_ENTRY], ABC):
         return DEFAULT_REQUEST_TIMEOUT
 
     async def _update_internal(
-        self, filter_function: Callable[[list[T_FEED_ENTRY]], list[T_FEED_ENTRY]]
+        self,
+        filter_function: Callable[[list[T_FEED_ENTRY]], list[T_FEED_ENTRY]],
+        nearest: int | None = None,
+        filter_key: Hashable = None,
     ) -> tuple[str, list[T_FEED_ENTRY] | None]:
-        """Update from external source and return filtered entries."""
+        """Update from external source and return filtered entries.
+
+        The filter key identifies the criteria of the filter function.
+        """
+        criteria = (filter_key, nearest) if self._skip_unchanged else None
+        if criteria != self._content_criteria:
+            # An unchanged document needs to be filtered again.
+            self._content_fingerprint = None
+            self._content_criteria = criteria
+        if self._content_negotiation:
+            self._transfer_statistics = dict.fromkeys(
+                (TRANSFER_COMPRESSED_BYTES, TRANSFER_UNCOMPRESSED_BYTES), 0
+            )
         status, data = await self._fetch()
+        status, filtered_entries = self._process_data(
+            status, data, filter_function, nearest, filter_key
+        )
+        if status == UPDATE_ERROR:
+            self._content_fingerprint = None
+        return status, filtered_entries
+
+    def process(
+        self,
+        document: str | bytes,
+        filter_overrides: T_FILTER_DEFINITION = None,
+        *,
+        nearest: int | None = None,
+    ) -> tuple[str, list[T_FEED_ENTRY] | None]:
+        """Parse a local GeoJSON document and return filtered entries.
+
+        The document (a string, or UTF-8 encoded bytes or any other buffer
+        such as a memory-mapped file) goes through the same entry creation
+        and filters as an update, without any request.
+        """
+        import geojson  # noqa: PLC0415
+
+        self.validate_filter_definition(filter_overrides)
+        try:
+            if not isinstance(document, str):
+                document = str(document, "utf-8")
+            data = geojson.loads(document)
+        except ValueError as value_ex:
+            _LOGGER.warning("Unable to parse JSON document: %s", value_ex)
+            return self._process_data(UPDATE_ERROR, None, None, nearest)
+        return self._process_data(
+            UPDATE_OK,
+            data,
+            lambda entries: self._filter_entries_override(
+                entries, filter_overrides=filter_overrides
+            ),
+            nearest,
+            self._filter_key(filter_overrides),
+        )
+
+    def _process_data(
+        self,
+        status: str,
+        data: FeatureCollection | None,
+        filter_function: Callable[[list[T_FEED_ENTRY]], list[T_FEED_ENTRY]] | None,
+        nearest: int | None,
+        filter_key: Hashable = None,
+    ) -> tuple[str, list[T_FEED_ENTRY] | None]:
+        """Create and filter the entries of fetched or local data."""
+        from geojson import Feature, FeatureCollection  # noqa: PLC0415
+
         if status == UPDATE_OK:
             if data:
-                entries: list = []
                 global_data = self._extract_from_feed(data)
                 # Extract data from feed entries.
+                features = []
                 if type(data) is Feature:
-                    entries.append(
-                        self._new_entry(self._home_coordinates, data, global_data)
-                    )
+                    features.append(data)
                 elif type(data) is FeatureCollection:
-                    entries = [
-                        self._new_entry(self._home_coordinates, feature, global_data)
-                        for feature in data.features
-                    ]
+                    features = data.features
                 else:
                     _LOGGER.warning("Unsupported GeoJSON object found: %s", type(data))
-                filtered_entries = filter_function(entries)
+                if self._incremental:
+                    filtered_entries = self._filter_incremental(
+                        features, global_data, filter_function, filter_key
+                    )
+                else:
+                    filtered_entries = filter_function(
+                        [
+                            self._create_entry(feature, global_data)
+                            for feature in features
+                        ]
+                    )
+                if nearest is not None:
+                    filtered_entries = GeoJsonFeed.select_nearest(
+                        filtered_entries, nearest
+                    )
                 self._last_timestamp = self._extract_last_timestamp(filtered_entries)
                 return UPDATE_OK, filtered_entries
             # Should not happen.
@@ -90,58 +248,461 @@ class GeoJsonFeed(Generic[T_FEED_ENTRY], ABC):
         self._last_timestamp = None
         return UPDATE_ERROR, None
 
-    async def update(self) -> tuple[str, list[T_FEED_ENTRY] | None]:
-        """Update from external source and return filtered entries."""
+    def _create_entry(self, feature: Feature, global_data: dict) -> T_FEED_ENTRY:
+        """Generate a new entry and hand it the shared interner and cache."""
+        entry = self._new_entry(self._home_coordinates, feature, global_data)
+        if self._geometry_interner is not None:
+            entry.geometry_interner = self._geometry_interner
+        if self._detach_entries:
+            entry.detach()
+        if self._distance_cache is not None:
+            entry.distance_cache = self._distance_cache
+        return entry
+
+    def _filter_incremental(
+        self,
+        features: list[Feature],
+        global_data: dict,
+        filter_function: Callable[[list[T_FEED_ENTRY]], list[T_FEED_ENTRY]],
+        filter_key: Hashable = None,
+    ) -> list[T_FEED_ENTRY]:
+        """Generate and filter entries, carrying over unchanged ones.
+
+        A feature is unchanged if it has the same key as a feature of the
+        previous update, and its timestamp is not newer. Its entry and the
+        filter result are then reused, unless the filter key or pipeline
+        changed.
+        """
+        entries = []
+        # Filter results of carried over entries by their id.
+        carried_over: dict[int, bool] = {}
+        seen = {}
+        for feature in features:
+            key = self._feature_key(feature)
+            timestamp = self._feature_timestamp(feature)
+            previous = self._incremental_entries.get(key) if key is not None else None
+            if (
+                previous
+                and timestamp is not None
+                and previous[0] is not None
+                and timestamp <= previous[0]
+            ):
+                entry = previous[1]
+                carried_over[id(entry)] = previous[2]
+            else:
+                entry = self._create_entry(feature, global_data)
+            entries.append(entry)
+            if key is not None:
+                seen[key] = (timestamp, entry)
+        pipeline = self._filter_pipeline
+        accepted = {
+            id(entry)
+            for entry in filter_function(
+                [entry for entry in entries if id(entry) not in carried_over]
+            )
+        }
+        if (
+            self._filter_pipeline is pipeline
+            and filter_key == self._incremental_filter_key
+        ):
+            accepted.update(
+                entry_id for entry_id, passed in carried_over.items() if passed
+            )
+        elif carried_over:
+            # Filter criteria changed, previous results do not apply.
+            accepted.update(
+                id(entry)
+                for entry in filter_function(
+                    [entry for entry in entries if id(entry) in carried_over]
+                )
+            )
+        self._incremental_entries = {
+            key: (timestamp, entry, id(entry) in accepted)
+            for key, (timestamp, entry) in seen.items()
+        }
+        self._incremental_filter_key = filter_key
+        _LOGGER.debug("Carried over %s of %s entries", len(carried_over), len(entries))
+        return [entry for entry in entries if id(entry) in accepted]
+
+    def _feature_key(self, feature: Feature) -> Hashable | None:
+        """Identify the feature across updates in incremental mode. Override if necessary."""
+        return feature.get("id")
+
+    def _feature_timestamp(self, feature: Feature) -> datetime | None:
+        """Determine when the feature was last updated in incremental mode. Override if necessary."""
+        return None
+
+    async def update(
+        self, *, nearest: int | None = None
+    ) -> tuple[str, list[T_FEED_ENTRY] | None]:
+        """Update from external source and return filtered entries.
+
+        If nearest is defined, only that many entries closest to home are
+        returned, ordered by distance.
+        """
         return await self._update_internal(
-            lambda entries: self._filter_entries(entries)
+            lambda entries: self._filter_entries(entries),
+            nearest,
+            self._filter_key(None),
         )
 
     async def update_override(
-        self, filter_overrides: T_FILTER_DEFINITION = None
+        self,
+        filter_overrides: T_FILTER_DEFINITION = None,
+        *,
+        nearest: int | None = None,
     ) -> tuple[str, list[T_FEED_ENTRY] | None]:
         """Update from external source and return filtered entries with ability to override filter conditions."""
+        self.validate_filter_definition(filter_overrides)
         return await self._update_internal(
             lambda entries: self._filter_entries_override(
                 entries, filter_overrides=filter_overrides
-            )
+            ),
+            nearest,
+            self._filter_key(filter_overrides),
+        )
+
+    def _filter_key(self, filter_overrides: T_FILTER_DEFINITION) -> Hashable:
+        """Identify the effective filter criteria, including overrides that subclasses filter on."""
+        return (
+            tuple(stage.key for stage in self._filter_stages(filter_overrides)),
+            filter_overrides.key if filter_overrides is not None else None,
         )
 
     async def _fetch(
         self, method: str = "GET", headers=None, params=None
     ) -> tuple[str, FeatureCollection | None]:
         """Fetch GeoJSON data from external source."""
+        if self._pagination:
+            return await self._pagination.fetch(
+                lambda url, page_params: self._fetch_document(
+                    method, headers, page_params, url
+                ),
+                params,
+            )
+        return await self._fetch_document(method, headers, params)
+
+    async def _fetch_document(
+        self, method: str, headers, params, url: str | None = None
+    ) -> tuple[str, FeatureCollection | None]:
+        """Fetch a single GeoJSON document, from url instead of the mirrors if provided."""
+        attempt = 0
+        while True:
+            if url:
+                status, data, retryable = await self._fetch_url(
+                    url, method, headers, params
+                ) or (UPDATE_ERROR, None, False)
+            else:
+                status, data, retryable = await self._fetch_mirrors(
+                    method, headers, params
+                )
+            if not (
+                retryable
+                and self._retry_policy
+                and attempt < self._retry_policy.max_retries
+            ):
+                return status, data
+            delay = self._retry_policy.delay(attempt)
+            attempt += 1
+            _LOGGER.debug(
+                "Retrying request to %s in %.2f seconds (retry %s)",
+                url or self._url,
+                delay,
+                attempt,
+            )
+            await asyncio.sleep(delay)
+
+    async def _fetch_mirrors(
+        self, method: str, headers, params
+    ) -> tuple[str, FeatureCollection | None, bool]:
+        """Fetch from the fastest healthy mirror, failing over to the others.
+
+        Mirrors that are not requested due to the rate limit are skipped, and
+        only if no other mirror responds is the previous data kept.
+        """
+        result = UPDATE_ERROR, None, False
+        mirrors = Mirror.rank(self._mirrors)
+        while mirrors:
+            mirror = mirrors.pop(0)
+            hedge_delay = (
+                mirror.latency_percentile(self._hedge_percentile)
+                if self._hedge_percentile and mirrors
+                else None
+            )
+            if hedge_delay is not None:
+                mirror_result = await self._fetch_hedged(
+                    mirror,
+                    mirrors.pop(0),
+                    hedge_delay,
+                    method=method,
+                    headers=headers,
+                    params=params,
+                )
+            else:
+                mirror_result = await self._fetch_url(
+                    mirror.url, method, headers, params, mirror=mirror
+                )
+            if GeoJsonFeed._succeeded(mirror_result):
+                return mirror_result
+            if mirror_result and result is not _RATE_LIMITED:
+                result = mirror_result
+        return result
+
+    async def _fetch_hedged(
+        self,
+        primary: Mirror,
+        secondary: Mirror,
+        delay: float,
+        *,
+        method: str,
+        headers,
+        params,
+    ) -> tuple[str, FeatureCollection | None, bool] | None:
+        """Fetch from primary mirror, and also from secondary if primary is slow."""
+        primary_task = asyncio.create_task(
+            self._fetch_url(primary.url, method, headers, params, mirror=primary)
+        )
+        done, pending = await asyncio.wait({primary_task}, timeout=delay)
+        result = primary_task.result() if done else None
+        if GeoJsonFeed._succeeded(result):
+            return result
+        if pending:
+            _LOGGER.debug("Hedging request to %s with %s", primary.url, secondary.url)
+        pending.add(
+            asyncio.create_task(
+                self._fetch_url(
+                    secondary.url, method, headers, params, mirror=secondary
+                )
+            )
+        )
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task_result = task.result()
+                    if GeoJsonFeed._succeeded(task_result):
+                        return task_result
+                    if task_result and result is not _RATE_LIMITED:
+                        result = task_result
+        finally:
+            # The slower request is not needed anymore.
+            for task in pending:
+                task.cancel()
+        return result
+
+    @staticmethod
+    def _succeeded(result: tuple[str, FeatureCollection | None, bool] | None) -> bool:
+        """Check if the request was sent and did not fail."""
+        return (
+            bool(result) and result is not _RATE_LIMITED and result[0] != UPDATE_ERROR
+        )
+
+    async def _fetch_url(
+        self, url: str, method: str, headers, params, mirror: Mirror | None = None
+    ) -> tuple[str, FeatureCollection | None, bool] | None:
+        """Fetch GeoJSON data from url and report if the failure is transient.
+
+        Return None if no request was sent because the host is unavailable,
+        and `_RATE_LIMITED` if it was not sent due to the rate limit.
+        """
+        host = urlsplit(url).hostname
+        if self._circuit_breaker and not self._circuit_breaker.allow_request(host):
+            _LOGGER.warning("Not requesting data from %s, %s is unavailable", url, host)
+            return None
+        try:
+            if self._rate_limiter and not await self._rate_limiter.acquire(host):
+                if self._circuit_breaker:
+                    self._circuit_breaker.release(host)
+                # Keep the previous data until the host accepts requests again.
+                _LOGGER.info("Not requesting data from %s due to rate limit", url)
+                return _RATE_LIMITED
+            status, data, retryable = await self._request_mirror(
+                url, method, headers, params, mirror
+            )
+        except asyncio.CancelledError:
+            if self._circuit_breaker:
+                self._circuit_breaker.release(host)
+            raise
+        if self._circuit_breaker:
+            if retryable:
+                self._circuit_breaker.record_failure(host)
+            else:
+                self._circuit_breaker.record_success(host)
+        return status, data, retryable
+
+    async def _request_mirror(
+        self, url: str, method: str, headers, params, mirror: Mirror | None
+    ) -> tuple[str, FeatureCollection | None, bool]:
+        """Send the request and keep track of the mirror's latency and errors."""
+        if mirror is None:
+            return await self._request(url, method, headers, params)
+        start = time.monotonic()
+        try:
+            result = await self._request(url, method, headers, params)
+        except asyncio.CancelledError:
+            # Lost against a hedged request.
+            mirror.record_abandoned(time.monotonic() - start)
+            raise
+        if result[0] == UPDATE_ERROR:
+            mirror.record_failure()
+        else:
+            mirror.record_success(time.monotonic() - start)
+        return result
+
+    async def _request(
+        self, url: str, method: str, headers, params
+    ) -> tuple[str, FeatureCollection | None, bool]:
+        """Send a single request to url."""
+        # Loaded on first use, to keep importing this module fast.
+        import aiohttp  # noqa: PLC0415
+        import geojson  # noqa: PLC0415
+
         try:
             timeout = aiohttp.ClientTimeout(total=self._client_session_timeout())
+            start = time.monotonic()
             async with self._websession.request(
-                method, self._url, headers=headers, params=params, timeout=timeout
+                method,
+                url,
+                params=params,
+                timeout=timeout,
+                **self._request_options(headers),
             ) as response:
                 try:
+                    body = None
+                    if self._traffic_archive is not None:
+                        body = await self._read_body(response)
+                        self._traffic_archive.record(
+                            str(response.url),
+                            response.status,
+                            dict(response.headers),
+                            body,
+                            time.monotonic() - start,
+                        )
                     response.raise_for_status()
-                    text = await response.text()
+                    if body is None:
+                        body = await self._read_body(response)
+                    fingerprint = None
+                    if self._skip_unchanged and not self._pagination:
+                        fingerprint = zlib.crc32(body), len(body)
+                        if fingerprint == self._content_fingerprint:
+                            _LOGGER.debug("Document from %s is unchanged", url)
+                            return UPDATE_OK_NO_DATA, None, False
+                    text = (
+                        str(body, response.charset or "utf-8")
+                        if self._content_negotiation
+                        else await response.text()
+                    )
                     feature_collection = geojson.loads(text)
-                    return UPDATE_OK, feature_collection
-                except client_exceptions.ClientError as client_error:
+                    if fingerprint:
+                        self._content_fingerprint = fingerprint
+                    return UPDATE_OK, feature_collection, False
+                except aiohttp.ClientError as client_error:
                     _LOGGER.warning(
-                        "Fetching data from %s failed with %s", self._url, client_error
+                        "Fetching data from %s failed with %s", url, client_error
                     )
-                    return UPDATE_ERROR, None
+                    self._defer_host(url, response)
+                    return UPDATE_ERROR, None, GeoJsonFeed._is_transient(response)
                 except ValueError as value_ex:
-                    _LOGGER.warning(
-                        "Unable to parse JSON from %s: %s", self._url, value_ex
-                    )
-                    return UPDATE_ERROR, None
-        except client_exceptions.ClientError as client_error:
+                    _LOGGER.warning("Unable to parse JSON from %s: %s", url, value_ex)
+                    return UPDATE_ERROR, None, False
+        except aiohttp.ClientError as client_error:
             _LOGGER.warning(
                 "Requesting data from %s failed with " "client error: %s",
-                self._url,
+                url,
                 client_error,
             )
-            return UPDATE_ERROR, None
+            return UPDATE_ERROR, None, True
         except asyncio.TimeoutError:
             _LOGGER.warning(
-                "Requesting data from %s failed with " "timeout error", self._url
+                "Requesting data from %s failed with " "timeout error", url
             )
-            return UPDATE_ERROR, None
+            return UPDATE_ERROR, None, True
+
+    def _request_options(self, headers) -> dict:
+        """Add the negotiated content encodings to the request options."""
+        if not self._content_negotiation:
+            return {"headers": headers}
+        return {
+            "headers": {
+                **(headers or {}),
+                "Accept-Encoding": self._content_negotiation.accept_encoding,
+            },
+            # Responses are decompressed while reading them.
+            "auto_decompress": False,
+        }
+
+    async def _read_body(self, response: ClientResponse) -> bytes:
+        """Read the body, decompressing it while it arrives if negotiated."""
+        if not self._content_negotiation:
+            return await response.read()
+        decoder = self._content_negotiation.decoder(
+            response.headers.get("Content-Encoding")
+        )
+        chunks = []
+        compressed_bytes = 0
+        async for chunk in response.content.iter_any():
+            compressed_bytes += len(chunk)
+            chunks.append(decoder.decompress(chunk))
+        chunks.append(decoder.flush())
+        body = b"".join(chunks)
+        if self._transfer_statistics is not None:
+            self._transfer_statistics[TRANSFER_COMPRESSED_BYTES] += compressed_bytes
+            self._transfer_statistics[TRANSFER_UNCOMPRESSED_BYTES] += len(body)
+        return body
+
+    def _defer_host(self, url: str, response: ClientResponse):
+        """Honour the server's request to retry after a delay."""
+        if self._rate_limiter and response.status in (
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+        ):
+            delay = RateLimiter.parse_retry_after(response.headers.get("Retry-After"))
+            if delay is not None:
+                self._rate_limiter.defer(urlsplit(url).hostname, delay)
+
+    @staticmethod
+    def _is_transient(response: ClientResponse) -> bool:
+        """Check if the error response indicates a temporary server problem."""
+        return (
+            response.status == HTTPStatus.TOO_MANY_REQUESTS
+            or response.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+
+    @staticmethod
+    def select_nearest(entries: list[T_FEED_ENTRY], nearest: int) -> list[T_FEED_ENTRY]:
+        """Select the entries closest to home, ordered by distance.
+
+        Entries are visited in order of their lower bound distance, and
+        exact distances are only calculated until no remaining entry can be
+        closer than the furthest one selected so far.
+        """
+        if nearest <= 0:
+            return []
+        candidates = [
+            (entry.minimum_distance_to_home, index)
+            for index, entry in enumerate(entries)
+        ]
+        heapq.heapify(candidates)
+        # Max heap of the closest entries by exact distance.
+        selected: list[tuple[float, int]] = []
+        while candidates:
+            minimum_distance, index = heapq.heappop(candidates)
+            if len(selected) == nearest and minimum_distance > -selected[0][0]:
+                break
+            distance = entries[index].distance_to_home
+            if len(selected) < nearest:
+                heapq.heappush(selected, (-distance, index))
+            elif distance < -selected[0][0]:
+                heapq.heapreplace(selected, (-distance, index))
+        _LOGGER.debug(
+            "Calculated %s of %s distances to select %s nearest entries",
+            len(entries) - len(candidates),
+            len(entries),
+            nearest,
+        )
+        return [entries[index] for _, index in sorted(selected, reverse=True)]
 
     def _filter_entries(self, entries: list[T_FEED_ENTRY]) -> list[T_FEED_ENTRY]:
         """Filter the provided entries (for backwards-compatibility)."""
@@ -151,31 +712,69 @@ class GeoJsonFeed(Generic[T_FEED_ENTRY], ABC):
         self, entries: list[T_FEED_ENTRY], filter_overrides: T_FILTER_DEFINITION = None
     ) -> list[T_FEED_ENTRY]:
         """Filter the provided entries with ability to override filter definitions."""
-        filtered_entries = entries
-        _LOGGER.debug("Entries before filtering %s", filtered_entries)
+        _LOGGER.debug("Entries before filtering %s", entries)
+        stages = self._filter_stages(filter_overrides)
+        # Keep the pipeline while the criteria are unchanged, so that its
+        # stage order and statistics carry over to the next update.
+        if not (self._filter_pipeline and self._filter_pipeline.matches(stages)):
+            self._filter_pipeline = FilterPipeline(stages)
+        filtered_entries = self._filter_pipeline.filter(entries)
+        _LOGGER.debug("Entries after filtering %s", filtered_entries)
+        return filtered_entries
+
+    def _filter_stages(
+        self, filter_overrides: T_FILTER_DEFINITION = None
+    ) -> list[FilterStage]:
+        """Define the filter stages. Override to add further criteria."""
         # Always remove entries without geometry
-        filtered_entries = list(
-            filter(
-                lambda entry: entry.geometries is not None
-                and len(entry.geometries) >= 1,
-                filtered_entries,
-            )
-        )
+        stages: list[FilterStage] = [GeometryFilterStage()]
         # Filter by distance.
-        filter_radius = (
-            filter_overrides.radius
-            if filter_overrides and filter_overrides.radius
-            else self._filter_radius
-        )
+        filter_radius = self._filter_criterion("radius", filter_overrides)
         if filter_radius:
-            filtered_entries = list(
-                filter(
-                    lambda entry: entry.distance_to_home <= filter_radius,
-                    filtered_entries,
+            stages.append(
+                RadiusFilterStage(
+                    self._home_coordinates, filter_radius, self._simplifier
                 )
             )
-        _LOGGER.debug("Entries after filtering %s", filtered_entries)
-        return filtered_entries
+        if bbox := self._filter_criterion("bbox", filter_overrides):
+            stages.append(BoundingBoxFilterStage(bbox))
+        if geofence := self._filter_criterion("geofence", filter_overrides):
+            stages.append(GeofenceFilterStage(geofence))
+        if properties := self._filter_criterion("properties", filter_overrides):
+            stages.append(PropertyFilterStage(properties))
+        if time_window := self._filter_criterion("time_window", filter_overrides):
+            stages.append(TimeWindowFilterStage(*time_window, self._entry_timestamp))
+        return stages
+
+    def _filter_criterion(self, name: str, filter_overrides: T_FILTER_DEFINITION):
+        """Look up a criterion in the overrides, falling back to the defaults."""
+        if filter_overrides and (value := getattr(filter_overrides, name, None)):
+            return value
+        if name == "radius":
+            return self._filter_radius or (
+                self._filter_definition and self._filter_definition.radius
+            )
+        return getattr(self._filter_definition, name, None)
+
+    def validate_filter_definition(
+        self, filter_definition: GeoJsonFeedFilterDefinition | None
+    ):
+        """Check that this feed supports the criteria of the filter definition.
+
+        Raise ValueError for a time window if the feed does not override
+        `_entry_timestamp`.
+        """
+        if (
+            getattr(filter_definition, "time_window", None)
+            and self._entry_timestamp.__func__ is GeoJsonFeed._entry_timestamp
+        ):
+            raise ValueError(
+                f"{type(self).__name__} must override _entry_timestamp to filter by time window"
+            )
+
+    def _entry_timestamp(self, entry: T_FEED_ENTRY) -> datetime | None:
+        """Determine the entry's timestamp for time window filters. Override to support time windows."""
+        return None
 
     @abstractmethod
     def _extract_from_feed(self, feed: FeatureCollection) -> dict | None:
@@ -193,3 +792,15 @@ class GeoJsonFeed(Generic[T_FEED_ENTRY], ABC):
     def last_timestamp(self) -> datetime | None:
         """Return the last timestamp extracted from this feed."""
         return self._last_timestamp
+
+    @property
+    def filter_statistics(self) -> dict[str, int] | None:
+        """Return the number of entries rejected per filter stage."""
+        if self._filter_pipeline:
+            return self._filter_pipeline.statistics
+        return None
+
+    @property
+    def transfer_statistics(self) -> dict[str, int] | None:
+        """Return the compressed and uncompressed bytes of the last update."""
+        return self._transfer_statistics
@@ -3,51 +3,207 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
 import logging
+from typing import TYPE_CHECKING, Any
 
-import geojson
-from geojson import Feature
-
+from .feed_entry_field import Extractor, FeedEntryField
 from .geojson_distance_helper import GeoJsonDistanceHelper
 from .geometries import Geometry, Point, Polygon
 
+if TYPE_CHECKING:
+    import geojson
+    from geojson import Feature
+
+    from .distance_cache import DistanceCache
+    from .geometry_interner import GeometryInterner
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class _DetachedFeature:
+    """Fields of a feature kept by a detached entry.
+
+    Polygons are kept as flat arrays of latitudes and longitudes, and only
+    wrapped again when accessed, unless they are shared anyway.
+    """
+
+    __slots__ = ("geometries", "members", "properties")
+
+    def __init__(
+        self,
+        geometries: list[Geometry] | None,
+        members: dict,
+        properties: dict,
+        *,
+        shared: bool = False,
+    ):
+        """Initialise detached feature."""
+        self.geometries = (
+            [
+                geometry if shared else _DetachedFeature._compact(geometry)
+                for geometry in geometries
+            ]
+            if geometries is not None
+            else None
+        )
+        self.members = members
+        self.properties = properties
+
+    @staticmethod
+    def _compact(geometry: Geometry) -> Geometry | array:
+        """Compact the polygon's points into an array."""
+        if isinstance(geometry, Polygon):
+            coordinates = array("d")
+            for point in geometry.points:
+                coordinates.append(point.latitude)
+                coordinates.append(point.longitude)
+            return coordinates
+        return geometry
+
+    def wrap_geometries(self) -> list[Geometry] | None:
+        """Wrap the kept geometries."""
+        if self.geometries is None:
+            return None
+        return [
+            Polygon(
+                [
+                    Point(geometry[index], geometry[index + 1])
+                    for index in range(0, len(geometry), 2)
+                ]
+            )
+            if isinstance(geometry, array)
+            else geometry
+            for geometry in self.geometries
+        ]
+
+
 class FeedEntry(ABC):
-    """Feed entry base class."""
+    """Feed entry base class.
+
+    Subclasses may declare fields with `FeedEntryField`, which are compiled
+    once per class and extracted once per entry.
+    """
+
+    # Compiled extractors of the declared fields by name.
+    _field_extractors: tuple[tuple[str, Extractor], ...] = ()
+    # Feature properties kept by detached entries, or None to keep all.
+    _detached_properties: tuple[str, ...] | None = None
+    # Feature members (besides geometry and properties) kept by detached entries.
+    _detached_members: tuple[str, ...] = ("id",)
 
     def __init__(self, home_coordinates: tuple[float, float], feature: Feature):
         """Initialise this feed entry."""
         self._home_coordinates = home_coordinates
         self._feature = feature
+        self._detached: _DetachedFeature | None = None
+        self._field_values: dict[str, Any] | None = None
+        self._distance_cache: DistanceCache | None = None
+        self._geometry_interner: GeometryInterner | None = None
+        # Interned geometries, referenced so that the interner keeps them.
+        self._interned_geometries: list[Geometry] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the declared fields of the subclass."""
+        super().__init_subclass__(**kwargs)
+        fields = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, FeedEntryField):
+                    fields[name] = value
+                elif name in fields:
+                    # Field replaced by a regular attribute.
+                    del fields[name]
+        cls._field_extractors = tuple(
+            (name, field.compile()) for name, field in fields.items()
+        )
+
+    def field_values(self) -> dict[str, Any]:
+        """Return the values of the declared fields, extracting them once."""
+        if self._field_values is None:
+            feature = self._feature
+            self._field_values = (
+                {name: extract(feature) for name, extract in self._field_extractors}
+                if feature
+                else {}
+            )
+        return self._field_values
 
     def __repr__(self):
         """Return string representation of this entry."""
         return f"<{self.__class__.__name__}(id={self.external_id})>"
 
+    def detach(self):
+        """Keep only the declared fields of the feature, so that it can be freed.
+
+        Geometries are wrapped once, and only the feature members and
+        properties declared by the entry class are kept.
+        """
+        if not self._feature:
+            return
+        # Declared fields are kept as well.
+        self.field_values()
+        feature = self._feature
+        properties = feature.properties or {}
+        self._detached = _DetachedFeature(
+            FeedEntry._wrap(feature.geometry, self._geometry_interner),
+            {name: feature[name] for name in self._detached_members if name in feature},
+            dict(properties)
+            if self._detached_properties is None
+            else {
+                name: properties[name]
+                for name in self._detached_properties
+                if name in properties
+            },
+            shared=self._geometry_interner is not None,
+        )
+        self._feature = None
+        self._interned_geometries = None
+
+    @property
+    def detached(self) -> bool:
+        """Return if this entry has been detached from its feature."""
+        return self._detached is not None
+
     @property
     def geometries(self) -> list[Geometry] | None:
         """Return all geometry details of this entry."""
         if self._feature:
-            return FeedEntry._wrap(self._feature.geometry)
+            if self._geometry_interner is None:
+                return FeedEntry._wrap(self._feature.geometry)
+            if self._interned_geometries is None:
+                self._interned_geometries = FeedEntry._wrap(
+                    self._feature.geometry, self._geometry_interner
+                )
+            return self._interned_geometries
+        if self._detached:
+            return self._detached.wrap_geometries()
         return None
 
     @staticmethod
-    def _wrap(geometry: geojson.geometry.Geometry) -> list[Geometry] | None:
-        """Wrap data of the provided GeoJSON geometry."""
+    def _wrap(
+        geometry: geojson.geometry.Geometry,
+        interner: GeometryInterner | None = None,
+    ) -> list[Geometry] | None:
+        """Wrap data of the provided GeoJSON geometry, shared if interned."""
+        import geojson  # noqa: PLC0415
+
         if isinstance(geometry, geojson.geometry.Point):
+            if interner is not None:
+                return [interner.point(geometry.coordinates)]
             return [Point(geometry.coordinates[1], geometry.coordinates[0])]
         if isinstance(geometry, geojson.geometry.GeometryCollection):
             result = []
             for entry in geometry.geometries:
-                wrapped_geometry = FeedEntry._wrap(entry)
+                wrapped_geometry = FeedEntry._wrap(entry, interner)
                 if wrapped_geometry:
                     result += wrapped_geometry
             return result
         if isinstance(geometry, geojson.geometry.Polygon):
             # Currently only support polygons without a hole
             # (https://tools.ietf.org/html/rfc7946#page-23).
+            if interner is not None:
+                return [interner.polygon(geometry.coordinates[0])]
             return [
                 Polygon(
                     [
@@ -62,16 +218,63 @@ class FeedEntry(ABC):
     @property
     def coordinates(self) -> tuple[float, float] | None:
         """Return the best coordinates (latitude, longitude) of this entry."""
+        return FeedEntry._best_coordinates(self.geometries)
+
+    @staticmethod
+    def _best_coordinates(
+        geometries: list[Geometry] | None,
+    ) -> tuple[float, float] | None:
+        """Determine the best coordinates of the geometries."""
         # This looks for the first point in the list of geometries. If there
         # is no point then return the first entry.
-        if self.geometries and len(self.geometries) >= 1:
-            for entry in self.geometries:
+        if geometries and len(geometries) >= 1:
+            for entry in geometries:
                 if isinstance(entry, Point):
                     return GeoJsonDistanceHelper.extract_coordinates(entry)
             # No point found.
-            return GeoJsonDistanceHelper.extract_coordinates(self.geometries[0])
+            return GeoJsonDistanceHelper.extract_coordinates(geometries[0])
         return None
 
+    @staticmethod
+    def _bounding_box(
+        geometries: list[Geometry] | None,
+    ) -> tuple[float, float, float, float] | None:
+        """Determine the bounding box around all geometries."""
+        bboxes = [
+            bbox for geometry in geometries or [] if (bbox := geometry.bounding_box)
+        ]
+        if not bboxes:
+            return None
+        min_latitude = min(bbox[0] for bbox in bboxes)
+        max_latitude = max(bbox[2] for bbox in bboxes)
+        if len(bboxes) == 1:
+            return min_latitude, bboxes[0][1], max_latitude, bboxes[0][3]
+        if any(bbox[1] > bbox[3] for bbox in bboxes):
+            # Combining boxes across the antimeridian covers all longitudes.
+            return min_latitude, -180.0, max_latitude, 180.0
+        return (
+            min_latitude,
+            min(bbox[1] for bbox in bboxes),
+            max_latitude,
+            max(bbox[3] for bbox in bboxes),
+        )
+
+    def geometry_summary(
+        self,
+    ) -> tuple[
+        tuple[float, float] | None, float, tuple[float, float, float, float] | None
+    ]:
+        """Return coordinates, distance to home and bounding box of this entry.
+
+        This wraps the geometries only once, instead of once per property.
+        """
+        geometries = self.geometries
+        return (
+            FeedEntry._best_coordinates(geometries),
+            self._distance_to_geometries(geometries),
+            FeedEntry._bounding_box(geometries),
+        )
+
     @property
     @abstractmethod
     def title(self) -> str | None:
@@ -92,23 +295,76 @@ class FeedEntry(ABC):
     @property
     def distance_to_home(self) -> float:
         """Return the distance in km of this entry to the home coordinates."""
+        return self._distance_to_geometries(self.geometries)
+
+    def _distance_to_geometries(self, geometries: list[Geometry] | None) -> float:
+        """Calculate the distance in km of the geometries to the home coordinates."""
         # This goes through all geometries and reports back the closest
         # distance to any of them.
         distance = float("inf")
+        distance_to_geometry = (
+            self._distance_cache.distance_to_geometry
+            if self._distance_cache is not None
+            else GeoJsonDistanceHelper.distance_to_geometry
+        )
+        if geometries and len(geometries) >= 1:
+            for geometry in geometries:
+                distance = min(
+                    distance,
+                    distance_to_geometry(self._home_coordinates, geometry),
+                )
+        return distance
+
+    @property
+    def minimum_distance_to_home(self) -> float:
+        """Return a lower bound of the distance in km to the home coordinates."""
+        distance = float("inf")
         if self.geometries and len(self.geometries) >= 1:
             for geometry in self.geometries:
                 distance = min(
                     distance,
-                    GeoJsonDistanceHelper.distance_to_geometry(
+                    GeoJsonDistanceHelper.minimum_distance_to_geometry(
                         self._home_coordinates, geometry
                     ),
                 )
         return distance
 
+    @property
+    def distance_cache(self) -> DistanceCache | None:
+        """Return the cache used to calculate the distance to home."""
+        return self._distance_cache
+
+    @distance_cache.setter
+    def distance_cache(self, value: DistanceCache | None):
+        """Set the cache used to calculate the distance to home."""
+        self._distance_cache = value
+
+    @property
+    def geometry_interner(self) -> GeometryInterner | None:
+        """Return the interner sharing this entry's geometries."""
+        return self._geometry_interner
+
+    @geometry_interner.setter
+    def geometry_interner(self, value: GeometryInterner | None):
+        """Set the interner sharing this entry's geometries."""
+        self._geometry_interner = value
+        self._interned_geometries = None
+
+    @property
+    def properties(self) -> dict | None:
+        """Return the properties of this entry's feature."""
+        if self._feature:
+            return self._feature.properties
+        if self._detached:
+            return self._detached.properties
+        return None
+
     def _search_in_feature(self, name):
         """Find an attribute in the feature object."""
         if self._feature and name in self._feature:
             return self._feature[name]
+        if self._detached:
+            return self._detached.members.get(name)
         return None
 
     def _search_in_properties(self, name):
@@ -119,4 +375,6 @@ class FeedEntry(ABC):
             and name in self._feature.properties
         ):
             return self._feature.properties[name]
+        if self._detached:
+            return self._detached.properties.get(name)
         return None
@@ -0,0 +1,119 @@
+"""Feed entry field."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .feed_entry import FeedEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+Extractor = Callable[[dict], Any]
+
+
+class FeedEntryField:
+    """Declarative field of a feed entry, extracted once per entry.
+
+    Each path is either the name of a property, or a tuple of keys starting
+    at the feature (for example `("id",)` or `("properties", "updated")`).
+    The first path with a value is used. The value is then converted with
+    the converter if defined, or else coerced to the value type if defined.
+    Values that cannot be converted result in the default.
+    """
+
+    def __init__(
+        self,
+        *paths: str | tuple[str, ...],
+        value_type: type | None = None,
+        converter: Callable[[Any], Any] | None = None,
+        default: Any = None,
+    ):
+        """Initialise feed entry field."""
+        if not paths:
+            raise ValueError("At least one path is required")
+        self._paths = tuple(
+            ("properties", path) if isinstance(path, str) else tuple(path)
+            for path in paths
+        )
+        self._value_type = value_type
+        self._converter = converter
+        self._default = default
+        self._name: str | None = None
+
+    def __repr__(self):
+        """Return string representation of this field."""
+        return f"<{self.__class__.__name__}(name={self._name}, paths={self._paths})>"
+
+    def __set_name__(self, owner: type, name: str):
+        """Remember the name of this field."""
+        self._name = name
+
+    def __get__(self, instance: FeedEntry | None, owner: type) -> Any:
+        """Return the value of this field, extracted once per entry."""
+        if instance is None:
+            return self
+        return instance.field_values().get(self._name, self._default)
+
+    @property
+    def name(self) -> str | None:
+        """Return the name of this field."""
+        return self._name
+
+    def compile(self) -> Extractor:
+        """Compile this field into a function extracting it from a feature."""
+        lookups = [FeedEntryField._compile_path(path) for path in self._paths]
+        convert = self._compile_conversion()
+        default = self._default
+        name = self._name
+
+        def extract(feature: dict) -> Any:
+            for lookup in lookups:
+                value = lookup(feature)
+                if value is not None:
+                    try:
+                        return convert(value)
+                    except (TypeError, ValueError) as error:
+                        _LOGGER.debug("Unable to convert %s %s: %s", name, value, error)
+                        return default
+            return default
+
+        return extract
+
+    def _compile_conversion(self) -> Callable[[Any], Any]:
+        """Compile the conversion of extracted values."""
+        if self._converter:
+            return self._converter
+        value_type = self._value_type
+        if value_type is None:
+            return lambda value: value
+        return lambda value: (
+            value if isinstance(value, value_type) else value_type(value)
+        )
+
+    @staticmethod
+    def _compile_path(path: tuple[str, ...]) -> Extractor:
+        """Compile a path into a lookup, specialised for the common lengths."""
+        if len(path) == 1:
+            (key,) = path
+            return lambda feature: feature.get(key)
+        if len(path) == 2:
+            first, second = path
+
+            def lookup_nested(feature: dict) -> Any:
+                value = feature.get(first)
+                return value.get(second) if isinstance(value, dict) else None
+
+            return lookup_nested
+
+        def lookup(feature: dict) -> Any:
+            value = feature
+            for key in path:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(key)
+            return value
+
+        return lookup
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime
 import logging
 
-from .consts import T_FEED_ENTRY, T_FILTER_DEFINITION, UPDATE_OK, UPDATE_OK_NO_DATA
+from .change_stream import (
+    ChangeEvent,
+    ChangeSubscription,
+    EntryCreatedEvent,
+    EntryRemovedEvent,
+    EntryUpdatedEvent,
+    StatusEvent,
+)
+from .consts import (
+    DEFAULT_CHANGE_STREAM_SIZE,
+    OVERFLOW_BLOCK,
+    T_FEED_ENTRY,
+    T_FILTER_DEFINITION,
+    UPDATE_OK,
+    UPDATE_OK_NO_DATA,
+)
 from .feed import GeoJsonFeed
 from .feed_entry import FeedEntry
+from .polling_interval import AdaptivePollingInterval
+from .shared_state import StatePublisher
+from .snapshot import FeedSnapshot
 from .status_update import StatusUpdate
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,10 +42,32 @@ class FeedManagerBase:
         update_async_callback: Callable[[str], Awaitable[None]],
         remove_async_callback: Callable[[str], Awaitable[None]],
         status_async_callback: Callable[[StatusUpdate], Awaitable[None]] | None = None,
+        *,
+        generate_bulk_async_callback: Callable[[dict[str, FeedEntry]], Awaitable[None]]
+        | None = None,
+        update_bulk_async_callback: Callable[[dict[str, FeedEntry]], Awaitable[None]]
+        | None = None,
+        remove_bulk_async_callback: Callable[[dict[str, FeedEntry]], Awaitable[None]]
+        | None = None,
+        polling_interval: AdaptivePollingInterval | None = None,
+        state_publisher: StatePublisher | None = None,
     ):
-        """Initialise feed manager."""
+        """Initialise feed manager.
+
+        The bulk callbacks are optional. If provided, they are called once per
+        update cycle with all affected external ids mapped to their feed
+        entries instead of calling the corresponding per-id callback for each
+        external id.
+
+        If an adaptive polling interval is provided, it is adjusted after
+        each update and can be used to schedule the next update.
+
+        If a state publisher is provided, the entries are published for
+        readers in other processes whenever they change.
+        """
         self._feed = feed
         self.feed_entries = {}
+        self._previous_feed_entries = {}
         self._managed_external_ids = set()
         self._last_update = None
         self._last_update_successful = None
@@ -35,6 +75,12 @@ class FeedManagerBase:
         self._update_async_callback = update_async_callback
         self._remove_async_callback = remove_async_callback
         self._status_async_callback = status_async_callback
+        self._generate_bulk_async_callback = generate_bulk_async_callback
+        self._update_bulk_async_callback = update_bulk_async_callback
+        self._remove_bulk_async_callback = remove_bulk_async_callback
+        self._subscriptions: list[ChangeSubscription] = []
+        self._polling_interval = polling_interval
+        self._state_publisher = state_publisher
 
     def __repr__(self):
         """Return string representation of this feed."""
@@ -49,6 +95,12 @@ class FeedManagerBase:
         count_created = 0
         count_updated = 0
         count_removed = 0
+        # Keep previous entries so that removed entries can be passed on.
+        self._previous_feed_entries = (
+            dict(self.feed_entries)
+            if self._remove_bulk_async_callback or self._subscriptions
+            else {}
+        )
         await self._store_feed_entries(status, feed_entries)
         if status == UPDATE_OK:
             _LOGGER.debug("Data retrieved %s", feed_entries)
@@ -69,21 +121,53 @@ class FeedManagerBase:
             )
             # Remove all entities.
             count_removed = await self._update_feed_remove_entries(set())
+        if self._state_publisher and status != UPDATE_OK_NO_DATA:
+            self._state_publisher.publish(self.snapshot())
         # Send status update to subscriber.
         await self._status_update(status, count_created, count_updated, count_removed)
 
-    async def update(self):
-        """Update the feed and then update connected entities."""
-        status, feed_entries = await self._feed.update()
+    async def update(self, *, nearest: int | None = None):
+        """Update the feed and then update connected entities.
+
+        If nearest is defined, only that many entries closest to home are
+        managed.
+        """
+        status, feed_entries = await self._feed.update(nearest=nearest)
         await self._update_internal(status, feed_entries)
 
-    async def update_override(self, filter_overrides: T_FILTER_DEFINITION = None):
+    async def update_override(
+        self,
+        filter_overrides: T_FILTER_DEFINITION = None,
+        *,
+        nearest: int | None = None,
+    ):
         """Update the feed and then update connected entities."""
         status, feed_entries = await self._feed.update_override(
-            filter_overrides=filter_overrides
+            filter_overrides=filter_overrides, nearest=nearest
         )
         await self._update_internal(status, feed_entries)
 
+    def changes(
+        self, max_size: int = DEFAULT_CHANGE_STREAM_SIZE, overflow: str = OVERFLOW_BLOCK
+    ) -> ChangeSubscription:
+        """Subscribe to changes, to be consumed with `async for`.
+
+        Each subscription has its own bounded queue. The overflow policy
+        defines what happens if the consumer falls behind: `block` holds up
+        the update until there is space, `coalesce` merges events for the
+        same external id, and `drop_oldest` discards the oldest events.
+        """
+        subscription = ChangeSubscription(
+            max_size=max_size, overflow=overflow, on_close=self._subscriptions.remove
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def _publish(self, event: ChangeEvent):
+        """Publish change event to all subscribers."""
+        for subscription in list(self._subscriptions):
+            await subscription.publish(event)
+
     async def _store_feed_entries(
         self, status: str, feed_entries: list[FeedEntry] | None
     ):
@@ -117,47 +201,116 @@ class FeedManagerBase:
 
     async def _generate_new_entities(self, external_ids: set[str]):
         """Generate new entities for events using callback."""
-        for external_id in external_ids:
-            await self._generate_async_callback(external_id)
-            _LOGGER.debug("New entity added %s", external_id)
-            self._managed_external_ids.add(external_id)
+        if self._generate_bulk_async_callback:
+            if external_ids:
+                await self._generate_bulk_async_callback(
+                    {
+                        external_id: self.feed_entries.get(external_id)
+                        for external_id in external_ids
+                    }
+                )
+                _LOGGER.debug("New entities added %s", external_ids)
+                self._managed_external_ids.update(external_ids)
+        else:
+            for external_id in external_ids:
+                await self._generate_async_callback(external_id)
+                _LOGGER.debug("New entity added %s", external_id)
+                self._managed_external_ids.add(external_id)
+        if self._subscriptions:
+            for external_id in external_ids:
+                await self._publish(
+                    EntryCreatedEvent(external_id, self.feed_entries.get(external_id))
+                )
 
     async def _update_entities(self, external_ids: set[str]):
         """Update entities using callback."""
-        for external_id in external_ids:
-            _LOGGER.debug("Existing entity found %s", external_id)
-            await self._update_async_callback(external_id)
+        if self._update_bulk_async_callback:
+            if external_ids:
+                _LOGGER.debug("Existing entities found %s", external_ids)
+                await self._update_bulk_async_callback(
+                    {
+                        external_id: self.feed_entries.get(external_id)
+                        for external_id in external_ids
+                    }
+                )
+        else:
+            for external_id in external_ids:
+                _LOGGER.debug("Existing entity found %s", external_id)
+                await self._update_async_callback(external_id)
+        if self._subscriptions:
+            for external_id in external_ids:
+                await self._publish(
+                    EntryUpdatedEvent(external_id, self.feed_entries.get(external_id))
+                )
 
     async def _remove_entities(self, external_ids: set[str]):
         """Remove entities using callback."""
-        for external_id in external_ids:
-            _LOGGER.debug("Entity not current anymore %s", external_id)
-            self._managed_external_ids.remove(external_id)
-            await self._remove_async_callback(external_id)
+        if self._remove_bulk_async_callback:
+            if external_ids:
+                _LOGGER.debug("Entities not current anymore %s", external_ids)
+                self._managed_external_ids.difference_update(external_ids)
+                await self._remove_bulk_async_callback(
+                    {
+                        external_id: self._previous_feed_entries.get(external_id)
+                        for external_id in external_ids
+                    }
+                )
+        else:
+            for external_id in external_ids:
+                _LOGGER.debug("Entity not current anymore %s", external_id)
+                self._managed_external_ids.remove(external_id)
+                await self._remove_async_callback(external_id)
+        if self._subscriptions:
+            for external_id in external_ids:
+                await self._publish(
+                    EntryRemovedEvent(
+                        external_id, self._previous_feed_entries.get(external_id)
+                    )
+                )
 
     async def _status_update(
         self, status: str, count_created: int, count_updated: int, count_removed: int
     ):
         """Provide status update."""
-        if self._status_async_callback:
-            await self._status_async_callback(
-                StatusUpdate(
-                    status,
-                    self.last_update,
-                    self.last_update_successful,
-                    self.last_timestamp,
-                    len(self.feed_entries),
-                    count_created,
-                    count_updated,
-                    count_removed,
-                )
+        if self._status_async_callback or self._subscriptions or self._polling_interval:
+            status_update = StatusUpdate(
+                status,
+                self.last_update,
+                self.last_update_successful,
+                self.last_timestamp,
+                len(self.feed_entries),
+                count_created,
+                count_updated,
+                count_removed,
             )
+            if self._status_async_callback:
+                await self._status_async_callback(status_update)
+            if self._polling_interval:
+                self._polling_interval.record(status_update)
+            await self._publish(StatusEvent(status_update))
+
+    def snapshot(
+        self, properties: Iterable[str] = (), *, timestamps: Iterable[str] = ()
+    ) -> FeedSnapshot:
+        """Return the current entries as columns.
+
+        Properties are names of feature properties, and timestamps names of
+        datetime attributes of the entries, to include as columns.
+        """
+        return FeedSnapshot.from_entries(
+            self.feed_entries, properties, timestamps=timestamps
+        )
 
     @property
     def last_timestamp(self) -> datetime | None:
         """Return the last timestamp extracted from this feed."""
         return self._feed.last_timestamp
 
+    @property
+    def polling_interval(self) -> AdaptivePollingInterval | None:
+        """Return the adaptive polling interval of this feed."""
+        return self._polling_interval
+
     @property
     def last_update(self) -> datetime | None:
         """Return the last update of this feed."""
@@ -2,13 +2,55 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .geofence import Geofence
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert a criterion into an equivalent hashable value."""
+    if isinstance(value, dict):
+        return tuple((name, freeze(item)) for name, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
 
 class GeoJsonFeedFilterDefinition:
-    """Filter definition."""
+    """Filter definition.
+
+    The bounding box is defined as (min latitude, min longitude, max latitude,
+    max longitude); a min longitude greater than the max longitude crosses
+    the antimeridian. Properties map a property name to the required value,
+    or to a set of allowed values. The time window is defined as (start,
+    end), either of which may be None. A geofence requires entries to be at
+    least partially inside its polygons.
+    """
 
-    def __init__(self, radius: float | None = None):
+    def __init__(
+        self,
+        radius: float | None = None,
+        *,
+        bbox: tuple[float, float, float, float] | None = None,
+        properties: dict[str, Any] | None = None,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+        geofence: Geofence | None = None,
+    ):
         """Initialise filter definition."""
         self._radius = radius
+        self._bbox = bbox
+        self._properties = properties
+        self._time_window = time_window
+        self._geofence = geofence
 
     @property
     def radius(self) -> float:
@@ -19,3 +61,48 @@ class GeoJsonFeedFilterDefinition:
     def radius(self, value: float):
         """Set radius."""
         self._radius = value
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float] | None:
+        """Return the bounding box."""
+        return self._bbox
+
+    @bbox.setter
+    def bbox(self, value: tuple[float, float, float, float] | None):
+        """Set bounding box."""
+        self._bbox = value
+
+    @property
+    def properties(self) -> dict[str, Any] | None:
+        """Return the required property values."""
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: dict[str, Any] | None):
+        """Set required property values."""
+        self._properties = value
+
+    @property
+    def time_window(self) -> tuple[datetime | None, datetime | None] | None:
+        """Return the time window."""
+        return self._time_window
+
+    @time_window.setter
+    def time_window(self, value: tuple[datetime | None, datetime | None] | None):
+        """Set time window."""
+        self._time_window = value
+
+    @property
+    def geofence(self) -> Geofence | None:
+        """Return the geofence."""
+        return self._geofence
+
+    @geofence.setter
+    def geofence(self, value: Geofence | None):
+        """Set geofence."""
+        self._geofence = value
+
+    @property
+    def key(self) -> Hashable:
+        """Return all criteria of this definition, including those of subclasses."""
+        return type(self), freeze(vars(self))
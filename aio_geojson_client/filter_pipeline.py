@@ -0,0 +1,400 @@
+"""Filter pipeline."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
+from datetime import datetime
+import logging
+import math
+from typing import Any, Generic
+
+from .consts import T_FEED_ENTRY
+from .feed_entry import FeedEntry
+from .filter_definition import freeze
+from .geofence import Geofence
+from .geojson_distance_helper import GeoJsonDistanceHelper
+from .geometries import Polygon
+from .simplification import PolygonSimplifier
+from .spherical import EARTH_RADIUS_KM
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rejection rate assumed for stages that have not evaluated any entries yet.
+DEFAULT_REJECTION_RATE = 0.5
+
+BoundingBox = tuple[float, float, float, float]
+
+
+def longitude_ranges(min_longitude: float, max_longitude: float):
+    """Split a longitude range crossing the antimeridian into two ranges."""
+    if min_longitude > max_longitude:
+        return ((min_longitude, 180.0), (-180.0, max_longitude))
+    return ((min_longitude, max_longitude),)
+
+
+def bounding_boxes_intersect(bbox1: BoundingBox, bbox2: BoundingBox) -> bool:
+    """Check if two bounding boxes intersect."""
+    if bbox1[0] > bbox2[2] or bbox2[0] > bbox1[2]:
+        return False
+    return any(
+        min1 <= max2 and min2 <= max1
+        for min1, max1 in longitude_ranges(bbox1[1], bbox1[3])
+        for min2, max2 in longitude_ranges(bbox2[1], bbox2[3])
+    )
+
+
+def geometries_intersect(entry: FeedEntry, bbox: BoundingBox) -> bool:
+    """Check if any geometry of the entry may be inside the bounding box."""
+    for geometry in entry.geometries or []:
+        geometry_bbox = geometry.bounding_box
+        # Geometries without bounding box cannot be ruled out.
+        if geometry_bbox is None or bounding_boxes_intersect(geometry_bbox, bbox):
+            return True
+    return False
+
+
+class FilterStage(ABC):
+    """A single filter criterion.
+
+    The cost is the relative effort of evaluating this stage for an entry;
+    the pipeline evaluates cheap and selective stages first.
+    """
+
+    cost: float = 1.0
+
+    def __init__(self):
+        """Initialise filter stage."""
+        self._evaluated = 0
+        self._rejected = 0
+
+    def __repr__(self):
+        """Return string representation of this stage."""
+        return f"<{self.__class__.__name__}(key={self.key})>"
+
+    def evaluate(self, entry: FeedEntry) -> bool:
+        """Check if the entry passes this stage, and count rejections."""
+        self._evaluated += 1
+        if self.accept(entry):
+            return True
+        self._rejected += 1
+        return False
+
+    @abstractmethod
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if the entry passes this stage."""
+
+    @property
+    @abstractmethod
+    def key(self) -> Hashable:
+        """Return the criterion of this stage, to detect changed filters."""
+
+    @property
+    def name(self) -> str:
+        """Return the name of this stage."""
+        return self.__class__.__name__
+
+    @property
+    def evaluated(self) -> int:
+        """Return the number of entries evaluated by this stage."""
+        return self._evaluated
+
+    @property
+    def rejected(self) -> int:
+        """Return the number of entries rejected by this stage."""
+        return self._rejected
+
+    @property
+    def rejection_rate(self) -> float:
+        """Return the observed share of evaluated entries that was rejected."""
+        if self._evaluated:
+            return self._rejected / self._evaluated
+        return DEFAULT_REJECTION_RATE
+
+
+class GeometryFilterStage(FilterStage):
+    """Reject entries without any geometry."""
+
+    cost = 2.0
+
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if the entry has a geometry."""
+        geometries = entry.geometries
+        return geometries is not None and len(geometries) >= 1
+
+    @property
+    def key(self) -> Hashable:
+        """Return the criterion of this stage."""
+        return ()
+
+
+class BoundingBoxFilterStage(FilterStage):
+    """Reject entries without any geometry inside the bounding box."""
+
+    cost = 3.0
+
+    def __init__(self, bbox: BoundingBox):
+        """Initialise filter stage."""
+        super().__init__()
+        self._bbox = tuple(bbox)
+
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if any geometry of the entry is inside the bounding box."""
+        return geometries_intersect(entry, self._bbox)
+
+    @property
+    def key(self) -> Hashable:
+        """Return the criterion of this stage."""
+        return self._bbox
+
+
+class GeofenceFilterStage(FilterStage):
+    """Reject entries without any geometry intersecting the geofence."""
+
+    cost = 5.0
+
+    def __init__(self, geofence: Geofence):
+        """Initialise filter stage."""
+        super().__init__()
+        self._geofence = geofence
+
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if any geometry of the entry intersects the geofence."""
+        return any(
+            self._geofence.intersects(geometry) for geometry in entry.geometries or []
+        )
+
+    @property
+    def key(self) -> Hashable:
+        """Return the criterion of this stage."""
+        return self._geofence
+
+
+class RadiusFilterStage(FilterStage):
+    """Reject entries further away from home than the radius (in km).
+
+    Entries without any geometry in the bounding box around the circle are
+    rejected before calculating their distance.
+
+    With a polygon simplifier, large polygons are checked against their
+    simplified outline first, and only polygons within the simplifier's
+    tolerance of the radius are checked at full resolution.
+    """
+
+    cost = 10.0
+
+    def __init__(
+        self,
+        home_coordinates: tuple[float, float],
+        radius: float,
+        simplifier: PolygonSimplifier | None = None,
+    ):
+        """Initialise filter stage."""
+        super().__init__()
+        self._home_coordinates = tuple(home_coordinates)
+        self._radius = radius
+        self._simplifier = simplifier
+        self._bbox = RadiusFilterStage._circle_bounding_box(home_coordinates, radius)
+
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if the entry is within the radius."""
+        if self._bbox and not geometries_intersect(entry, self._bbox):
+            return False
+        if self._simplifier is None:
+            return entry.distance_to_home <= self._radius
+        return self._accept_simplified(entry)
+
+    def _accept_simplified(self, entry: FeedEntry) -> bool:
+        """Check if the entry is within the radius, using simplified polygons."""
+        distance_to_geometry = (
+            entry.distance_cache.distance_to_geometry
+            if entry.distance_cache is not None
+            else GeoJsonDistanceHelper.distance_to_geometry
+        )
+        for geometry in entry.geometries or []:
+            within = None
+            if isinstance(geometry, Polygon):
+                within = self._simplifier.within_radius(
+                    self._home_coordinates, geometry, self._radius
+                )
+            if within is None:
+                within = (
+                    distance_to_geometry(self._home_coordinates, geometry)
+                    <= self._radius
+                )
+            if within:
+                return True
+        return False
+
+    @property
+    def key(self) -> Hashable:
+        """Return the criterion of this stage."""
+        return self._home_coordinates, self._radius
+
+    @staticmethod
+    def _circle_bounding_box(
+        coordinates: tuple[float, float], radius: float
+    ) -> BoundingBox | None:
+        """Determine the bounding box around a circle on the sphere."""
+        latitude, longitude = coordinates
+        # Small margin to not reject entries exactly on the circle.
+        angle = radius / EARTH_RADIUS_KM * (1 + 1e-9)
+        if angle >= math.pi:
+            return None
+        min_latitude = latitude - math.degrees(angle)
+        max_latitude = latitude + math.degrees(angle)
+        if min_latitude <= -90.0 or max_latitude >= 90.0:
+            # The circle includes a pole, so includes all longitudes.
+            return max(min_latitude, -90.0), -180.0, min(max_latitude, 90.0), 180.0
+        delta = math.degrees(
+            math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(latitude))))
+        )
+        min_longitude = (longitude - delta + 180.0) % 360.0 - 180.0
+        max_longitude = (longitude + delta + 180.0) % 360.0 - 180.0
+        return min_latitude, min_longitude, max_latitude, max_longitude
+
+
+class PropertyFilterStage(FilterStage):
+    """Reject entries whose properties do not have the required values.
+
+    A set, frozenset, list or tuple of values requires the property to have
+    any of these values. Values are compared in their hashable form, for
+    example lists as tuples.
+    """
+
+    cost = 1.0
+
+    def __init__(self, properties: dict[str, Any]):
+        """Initialise filter stage."""
+        super().__init__()
+        self._criteria = tuple(
+            (name, PropertyFilterStage._allowed_values(value))
+            for name, value in properties.items()
+        )
+
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if all properties have one of the allowed values."""
+        properties = entry.properties or {}
+        for name, allowed_values in self._criteria:
+            if freeze(properties.get(name)) not in allowed_values:
+                return False
+        return True
+
+    @property
+    def key(self) -> Hashable:
+        """Return the criterion of this stage."""
+        return self._criteria
+
+    @staticmethod
+    def _allowed_values(value: Any) -> frozenset:
+        """Compile the required value into a set of allowed values."""
+        if isinstance(value, (set, frozenset, list, tuple)):
+            return frozenset(freeze(item) for item in value)
+        return frozenset((freeze(value),))
+
+
+class TimeWindowFilterStage(FilterStage):
+    """Reject entries with a timestamp outside the time window.
+
+    Entries without a timestamp are kept.
+    """
+
+    cost = 1.5
+
+    def __init__(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        timestamp: Callable[[FeedEntry], datetime | None],
+    ):
+        """Initialise filter stage."""
+        super().__init__()
+        self._start = start
+        self._end = end
+        self._timestamp = timestamp
+
+    def accept(self, entry: FeedEntry) -> bool:
+        """Check if the entry's timestamp is inside the time window."""
+        timestamp = self._timestamp(entry)
+        if timestamp is None:
+            return True
+        if self._start and timestamp < self._start:
+            return False
+        return not (self._end and timestamp > self._end)
+
+    @property
+    def key(self) -> Hashable:
+        """Return the criterion of this stage."""
+        return self._start, self._end
+
+
+class FilterPipeline(Generic[T_FEED_ENTRY]):
+    """Evaluates filter stages on all entries in a single pass.
+
+    Stages are ordered by cost per rejection, based on the rejection rates
+    observed in previous runs, and evaluation stops at the first stage
+    rejecting an entry.
+    """
+
+    def __init__(self, stages: list[FilterStage]):
+        """Initialise filter pipeline."""
+        self._stages = list(stages)
+        self._keys = FilterPipeline._stage_keys(stages)
+        self._evaluated = 0
+        self._accepted = 0
+        self._order()
+
+    def __repr__(self):
+        """Return string representation of this pipeline."""
+        return f"<{self.__class__.__name__}(stages={self._stages})>"
+
+    def filter(self, entries: list[T_FEED_ENTRY]) -> list[T_FEED_ENTRY]:
+        """Return the entries passing all stages."""
+        stages = self._stages
+        accepted = []
+        for entry in entries:
+            for stage in stages:
+                if not stage.evaluate(entry):
+                    break
+            else:
+                accepted.append(entry)
+        self._evaluated += len(entries)
+        self._accepted += len(accepted)
+        self._order()
+        return accepted
+
+    def matches(self, stages: list[FilterStage]) -> bool:
+        """Check if this pipeline evaluates the same criteria as the stages."""
+        return self._keys == FilterPipeline._stage_keys(stages)
+
+    def _order(self):
+        """Order stages by expected cost per rejected entry."""
+        self._stages.sort(
+            key=lambda stage: stage.cost / max(stage.rejection_rate, 1e-6)
+        )
+        _LOGGER.debug("Filter stages ordered as %s", self._stages)
+
+    @staticmethod
+    def _stage_keys(stages: list[FilterStage]) -> frozenset:
+        """Determine the criteria of the stages, regardless of their order."""
+        return frozenset((stage.__class__, stage.key) for stage in stages)
+
+    @property
+    def stages(self) -> list[FilterStage]:
+        """Return the stages in evaluation order."""
+        return list(self._stages)
+
+    @property
+    def evaluated(self) -> int:
+        """Return the number of entries evaluated by this pipeline."""
+        return self._evaluated
+
+    @property
+    def accepted(self) -> int:
+        """Return the number of entries accepted by this pipeline."""
+        return self._accepted
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Return the number of rejected entries per stage."""
+        return {stage.name: stage.rejected for stage in self._stages}
@@ -0,0 +1,241 @@
+"""Geofence."""
+
+from __future__ import annotations
+
+import logging
+import math
+
+from .geometries import Geometry, Point, Polygon
+
+_LOGGER = logging.getLogger(__name__)
+
+Coordinates = tuple[float, float]
+Edge = tuple[Coordinates, Coordinates]
+
+
+def _normalise_longitude(longitude: float, reference: float) -> float:
+    """Shift longitude to within 180 degrees of the reference longitude."""
+    return reference + (longitude - reference + 180.0) % 360.0 - 180.0
+
+
+def _orientation(a: Coordinates, b: Coordinates, c: Coordinates) -> int:
+    """Determine on which side of the line a-b the point c is."""
+    value = (b[1] - a[1]) * (c[0] - a[0]) - (b[0] - a[0]) * (c[1] - a[1])
+    return (value > 0) - (value < 0)
+
+
+def _on_segment(a: Coordinates, b: Coordinates, c: Coordinates) -> bool:
+    """Check if the collinear point c is on the segment a-b."""
+    in_latitudes = min(a[0], b[0]) <= c[0] <= max(a[0], b[0])
+    return in_latitudes and min(a[1], b[1]) <= c[1] <= max(a[1], b[1])
+
+
+def _segments_intersect(edge1: Edge, edge2: Edge) -> bool:
+    """Check if two segments intersect or touch."""
+    a, b = edge1
+    c, d = edge2
+    o1, o2 = _orientation(a, b, c), _orientation(a, b, d)
+    o3, o4 = _orientation(c, d, a), _orientation(c, d, b)
+    if o1 != o2 and o3 != o4:
+        return True
+    return (
+        (o1 == 0 and _on_segment(a, b, c))
+        or (o2 == 0 and _on_segment(a, b, d))
+        or (o3 == 0 and _on_segment(c, d, a))
+        or (o4 == 0 and _on_segment(c, d, b))
+    )
+
+
+def _edges(ring: list[Coordinates]) -> list[Edge]:
+    """Connect the vertices of the ring, including last and first vertex."""
+    return list(zip(ring, ring[1:] + ring[:1], strict=True))
+
+
+def _ray_crossings(point: Coordinates, edges: list[Edge]) -> int:
+    """Count the edges crossed by a ray from the point towards the east."""
+    latitude, longitude = point
+    crossings = 0
+    for (lat1, lon1), (lat2, lon2) in edges:
+        if (lat1 > latitude) != (lat2 > latitude):
+            crossing = lon1 + (latitude - lat1) * (lon2 - lon1) / (lat2 - lat1)
+            if longitude < crossing:
+                crossings += 1
+    return crossings
+
+
+class _IndexedPolygon:
+    """Polygon (with optional holes) with its edges indexed by latitude band.
+
+    Longitudes are unwrapped relative to the first vertex, so that polygons
+    crossing the antimeridian are contiguous.
+    """
+
+    def __init__(self, rings: list[list[Coordinates]]):
+        """Initialise indexed polygon."""
+        self._reference = rings[0][0][1]
+        self._edges: list[Edge] = []
+        for ring in rings:
+            unwrapped = self._unwrap_ring(ring)
+            self._edges.extend(_edges(unwrapped))
+        # Closed rings repeat their first vertex.
+        self._edges = [edge for edge in self._edges if edge[0] != edge[1]]
+        latitudes = [vertex[0] for edge in self._edges for vertex in edge]
+        longitudes = [vertex[1] for edge in self._edges for vertex in edge]
+        self._bbox = min(latitudes), min(longitudes), max(latitudes), max(longitudes)
+        self._vertex = self._edges[0][0]
+        # About as many bands as edges per band.
+        self._band_count = max(1, math.isqrt(len(self._edges)))
+        self._band_height = (self._bbox[2] - self._bbox[0]) / self._band_count or 1.0
+        self._bands: list[list[Edge]] = [[] for _ in range(self._band_count)]
+        for edge in self._edges:
+            first, last = self._band_range(edge[0][0], edge[1][0])
+            for band in range(first, last + 1):
+                self._bands[band].append(edge)
+
+    def _unwrap_ring(self, ring: list[Coordinates]) -> list[Coordinates]:
+        """Unwrap the ring's longitudes, so that consecutive ones are close."""
+        unwrapped = []
+        longitude = self._reference
+        for latitude, vertex_longitude in ring:
+            longitude = _normalise_longitude(vertex_longitude, longitude)
+            unwrapped.append((latitude, longitude))
+        return unwrapped
+
+    def _band(self, latitude: float) -> int:
+        """Determine the band of the latitude."""
+        band = int((latitude - self._bbox[0]) / self._band_height)
+        return min(max(band, 0), self._band_count - 1)
+
+    def _band_range(self, latitude1: float, latitude2: float) -> tuple[int, int]:
+        """Determine the bands spanned by the latitudes."""
+        return self._band(min(latitude1, latitude2)), self._band(
+            max(latitude1, latitude2)
+        )
+
+    def _normalise(self, coordinates: Coordinates) -> Coordinates:
+        """Shift coordinates to the longitudes of this polygon."""
+        return coordinates[0], _normalise_longitude(coordinates[1], self._reference)
+
+    def _in_bbox(self, coordinates: Coordinates) -> bool:
+        """Check if normalised coordinates are inside the bounding box."""
+        return (
+            self._bbox[0] <= coordinates[0] <= self._bbox[2]
+            and self._bbox[1] <= coordinates[1] <= self._bbox[3]
+        )
+
+    def contains(self, coordinates: Coordinates) -> bool:
+        """Check if the coordinates are inside this polygon."""
+        return self._contains_normalised(self._normalise(coordinates))
+
+    def _contains_normalised(self, coordinates: Coordinates) -> bool:
+        """Check if normalised coordinates are inside this polygon."""
+        if not self._in_bbox(coordinates):
+            return False
+        band = self._bands[self._band(coordinates[0])]
+        return _ray_crossings(coordinates, band) % 2 == 1
+
+    def intersects(self, ring: list[Coordinates]) -> bool:
+        """Check if the polygon defined by the ring intersects this polygon."""
+        ring = [self._normalise(coordinates) for coordinates in ring]
+        latitudes = [coordinates[0] for coordinates in ring]
+        longitudes = [coordinates[1] for coordinates in ring]
+        if (
+            max(latitudes) < self._bbox[0]
+            or min(latitudes) > self._bbox[2]
+            or max(longitudes) < self._bbox[1]
+            or min(longitudes) > self._bbox[3]
+        ):
+            return False
+        if any(self._contains_normalised(coordinates) for coordinates in ring):
+            return True
+        ring_edges = _edges(ring)
+        for edge in ring_edges:
+            first, last = self._band_range(edge[0][0], edge[1][0])
+            for band in range(first, last + 1):
+                if any(
+                    _segments_intersect(edge, fence_edge)
+                    for fence_edge in self._bands[band]
+                ):
+                    return True
+        # This polygon may be entirely inside the other one.
+        return _ray_crossings(self._vertex, ring_edges) % 2 == 1
+
+
+class Geofence:
+    """Area made up of one or more polygons, indexed for fast lookups.
+
+    Each polygon is either a single polygon, or a list of polygons of which
+    the first is the outer boundary and the others are holes. The polygons
+    are preprocessed once, so that testing an entry only considers the
+    edges near it.
+    """
+
+    def __init__(self, polygons: list[Polygon | list[Polygon]]):
+        """Initialise geofence."""
+        self._polygons = [
+            _IndexedPolygon(
+                [
+                    [(point.latitude, point.longitude) for point in ring.points]
+                    for ring in (polygon if isinstance(polygon, list) else [polygon])
+                ]
+            )
+            for polygon in polygons
+        ]
+        _LOGGER.debug("Geofence with %s polygons created", len(self._polygons))
+
+    def __repr__(self):
+        """Return string representation of this geofence."""
+        return f"<{self.__class__.__name__}(polygons={len(self._polygons)})>"
+
+    @classmethod
+    def from_geojson(cls, data: dict) -> Geofence:
+        """Create geofence from GeoJSON (multi)polygons, features or collections."""
+        return cls(Geofence._extract_polygons(data))
+
+    @staticmethod
+    def _extract_polygons(data: dict) -> list[list[Polygon]]:
+        """Extract all polygons including their holes."""
+        data_type = data.get("type")
+        if data_type == "FeatureCollection":
+            return [
+                polygon
+                for feature in data.get("features", [])
+                for polygon in Geofence._extract_polygons(feature)
+            ]
+        if data_type == "Feature":
+            return Geofence._extract_polygons(data.get("geometry") or {})
+        if data_type == "GeometryCollection":
+            return [
+                polygon
+                for geometry in data.get("geometries", [])
+                for polygon in Geofence._extract_polygons(geometry)
+            ]
+        if data_type == "Polygon":
+            coordinates = [data["coordinates"]]
+        elif data_type == "MultiPolygon":
+            coordinates = data["coordinates"]
+        else:
+            _LOGGER.debug("Not implemented: %s", data_type)
+            return []
+        return [
+            [
+                Polygon([Point(vertex[1], vertex[0]) for vertex in ring])
+                for ring in rings
+            ]
+            for rings in coordinates
+        ]
+
+    def contains(self, point: Point) -> bool:
+        """Check if the point is inside the geofence."""
+        coordinates = point.latitude, point.longitude
+        return any(polygon.contains(coordinates) for polygon in self._polygons)
+
+    def intersects(self, geometry: Geometry) -> bool:
+        """Check if the geometry is at least partially inside the geofence."""
+        if isinstance(geometry, Point):
+            return self.contains(geometry)
+        if isinstance(geometry, Polygon):
+            ring = [(point.latitude, point.longitude) for point in geometry.points]
+            return any(polygon.intersects(ring) for polygon in self._polygons)
+        _LOGGER.debug("Not implemented: %s", type(geometry))
+        return False
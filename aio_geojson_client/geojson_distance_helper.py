@@ -4,9 +4,8 @@ from __future__ import annotations
 
 import logging
 
-from haversine import haversine
-
 from .geometries import Geometry, Point, Polygon
+from .spherical import EARTH_RADIUS_KM, to_unit_vector
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,6 +45,42 @@ class GeoJsonDistanceHelper:
             _LOGGER.debug("Not implemented: %s", type(geometry))
         return distance
 
+    @staticmethod
+    def minimum_distance_to_geometry(
+        coordinates: tuple[float, float], geometry: Geometry
+    ) -> float:
+        """Estimate a lower bound of the distance between coordinates and geometry.
+
+        The bound only requires the geometry's bounding box: the distance to
+        the centre of the box minus the distance from its centre to the
+        furthest corner.
+        """
+        if isinstance(geometry, Point):
+            return GeoJsonDistanceHelper._distance_to_point(coordinates, geometry)
+        bbox = geometry.bounding_box
+        if bbox is None:
+            return 0.0
+        min_latitude, min_longitude, max_latitude, max_longitude = bbox
+        if min_longitude > max_longitude:
+            # Alter longitude to cater for 180 degree crossings.
+            max_longitude += 360.0
+        centre = (
+            (min_latitude + max_latitude) / 2,
+            ((min_longitude + max_longitude) / 2 + 180.0) % 360.0 - 180.0,
+        )
+        radius = max(
+            GeoJsonDistanceHelper._distance_to_coordinates(centre, corner)
+            for corner in (
+                (min_latitude, min_longitude),
+                (max_latitude, min_longitude),
+            )
+        )
+        return max(
+            0.0,
+            GeoJsonDistanceHelper._distance_to_coordinates(coordinates, centre)
+            - radius,
+        )
+
     @staticmethod
     def _distance_to_point(coordinates: tuple[float, float], point: Point) -> float:
         """Calculate the distance between coordinates and the point."""
@@ -59,22 +94,22 @@ class GeoJsonDistanceHelper:
         coordinates: tuple[float, float], polygon: Polygon
     ) -> float:
         """Calculate the distance between coordinates and the polygon."""
-        distance = float("inf")
         # Check if coordinates are inside the polygon.
         if polygon.is_inside(Point(coordinates[0], coordinates[1])):
             return 0.0
-        # Calculate distance from polygon by calculating the distance
-        # to each point of the polygon.
-        for polygon_point in polygon.points:
-            distance = min(
-                distance,
-                GeoJsonDistanceHelper._distance_to_point(coordinates, polygon_point),
-            )
-        # Next calculate the distance to each edge of the polygon.
-        for edge in polygon.edges:
-            distance = min(
-                distance, GeoJsonDistanceHelper._distance_to_edge(coordinates, edge)
-            )
+        return GeoJsonDistanceHelper.distance_to_outline(coordinates, polygon)
+
+    @staticmethod
+    def distance_to_outline(
+        coordinates: tuple[float, float], polygon: Polygon
+    ) -> float:
+        """Calculate the distance between coordinates and the polygon's outline.
+
+        This is the great-circle distance to the closest vertex or edge.
+        """
+        distance = EARTH_RADIUS_KM * polygon.outline.angle_to(
+            to_unit_vector(coordinates[0], coordinates[1])
+        )
         _LOGGER.debug("Distance between %s and %s: %s", coordinates, polygon, distance)
         return distance
 
@@ -83,60 +118,7 @@ class GeoJsonDistanceHelper:
         coordinates1: tuple[float, float], coordinates2: tuple[float, float]
     ) -> float:
         """Calculate the distance between two coordinates tuples.."""
+        from haversine import haversine  # noqa: PLC0415
+
         # Expecting coordinates in format: (latitude, longitude).
         return haversine(coordinates2, coordinates1)
-
-    @staticmethod
-    def _distance_to_edge(
-        coordinates: tuple[float, float], edge: tuple[Point, Point]
-    ) -> float:
-        """Calculate distance between coordinates and provided edge."""
-        perpendicular_point = GeoJsonDistanceHelper._perpendicular_point(
-            edge, Point(coordinates[0], coordinates[1])
-        )
-        # If there is a perpendicular point on the edge -> calculate distance.
-        # If there isn't, then the distance to the end points of the edge will
-        # need to be considered separately.
-        if perpendicular_point:
-            distance = GeoJsonDistanceHelper._distance_to_point(
-                coordinates, perpendicular_point
-            )
-            _LOGGER.debug("Distance between %s and %s: %s", coordinates, edge, distance)
-            return distance
-        return float("inf")
-
-    @staticmethod
-    def _perpendicular_point(edge: tuple[Point, Point], point: Point) -> Point | None:
-        """Find a perpendicular point on the edge to the provided point."""
-        a, b = edge
-        # Safety check: a and b can't be an edge if they are the same point.
-        if a == b:
-            return None
-        px = point.longitude
-        py = point.latitude
-        ax = a.longitude
-        ay = a.latitude
-        bx = b.longitude
-        by = b.latitude
-        # Alter longitude to cater for 180 degree crossings.
-        if px < 0:
-            px += 360.0
-        if ax < 0:
-            ax += 360.0
-        if bx < 0:
-            bx += 360.0
-        if ay > by or ax > bx:
-            ax, ay, bx, by = bx, by, ax, ay
-        dx = abs(bx - ax)
-        dy = abs(by - ay)
-        shortest_length = ((dx * (px - ax)) + (dy * (py - ay))) / (
-            (dx * dx) + (dy * dy)
-        )
-        rx = ax + dx * shortest_length
-        ry = ay + dy * shortest_length
-        if bx >= rx >= ax and by >= ry >= ay:
-            if rx > 180:
-                # Correct longitude.
-                rx -= 360.0
-            return Point(ry, rx)
-        return None
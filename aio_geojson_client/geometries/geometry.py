@@ -1,5 +1,15 @@
 """GeoJSON geometry."""
 
+from __future__ import annotations
+
 
 class Geometry:
     """Represents a geometry."""
+
+    # Geometries can be shared through weak references.
+    __slots__ = ("__weakref__",)
+
+    @property
+    def bounding_box(self) -> tuple[float, float, float, float] | None:
+        """Return (min latitude, min longitude, max latitude, max longitude)."""
+        return None
@@ -8,6 +8,8 @@ from .geometry import Geometry
 class Point(Geometry):
     """Represents a point."""
 
+    __slots__ = ("_latitude", "_longitude")
+
     def __init__(self, latitude: float, longitude: float):
         """Initialise point."""
         self._latitude = latitude
@@ -38,3 +40,8 @@ class Point(Geometry):
     def longitude(self) -> float | None:
         """Return the longitude of this point."""
         return self._longitude
+
+    @property
+    def bounding_box(self) -> tuple[float, float, float, float] | None:
+        """Return (min latitude, min longitude, max latitude, max longitude)."""
+        return self.latitude, self.longitude, self.latitude, self.longitude
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from ..spherical import Outline, arc_latitude_range, to_unit_vector
 from .geometry import Geometry
 from .point import Point
 
@@ -9,17 +10,26 @@ from .point import Point
 class Polygon(Geometry):
     """Represents a polygon."""
 
+    __slots__ = ("_bounding_box", "_hash", "_outline", "_points")
+
     def __init__(self, points: list[Point]):
         """Initialise polygon."""
         self._points = points
+        self._outline: Outline | None = None
+        self._hash: int | None = None
+        self._bounding_box: tuple[float, float, float, float] | None = None
 
     def __repr__(self):
         """Return string representation of this polygon."""
         return f"<{self.__class__.__name__}(centroid={self.centroid})>"
 
     def __hash__(self) -> int:
-        """Return unique hash of this polygon."""
-        return hash(self.points)
+        """Return hash of this polygon's coordinates, calculated once."""
+        if self._hash is None:
+            self._hash = hash(
+                tuple((point.latitude, point.longitude) for point in self.points)
+            )
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         """Return if this object is equal to other object."""
@@ -40,6 +50,15 @@ class Polygon(Geometry):
             edges.append((previous, current))
         return edges
 
+    @property
+    def outline(self) -> Outline:
+        """Return the outline of this polygon, precomputed on first use."""
+        if self._outline is None:
+            self._outline = Outline.from_coordinates(
+                [(point.latitude, point.longitude) for point in self.points]
+            )
+        return self._outline
+
     @property
     def centroid(self) -> Point:
         """Find the polygon's centroid as a best approximation."""
@@ -50,6 +69,41 @@ class Polygon(Geometry):
         latitude = sum(latitudes_list) / number_of_points
         return Point(latitude, longitude)
 
+    @property
+    def bounding_box(self) -> tuple[float, float, float, float] | None:
+        """Return (min latitude, min longitude, max latitude, max longitude).
+
+        If the polygon crosses the antimeridian, min longitude is greater
+        than max longitude. The latitudes include how far the edges, which
+        are great-circle arcs, bulge towards the poles. Calculated once.
+        """
+        if self._bounding_box is None:
+            latitudes = [point.latitude for point in self.points]
+            longitudes = [point.longitude for point in self.points]
+            min_latitude, max_latitude = min(latitudes), max(latitudes)
+            vertices = [
+                to_unit_vector(point.latitude, point.longitude) for point in self.points
+            ]
+            for index in range(1, len(vertices)):
+                low, high = arc_latitude_range(vertices[index - 1], vertices[index])
+                min_latitude = min(min_latitude, low)
+                max_latitude = max(max_latitude, high)
+            min_longitude, max_longitude = min(longitudes), max(longitudes)
+            if max_longitude - min_longitude > 180.0:
+                # Alter longitude to cater for 180 degree crossings.
+                shifted = [
+                    longitude + 360.0 if longitude < 0 else longitude
+                    for longitude in longitudes
+                ]
+                min_longitude, max_longitude = min(shifted), max(shifted) - 360.0
+            self._bounding_box = (
+                min_latitude,
+                min_longitude,
+                max_latitude,
+                max_longitude,
+            )
+        return self._bounding_box
+
     def is_inside(self, point: Point) -> bool:
         """Check if the provided point is inside this polygon."""
         if point:
@@ -0,0 +1,72 @@
+"""Geometry interner."""
+
+from __future__ import annotations
+
+import logging
+from weakref import WeakValueDictionary
+
+from .geometries import Geometry, Point, Polygon
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeometryInterner:
+    """Table of shared geometries, keyed by their coordinates.
+
+    Identical geometries of different entries, or of the same entry across
+    updates, are wrapped once and then shared, together with everything
+    they precompute. Geometries are only held weakly, so they are freed
+    once no entry uses them anymore. The interner can be shared by feeds.
+    Shared geometries must not be modified.
+    """
+
+    def __init__(self):
+        """Initialise geometry interner."""
+        self._geometries: WeakValueDictionary[tuple, Geometry] = WeakValueDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        """Return string representation of this interner."""
+        return f"<{self.__class__.__name__}(size={len(self._geometries)})>"
+
+    def __len__(self) -> int:
+        """Return the number of geometries currently shared."""
+        return len(self._geometries)
+
+    def point(self, coordinates: list[float]) -> Point:
+        """Return the shared point of GeoJSON coordinates (longitude, latitude)."""
+        key = ("P", coordinates[1], coordinates[0])
+        point = self._geometries.get(key)
+        if point is None:
+            point = Point(coordinates[1], coordinates[0])
+            self._store(key, point)
+        else:
+            self._hits += 1
+        return point
+
+    def polygon(self, ring: list[list[float]]) -> Polygon:
+        """Return the shared polygon of a GeoJSON ring."""
+        key = ("A", *map(tuple, ring))
+        polygon = self._geometries.get(key)
+        if polygon is None:
+            polygon = Polygon([Point(vertex[1], vertex[0]) for vertex in ring])
+            self._store(key, polygon)
+        else:
+            self._hits += 1
+        return polygon
+
+    def _store(self, key: tuple, geometry: Geometry):
+        """Share a newly wrapped geometry."""
+        self._misses += 1
+        self._geometries[key] = geometry
+
+    @property
+    def hits(self) -> int:
+        """Return the number of geometries that were already shared."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of geometries that had to be wrapped."""
+        return self._misses
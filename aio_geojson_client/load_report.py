@@ -0,0 +1,110 @@
+"""Load report."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .feed_manager import FeedManagerBase
+
+_LOGGER = logging.getLogger(__name__)
+
+CALLBACK_GENERATE = "generate"
+CALLBACK_UPDATE = "update"
+CALLBACK_REMOVE = "remove"
+
+
+class LoadReport:
+    """Throughput, update latencies and callback counts of feed managers.
+
+    Pass the report's callbacks to the feed managers, and let the report
+    update them repeatedly (see `run`), for example against a replay server.
+    """
+
+    def __init__(self):
+        """Initialise load report."""
+        self._latencies: list[float] = []
+        self._callbacks: Counter[str] = Counter()
+        self._duration = 0.0
+
+    def __repr__(self):
+        """Return string representation of this report."""
+        return f"<{self.__class__.__name__}(updates={self.updates})>"
+
+    async def generate_callback(self, external_id: str):
+        """Count a created entry."""
+        self._callbacks[CALLBACK_GENERATE] += 1
+
+    async def update_callback(self, external_id: str):
+        """Count an updated entry."""
+        self._callbacks[CALLBACK_UPDATE] += 1
+
+    async def remove_callback(self, external_id: str):
+        """Count a removed entry."""
+        self._callbacks[CALLBACK_REMOVE] += 1
+
+    async def run(
+        self, managers: list[FeedManagerBase], duration: float, interval: float
+    ):
+        """Update all managers every interval (in seconds) for the duration."""
+        start = time.monotonic()
+        await asyncio.gather(
+            *(
+                self._run_manager(manager, start + duration, interval)
+                for manager in managers
+            )
+        )
+        self._duration += time.monotonic() - start
+
+    async def _run_manager(self, manager: FeedManagerBase, end: float, interval: float):
+        """Update the manager every interval until the end."""
+        while (start := time.monotonic()) < end:
+            await manager.update()
+            self.record_update(time.monotonic() - start)
+            await asyncio.sleep(max(0.0, min(interval, end - time.monotonic())))
+
+    def record_update(self, latency: float):
+        """Record the seconds an update took."""
+        self._latencies.append(latency)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Return the latency percentile (0..1) of the updates in seconds."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        index = math.ceil(percentile * len(latencies)) - 1
+        return latencies[min(max(index, 0), len(latencies) - 1)]
+
+    @property
+    def updates(self) -> int:
+        """Return the number of updates."""
+        return len(self._latencies)
+
+    @property
+    def throughput(self) -> float | None:
+        """Return the number of updates per second."""
+        return self.updates / self._duration if self._duration else None
+
+    @property
+    def callbacks(self) -> dict[str, int]:
+        """Return the number of callbacks by kind."""
+        return {
+            kind: self._callbacks[kind]
+            for kind in (CALLBACK_GENERATE, CALLBACK_UPDATE, CALLBACK_REMOVE)
+        }
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Summarise throughput, latency percentiles and callback counts."""
+        return {
+            "updates": self.updates,
+            "throughput": self.throughput,
+            "latency_p50": self.latency_percentile(0.5),
+            "latency_p90": self.latency_percentile(0.9),
+            "latency_p99": self.latency_percentile(0.99),
+            **self.callbacks,
+        }
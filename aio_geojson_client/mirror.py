@@ -0,0 +1,100 @@
+"""Feed mirror."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+
+# Weight of the latest latency in the moving average.
+LATENCY_SMOOTHING = 0.3
+# Number of latencies kept to determine percentiles.
+LATENCY_SAMPLES = 50
+# Minimum number of latencies required before hedging requests.
+MIN_HEDGE_SAMPLES = 5
+# Time in seconds after which a failed mirror is considered healthy again.
+RECOVERY_TIME = 60.0
+
+
+class Mirror:
+    """A url serving the feed, with its latency and error estimates."""
+
+    def __init__(self, url: str):
+        """Initialise mirror."""
+        self._url = url
+        self._latency: float | None = None
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._failures = 0
+        self._last_failure: float | None = None
+
+    def __repr__(self):
+        """Return string representation of this mirror."""
+        return f"<{self.__class__.__name__}(url={self._url}, latency={self._latency}, failures={self._failures})>"
+
+    def record_success(self, latency: float):
+        """Record a successful request and its latency in seconds."""
+        self._record_latency(latency)
+        self._failures = 0
+
+    def record_abandoned(self, elapsed: float):
+        """Record a request abandoned after the elapsed seconds.
+
+        The elapsed time is a lower bound of the latency, so that a mirror
+        that keeps losing to hedged requests falls behind in the ranking.
+        """
+        self._record_latency(elapsed)
+
+    def _record_latency(self, latency: float):
+        """Add the latency to the samples and the moving average."""
+        self._latencies.append(latency)
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += LATENCY_SMOOTHING * (latency - self._latency)
+
+    def record_failure(self):
+        """Record a failed request."""
+        self._failures += 1
+        self._last_failure = time.monotonic()
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Return the latency percentile (0..1), if enough latencies are known."""
+        if len(self._latencies) < MIN_HEDGE_SAMPLES:
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(percentile * len(latencies)))]
+
+    @property
+    def url(self) -> str:
+        """Return the url of this mirror."""
+        return self._url
+
+    @property
+    def latency(self) -> float | None:
+        """Return the moving average latency in seconds."""
+        return self._latency
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    @property
+    def healthy(self) -> bool:
+        """Return if this mirror is expected to respond successfully."""
+        return (
+            self._failures == 0
+            or time.monotonic() - self._last_failure >= RECOVERY_TIME
+        )
+
+    @staticmethod
+    def rank(mirrors: list[Mirror]) -> list[Mirror]:
+        """Order mirrors by health and latency, keeping the configured order otherwise."""
+        # Mirrors without known latency are ranked behind measured ones, so
+        # that the configured order only changes once latencies are known.
+        return sorted(
+            mirrors,
+            key=lambda mirror: (
+                not mirror.healthy,
+                mirror.latency if mirror.latency is not None else float("inf"),
+            ),
+        )
@@ -0,0 +1,166 @@
+"""Pagination of GeoJSON feeds."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import TYPE_CHECKING
+
+from .consts import UPDATE_ERROR, UPDATE_OK
+
+if TYPE_CHECKING:
+    from geojson import FeatureCollection
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_PAGES = 100
+
+# Fetch a page from the url (or the feed's url if None) with the parameters.
+FetchPage = Callable[
+    [str | None, dict | None], Awaitable[tuple[str, "FeatureCollection | None"]]
+]
+
+
+class Pagination(ABC):
+    """Pagination base class."""
+
+    def __init__(self, max_pages: int = DEFAULT_MAX_PAGES):
+        """Initialise pagination."""
+        self._max_pages = max_pages
+
+    @abstractmethod
+    async def fetch(
+        self, fetch_page: FetchPage, params: dict | None
+    ) -> tuple[str, FeatureCollection | None]:
+        """Fetch all pages and merge them into the first page."""
+
+    @staticmethod
+    def _merge(pages: list[FeatureCollection]) -> FeatureCollection:
+        """Merge features of all pages into the first page."""
+        merged = pages[0]
+        for page in pages[1:]:
+            merged["features"].extend(page.get("features", []))
+        return merged
+
+    @staticmethod
+    def _is_feature_collection(status: str, page: FeatureCollection | None) -> bool:
+        """Check if the page was fetched successfully and is a collection."""
+        return status == UPDATE_OK and isinstance(page, dict) and "features" in page
+
+
+class LinkPagination(Pagination):
+    """Follow `links` with relation `next`, as used by OGC API Features."""
+
+    async def fetch(
+        self, fetch_page: FetchPage, params: dict | None
+    ) -> tuple[str, FeatureCollection | None]:
+        """Fetch pages one after another until there is no next link.
+
+        Fail if there is a next link after the maximum number of pages.
+        """
+        status, page = await fetch_page(None, params)
+        if not self._is_feature_collection(status, page):
+            return status, page
+        pages = [page]
+        while next_url := LinkPagination._next_url(page):
+            if len(pages) >= self._max_pages:
+                _LOGGER.warning("Not fetching more than %s pages", self._max_pages)
+                return UPDATE_ERROR, None
+            # The next link already contains all query parameters.
+            status, page = await fetch_page(next_url, None)
+            if not self._is_feature_collection(status, page):
+                _LOGGER.warning("Unable to fetch page %s", next_url)
+                return UPDATE_ERROR, None
+            pages.append(page)
+        return UPDATE_OK, self._merge(pages)
+
+    @staticmethod
+    def _next_url(page: FeatureCollection) -> str | None:
+        """Find the link to the next page."""
+        for link in page.get("links") or []:
+            if isinstance(link, dict) and link.get("rel") == "next":
+                return link.get("href")
+        return None
+
+
+class OffsetPagination(Pagination):
+    """Request pages by offset and limit parameters.
+
+    Pages after the first one are fetched concurrently, bounded by the
+    maximum concurrency. If the first page reports the total number of
+    features (`numberMatched`), all remaining pages are requested at once;
+    otherwise pages are requested in batches until a page is not full.
+    Fetching fails if there are more pages than the maximum number of pages.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        offset_parameter: str = "offset",
+        limit_parameter: str = "limit",
+        max_concurrency: int = 4,
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ):
+        """Initialise offset pagination."""
+        super().__init__(max_pages)
+        if page_size < 1 or max_concurrency < 1:
+            raise ValueError("Invalid page size or concurrency")
+        self._page_size = page_size
+        self._offset_parameter = offset_parameter
+        self._limit_parameter = limit_parameter
+        self._max_concurrency = max_concurrency
+
+    async def fetch(
+        self, fetch_page: FetchPage, params: dict | None
+    ) -> tuple[str, FeatureCollection | None]:
+        """Fetch the first page, then the remaining pages concurrently."""
+        status, page = await fetch_page(None, self._page_params(params, 0))
+        if not self._is_feature_collection(status, page):
+            return status, page
+        pages = [page]
+        total = page.get("numberMatched")
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _fetch_page(page_number: int):
+            async with semaphore:
+                return await fetch_page(None, self._page_params(params, page_number))
+
+        while self._is_full(pages[-1]) and len(pages) < self._max_pages:
+            if isinstance(total, int):
+                last_page = min(-(-total // self._page_size), self._max_pages)
+            else:
+                last_page = min(len(pages) + self._max_concurrency, self._max_pages)
+            results = await asyncio.gather(
+                *(_fetch_page(number) for number in range(len(pages), last_page))
+            )
+            for status, page in results:
+                if not self._is_feature_collection(status, page):
+                    _LOGGER.warning("Unable to fetch all pages")
+                    return UPDATE_ERROR, None
+                pages.append(page)
+                if not self._is_full(page):
+                    # Ignore any pages beyond the end.
+                    break
+            if isinstance(total, int):
+                break
+        if self._is_full(pages[-1]) and not (
+            isinstance(total, int) and len(pages) * self._page_size >= total
+        ):
+            # Stopped at the maximum number of pages with more pages left.
+            _LOGGER.warning("Not fetching more than %s pages", self._max_pages)
+            return UPDATE_ERROR, None
+        return UPDATE_OK, self._merge(pages)
+
+    def _page_params(self, params: dict | None, page_number: int) -> dict:
+        """Add offset and limit of the page to the parameters."""
+        return {
+            **(params or {}),
+            self._offset_parameter: page_number * self._page_size,
+            self._limit_parameter: self._page_size,
+        }
+
+    def _is_full(self, page: FeatureCollection) -> bool:
+        """Check if the page contains the maximum number of features."""
+        return len(page.get("features", [])) >= self._page_size
@@ -0,0 +1,101 @@
+"""Adaptive polling interval."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from .consts import UPDATE_ERROR, UPDATE_OK_NO_DATA
+from .status_update import StatusUpdate
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptivePollingInterval:
+    """Determine the polling interval from the observed change rate of a feed.
+
+    Each status update moves the interval: changes (created or removed
+    entries, or a newer last timestamp) speed it up, while quiet updates and
+    servers reporting no new data (for example HTTP 304) back off. Errors
+    back off exponentially with the length of the error streak. The interval
+    always stays within the configured bounds.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        initial_interval: float | None = None,
+        *,
+        speedup_factor: float = 0.5,
+        backoff_factor: float = 1.5,
+        error_backoff_factor: float = 2.0,
+    ):
+        """Initialise adaptive polling interval (all intervals in seconds)."""
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(
+                f"Invalid interval bounds: min={min_interval}, max={max_interval}"
+            )
+        if not 0 < speedup_factor <= 1 <= backoff_factor <= error_backoff_factor:
+            raise ValueError("Invalid speedup or backoff factor")
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._speedup_factor = speedup_factor
+        self._backoff_factor = backoff_factor
+        self._error_backoff_factor = error_backoff_factor
+        self._interval = self._clamp(
+            initial_interval if initial_interval is not None else min_interval
+        )
+        self._error_streak = 0
+        self._last_timestamp: datetime | None = None
+
+    def __repr__(self):
+        """Return string representation of this polling interval."""
+        return f"<{self.__class__.__name__}(interval={self._interval}, errors={self._error_streak})>"
+
+    def record(self, status_update: StatusUpdate) -> float:
+        """Adjust the interval based on the status update and return it."""
+        if status_update.status == UPDATE_ERROR:
+            self._error_streak += 1
+            # Consecutive errors grow the interval exponentially.
+            self._interval = self._clamp(self._interval * self._error_backoff_factor)
+        else:
+            self._error_streak = 0
+            if status_update.status != UPDATE_OK_NO_DATA and self._changed(
+                status_update
+            ):
+                self._interval = self._clamp(self._interval * self._speedup_factor)
+            else:
+                self._interval = self._clamp(self._interval * self._backoff_factor)
+        if status_update.last_timestamp:
+            self._last_timestamp = status_update.last_timestamp
+        _LOGGER.debug(
+            "Next polling interval %s after %s", self._interval, status_update
+        )
+        return self._interval
+
+    def _changed(self, status_update: StatusUpdate) -> bool:
+        """Check if the status update indicates any change in the feed."""
+        # Entries still in the feed are always counted as updated, so only
+        # created and removed entries are a reliable signal of change.
+        if status_update.created or status_update.removed:
+            return True
+        return bool(
+            status_update.last_timestamp
+            and self._last_timestamp
+            and status_update.last_timestamp > self._last_timestamp
+        )
+
+    def _clamp(self, interval: float) -> float:
+        """Keep the interval within the configured bounds."""
+        return min(self._max_interval, max(self._min_interval, interval))
+
+    @property
+    def interval(self) -> float:
+        """Return the current polling interval in seconds."""
+        return self._interval
+
+    @property
+    def error_streak(self) -> int:
+        """Return the number of consecutive failed updates."""
+        return self._error_streak
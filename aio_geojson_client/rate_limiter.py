@@ -0,0 +1,91 @@
+"""Rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """Token bucket of a single host."""
+
+    __slots__ = ("blocked_until", "tokens", "updated")
+
+    def __init__(self, tokens: float):
+        """Initialise token bucket."""
+        self.tokens = tokens
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """Per-host token bucket rate limiter, to be shared by all feeds.
+
+    Each host allows a burst of requests, after which requests are spread
+    out to the configured rate. A host can be deferred, for example because
+    it responded with `Retry-After`. Requests that would have to wait longer
+    than the maximum wait are not sent at all.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, max_wait: float = 10.0):
+        """Initialise rate limiter (rate in requests per second, wait in seconds)."""
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate {rate} or burst {burst}")
+        self._rate = rate
+        self._burst = burst
+        self._max_wait = max_wait
+        self._buckets: dict[str, _Bucket] = {}
+
+    def __repr__(self):
+        """Return string representation of this rate limiter."""
+        return f"<{self.__class__.__name__}(rate={self._rate}, burst={self._burst})>"
+
+    async def acquire(self, host: str) -> bool:
+        """Wait until a request to the host may be sent.
+
+        Return False if the request would have to wait longer than the
+        maximum wait.
+        """
+        bucket = self._buckets.setdefault(host, _Bucket(self._burst))
+        while True:
+            now = time.monotonic()
+            bucket.tokens = min(
+                self._burst, bucket.tokens + (now - bucket.updated) * self._rate
+            )
+            bucket.updated = now
+            wait = bucket.blocked_until - now
+            if wait <= 0:
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return True
+                wait = (1 - bucket.tokens) / self._rate
+            if wait > self._max_wait:
+                _LOGGER.debug("Rate limit for %s exceeded for %.1f seconds", host, wait)
+                return False
+            await asyncio.sleep(wait)
+
+    def defer(self, host: str, delay: float):
+        """Do not send requests to the host for the delay in seconds."""
+        bucket = self._buckets.setdefault(host, _Bucket(self._burst))
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        _LOGGER.debug("Deferring requests to %s for %s seconds", host, delay)
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        """Parse the delay in seconds from a `Retry-After` header value."""
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,131 @@
+"""Replay server."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Self
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from .traffic_archive import RecordedResponse, TrafficArchive
+
+_LOGGER = logging.getLogger(__name__)
+
+# Headers describing the recorded transfer rather than the content.
+SKIPPED_HEADERS = frozenset(
+    {"connection", "content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+def _resource(url: str) -> str:
+    """Identify the resource of a url by its path and query."""
+    parts = urlsplit(url)
+    return f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+
+
+class ReplayServer:
+    """Local HTTP server replaying a traffic archive.
+
+    Each request is answered with the response recorded most recently for
+    the same path and query at the same time since the start, on a timeline
+    optionally accelerated by the speed factor. Recorded latencies are
+    replayed at the same speed. Feeds request the replayed urls instead of
+    the recorded ones (see `url`).
+    """
+
+    def __init__(
+        self,
+        archive: TrafficArchive,
+        speed: float = 1.0,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialise replay server."""
+        if speed <= 0:
+            raise ValueError(f"Invalid speed {speed}")
+        self._speed = speed
+        self._host = host
+        self._port = port
+        self._responses: dict[str, list[RecordedResponse]] = {}
+        start = archive.responses[0].offset if archive.responses else 0.0
+        self._timelines: dict[str, list[float]] = {}
+        for response in archive.responses:
+            resource = _resource(response.url)
+            self._responses.setdefault(resource, []).append(response)
+            self._timelines.setdefault(resource, []).append(response.offset - start)
+        self._runner: web.AppRunner | None = None
+        self._start: float | None = None
+        self._base_url: str | None = None
+        self._requests = 0
+
+    def __repr__(self):
+        """Return string representation of this server."""
+        return f"<{self.__class__.__name__}(url={self._base_url}, speed={self._speed})>"
+
+    async def __aenter__(self) -> Self:
+        """Start the server when entering the context."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        """Stop the server when leaving the context."""
+        await self.stop()
+
+    async def start(self):
+        """Start serving, and start the replay timeline."""
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self._base_url = f"http://{host}:{port}"
+        self._start = time.monotonic()
+        _LOGGER.debug("Replaying %s resources at %s", len(self._responses), self)
+
+    async def stop(self):
+        """Stop serving."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def url(self, recorded_url: str) -> str:
+        """Return the url replaying the recorded url."""
+        return f"{self._base_url}{_resource(recorded_url)}"
+
+    def _replayed_response(self, resource: str) -> RecordedResponse | None:
+        """Find the response recorded last before the current replay time."""
+        responses = self._responses.get(resource)
+        if not responses:
+            return None
+        elapsed = (time.monotonic() - self._start) * self._speed
+        index = bisect.bisect_right(self._timelines[resource], elapsed)
+        return responses[max(index - 1, 0)]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer a request with the recorded response."""
+        self._requests += 1
+        response = self._replayed_response(request.path_qs)
+        if response is None:
+            return web.Response(status=404)
+        await asyncio.sleep(response.elapsed / self._speed)
+        return web.Response(
+            status=response.status,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+            body=response.body,
+        )
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests answered."""
+        return self._requests
@@ -0,0 +1,41 @@
+"""Retry policy."""
+
+from __future__ import annotations
+
+import random
+
+
+class RetryPolicy:
+    """Retry policy with capped exponential backoff and jitter."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+    ):
+        """Initialise retry policy (delays in seconds)."""
+        if max_retries < 0:
+            raise ValueError(f"Invalid number of retries: {max_retries}")
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+
+    def __repr__(self):
+        """Return string representation of this retry policy."""
+        return f"<{self.__class__.__name__}(max_retries={self._max_retries}, base_delay={self._base_delay}, max_delay={self._max_delay})>"
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay in seconds before the retry after the given attempt."""
+        delay = min(self._max_delay, self._base_delay * 2**attempt)
+        if self._jitter:
+            # Full jitter spreads out retries of many clients.
+            return random.uniform(0, delay)
+        return delay
+
+    @property
+    def max_retries(self) -> int:
+        """Return the maximum number of retries."""
+        return self._max_retries
@@ -0,0 +1,286 @@
+"""Shared state."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from typing import Self
+
+from .snapshot import COLUMN_EXTERNAL_ID, GEOMETRY_COLUMNS, FeedSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"AGJS"
+LAYOUT_VERSION = 1
+# Magic, layout version, version being written and last version published.
+HEADER = struct.Struct("<4sIQQ")
+# Offset, capacity, length and version of each of the two slots.
+SLOT = struct.Struct("<QQQQ")
+SLOT_COUNT = 2
+# Slots start after the header, aligned for the numeric columns.
+HEADER_SIZE = 128
+ALIGNMENT = 8
+# Number of entries, at the start of each slot.
+COUNT = struct.Struct("<Q")
+OFFSET_FORMAT = "Q"
+DEFAULT_CAPACITY = 64 * 1024
+
+
+def _align(size: int) -> int:
+    """Round the size up to the alignment."""
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _encode(snapshot: FeedSnapshot) -> bytes:
+    """Encode the geometry columns and external ids of a snapshot.
+
+    The entry count is followed by the numeric columns as doubles, the end
+    offsets of the external ids, and the concatenated UTF-8 external ids.
+    """
+    external_ids = [
+        str(external_id).encode() for external_id in snapshot[COLUMN_EXTERNAL_ID]
+    ]
+    offsets = []
+    end = 0
+    for external_id in external_ids:
+        end += len(external_id)
+        offsets.append(end)
+    return b"".join(
+        (
+            COUNT.pack(len(snapshot)),
+            *(snapshot[name].tobytes() for name in GEOMETRY_COLUMNS),
+            struct.pack(f"<{len(offsets)}{OFFSET_FORMAT}", *offsets),
+            *external_ids,
+        )
+    )
+
+
+class SharedState:
+    """Read-only view of a version of published state.
+
+    Columns are views into the shared memory, without copying. A view stays
+    valid until the publisher starts writing the version after next into
+    the same slot (see `valid`).
+    """
+
+    def __init__(self, reader: StateReader, version: int, data: memoryview):
+        """Initialise shared state."""
+        self._reader = reader
+        self._version = version
+        if len(data) < COUNT.size:
+            raise ValueError(f"Inconsistent shared state version {version}")
+        (count,) = COUNT.unpack_from(data)
+        if COUNT.size + 8 * count * (len(GEOMETRY_COLUMNS) + 1) > len(data):
+            raise ValueError(f"Inconsistent shared state version {version}")
+        self._count = count
+        self._columns: dict[str, memoryview] = {}
+        offset = COUNT.size
+        for name in GEOMETRY_COLUMNS:
+            self._columns[name] = data[offset : offset + 8 * count].cast("d")
+            offset += 8 * count
+        self._offsets = data[offset : offset + 8 * count].cast(OFFSET_FORMAT)
+        self._external_ids = data[offset + 8 * count :]
+
+    def __repr__(self):
+        """Return string representation of this state."""
+        return f"<{self.__class__.__name__}(version={self._version}, entries={self._count})>"
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self._count
+
+    def __getitem__(self, name: str) -> memoryview:
+        """Return the numeric column with the name."""
+        return self._columns[name]
+
+    @property
+    def version(self) -> int:
+        """Return the published version."""
+        return self._version
+
+    @property
+    def valid(self) -> bool:
+        """Return whether the slot of this state has not been overwritten."""
+        return self._reader.writing_version < self._version + SLOT_COUNT
+
+    def external_id(self, index: int) -> str:
+        """Return the external id of the entry at the index."""
+        start = self._offsets[index - 1] if index > 0 else 0
+        return str(self._external_ids[start : self._offsets[index]], "utf-8")
+
+    @property
+    def external_ids(self) -> list[str]:
+        """Return the external ids of all entries."""
+        return [self.external_id(index) for index in range(self._count)]
+
+
+class StatePublisher:
+    """Publishes feed state into a memory-mapped file for other processes.
+
+    Each version is written into the slot not holding the previous version
+    (double-buffering), and then made current by updating the header, so
+    that readers never see a partially written version. Slots grow as
+    needed. Place the file on a memory-backed file system (for example
+    `/dev/shm`) to share memory without writing to disk.
+    """
+
+    def __init__(self, path: str | os.PathLike, *, capacity: int = DEFAULT_CAPACITY):
+        """Initialise state publisher, creating or truncating the file."""
+        self._path = path
+        self._file = open(path, "w+b")  # noqa: SIM115
+        capacity = _align(max(capacity, COUNT.size))
+        self._slots = [
+            (HEADER_SIZE + index * capacity, capacity, 0, 0)
+            for index in range(SLOT_COUNT)
+        ]
+        self._size = HEADER_SIZE + SLOT_COUNT * capacity
+        self._file.truncate(self._size)
+        self._mmap = mmap.mmap(self._file.fileno(), self._size)
+        self._version = 0
+        self._write_header(0)
+
+    def __repr__(self):
+        """Return string representation of this publisher."""
+        return (
+            f"<{self.__class__.__name__}(path={self._path}, version={self._version})>"
+        )
+
+    def __enter__(self) -> Self:
+        """Enter the context of this publisher."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the file when leaving the context."""
+        self.close()
+
+    def _write_header(self, writing_version: int):
+        """Write the header and the slot table."""
+        for index, slot in enumerate(self._slots):
+            SLOT.pack_into(self._mmap, HEADER.size + index * SLOT.size, *slot)
+        HEADER.pack_into(
+            self._mmap, 0, MAGIC, LAYOUT_VERSION, writing_version, self._version
+        )
+
+    def _grow(self, index: int, length: int):
+        """Move the slot to the end of the file, with room for the length."""
+        capacity = _align(2 * length)
+        offset = self._size
+        self._size += capacity
+        self._mmap.close()
+        self._file.truncate(self._size)
+        self._mmap = mmap.mmap(self._file.fileno(), self._size)
+        self._slots[index] = (offset, capacity, 0, 0)
+        _LOGGER.debug("Grew slot %s of %s to %s bytes", index, self._path, capacity)
+
+    def publish(self, snapshot: FeedSnapshot) -> int:
+        """Publish the geometry columns and external ids, and return the version."""
+        data = _encode(snapshot)
+        version = self._version + 1
+        index = version % SLOT_COUNT
+        # Announce the slot is being overwritten before touching it.
+        self._write_header(version)
+        if len(data) > self._slots[index][1]:
+            self._grow(index, len(data))
+        offset, capacity, _, _ = self._slots[index]
+        self._mmap[offset : offset + len(data)] = data
+        self._slots[index] = (offset, capacity, len(data), version)
+        self._version = version
+        self._write_header(version)
+        return version
+
+    @property
+    def version(self) -> int:
+        """Return the last published version."""
+        return self._version
+
+    def close(self):
+        """Close the file."""
+        self._mmap.close()
+        self._file.close()
+
+
+class StateReader:
+    """Reads state published into a memory-mapped file by a `StatePublisher`."""
+
+    def __init__(self, path: str | os.PathLike):
+        """Initialise state reader."""
+        self._path = path
+        self._file = open(path, "rb")  # noqa: SIM115
+        try:
+            self._mmap = self._map()
+        except ValueError:
+            self._file.close()
+            raise
+
+    def __repr__(self):
+        """Return string representation of this reader."""
+        return f"<{self.__class__.__name__}(path={self._path})>"
+
+    def __enter__(self) -> Self:
+        """Enter the context of this reader."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the file when leaving the context."""
+        self.close()
+
+    def _map(self) -> mmap.mmap:
+        """Map the whole file read-only."""
+        mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, layout_version, _, _ = HEADER.unpack_from(mapped)
+        if magic != MAGIC or layout_version != LAYOUT_VERSION:
+            raise ValueError(f"Unsupported shared state in {self._path}")
+        return mapped
+
+    @property
+    def writing_version(self) -> int:
+        """Return the version the publisher is writing or wrote last."""
+        return HEADER.unpack_from(self._mmap)[2]
+
+    @property
+    def version(self) -> int:
+        """Return the last published version."""
+        return HEADER.unpack_from(self._mmap)[3]
+
+    def read(self) -> SharedState | None:
+        """Return a view of the last published version, or None if none yet.
+
+        The slot is only decoded if the publisher is not overwriting it, and
+        checked again afterwards, retrying while the publisher moves on.
+        """
+        while True:
+            _, _, writing_version, version = HEADER.unpack_from(self._mmap)
+            if version == 0:
+                return None
+            offset, _, length, slot_version = SLOT.unpack_from(
+                self._mmap, HEADER.size + (version % SLOT_COUNT) * SLOT.size
+            )
+            if slot_version != version or writing_version >= version + SLOT_COUNT:
+                # The publisher moved on while reading the header.
+                continue
+            if offset + length > len(self._mmap):
+                # The publisher grew the file. Views into the previous
+                # mapping keep it alive until they are released.
+                self._mmap = self._map()
+                continue
+            try:
+                state = SharedState(
+                    self, version, memoryview(self._mmap)[offset : offset + length]
+                )
+            except ValueError:
+                if HEADER.unpack_from(self._mmap)[2:] == (writing_version, version):
+                    # Not torn by the publisher.
+                    raise
+                continue
+            if state.valid:
+                return state
+            # The publisher moved on while decoding, try again.
+
+    def close(self):
+        """Close the file.
+
+        The mapping is released once no state views refer to it anymore.
+        """
+        self._file.close()
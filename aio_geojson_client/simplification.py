@@ -0,0 +1,153 @@
+"""Polygon simplification."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+
+from .distance_cache import geometry_fingerprint
+from .geometries import Point, Polygon
+from .spherical import EARTH_RADIUS_KM, angle_to_segment, to_unit_vector
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_VERTICES = 64
+DEFAULT_MAX_SIZE = 256
+# Vertices of the smallest closed ring, a triangle.
+MIN_RING_VERTICES = 4
+
+
+class SimplifiedPolygon:
+    """Polygon simplified within a tolerance of its full-resolution outline.
+
+    Every point of the full outline is within the tolerance of the simplified
+    outline and vice versa, so distances to the outlines differ by at most
+    the tolerance.
+    """
+
+    __slots__ = ("_polygon",)
+
+    def __init__(self, points: list[Point]):
+        """Initialise simplified polygon."""
+        self._polygon = Polygon(points)
+
+    def __repr__(self):
+        """Return string representation of this simplified polygon."""
+        return f"<{self.__class__.__name__}(vertices={len(self._polygon.points)})>"
+
+    def distance_to_outline(self, coordinates: tuple[float, float]) -> float:
+        """Calculate the distance in km between coordinates and the outline."""
+        return EARTH_RADIUS_KM * self._polygon.outline.angle_to(
+            to_unit_vector(*coordinates)
+        )
+
+    def is_inside(self, coordinates: tuple[float, float]) -> bool:
+        """Check if the coordinates are inside the simplified polygon."""
+        return self._polygon.is_inside(Point(*coordinates))
+
+    @property
+    def polygon(self) -> Polygon:
+        """Return the simplified polygon."""
+        return self._polygon
+
+
+class PolygonSimplifier:
+    """Simplifies large polygons once, within a tolerance in metres.
+
+    Polygons are simplified with the Douglas-Peucker algorithm using
+    great-circle distances, and kept in a bounded cache by fingerprint.
+    Polygons with fewer vertices than the minimum are not simplified.
+    """
+
+    def __init__(
+        self,
+        tolerance: float,
+        min_vertices: int = DEFAULT_MIN_VERTICES,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        """Initialise polygon simplifier."""
+        if tolerance <= 0:
+            raise ValueError(f"Invalid tolerance {tolerance}")
+        if min_vertices < MIN_RING_VERTICES:
+            raise ValueError(f"Invalid minimum number of vertices {min_vertices}")
+        self._tolerance = tolerance
+        self._min_vertices = min_vertices
+        self._max_size = max_size
+        self._simplified: OrderedDict[bytes, SimplifiedPolygon] = OrderedDict()
+
+    def __repr__(self):
+        """Return string representation of this simplifier."""
+        return f"<{self.__class__.__name__}(tolerance={self._tolerance})>"
+
+    def simplify(self, polygon: Polygon) -> SimplifiedPolygon | None:
+        """Return the simplified polygon, or None if it is small enough."""
+        if len(polygon.points) < self._min_vertices:
+            return None
+        fingerprint = geometry_fingerprint(polygon)
+        simplified = self._simplified.get(fingerprint)
+        if simplified is None:
+            simplified = self._simplify(polygon.points)
+            self._simplified[fingerprint] = simplified
+            if len(self._simplified) > self._max_size:
+                self._simplified.popitem(last=False)
+        else:
+            self._simplified.move_to_end(fingerprint)
+        return simplified
+
+    def _simplify(self, points: list[Point]) -> SimplifiedPolygon:
+        """Simplify the ring with the Douglas-Peucker algorithm."""
+        if len(points) < MIN_RING_VERTICES:
+            # Degenerate rings cannot be simplified.
+            return SimplifiedPolygon(list(points))
+        vectors = [to_unit_vector(point.latitude, point.longitude) for point in points]
+        tolerance = self._tolerance / 1000 / EARTH_RADIUS_KM
+        last = len(vectors) - 1
+        # Split the ring at its first vertex and the vertex furthest from it.
+        split = max(
+            range(1, last),
+            key=lambda index: angle_to_segment(vectors[index], vectors[0], vectors[0]),
+        )
+        keep = {0, split, last}
+        stack = [(0, split), (split, last)]
+        while stack:
+            first, end = stack.pop()
+            furthest, furthest_angle = None, tolerance
+            for index in range(first + 1, end):
+                vertex_angle = angle_to_segment(
+                    vectors[index], vectors[first], vectors[end]
+                )
+                if vertex_angle > furthest_angle:
+                    furthest, furthest_angle = index, vertex_angle
+            if furthest is not None:
+                keep.add(furthest)
+                stack.extend(((first, furthest), (furthest, end)))
+        indexes = sorted(keep)
+        _LOGGER.debug(
+            "Simplified polygon from %s to %s vertices", len(points), len(indexes)
+        )
+        return SimplifiedPolygon([points[index] for index in indexes])
+
+    def within_radius(
+        self, coordinates: tuple[float, float], polygon: Polygon, radius: float
+    ) -> bool | None:
+        """Check if the polygon is within the radius (in km) of the coordinates.
+
+        Return None if the simplified polygon is too close to the radius
+        boundary to decide, so that the full-resolution polygon is required.
+        """
+        simplified = self.simplify(polygon)
+        if simplified is None:
+            return None
+        tolerance = self._tolerance / 1000
+        distance = simplified.distance_to_outline(coordinates)
+        if distance + tolerance <= radius:
+            return True
+        if distance > tolerance and distance - tolerance > radius:
+            # Far enough from the outline for containment to be the same.
+            return simplified.is_inside(coordinates)
+        return None
+
+    @property
+    def tolerance(self) -> float:
+        """Return the tolerance in metres."""
+        return self._tolerance
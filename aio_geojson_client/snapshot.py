@@ -0,0 +1,151 @@
+"""Feed snapshot."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .feed_entry import FeedEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+COLUMN_EXTERNAL_ID = "external_id"
+COLUMN_LATITUDE = "latitude"
+COLUMN_LONGITUDE = "longitude"
+COLUMN_DISTANCE = "distance"
+COLUMN_MIN_LATITUDE = "min_latitude"
+COLUMN_MIN_LONGITUDE = "min_longitude"
+COLUMN_MAX_LATITUDE = "max_latitude"
+COLUMN_MAX_LONGITUDE = "max_longitude"
+
+# Numeric columns, in the order of the geometry summary of an entry.
+GEOMETRY_COLUMNS = (
+    COLUMN_LATITUDE,
+    COLUMN_LONGITUDE,
+    COLUMN_DISTANCE,
+    COLUMN_MIN_LATITUDE,
+    COLUMN_MIN_LONGITUDE,
+    COLUMN_MAX_LATITUDE,
+    COLUMN_MAX_LONGITUDE,
+)
+PROPERTY_COLUMN_PREFIX = "properties."
+
+
+def _posix_timestamp(value: Any) -> float:
+    """Convert a datetime to seconds since the epoch, or NaN."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return math.nan
+
+
+class FeedSnapshot:
+    """State of feed entries as columns.
+
+    Numeric columns (coordinates, distance to home, bounding box and
+    timestamps in seconds since the epoch) are arrays of doubles, with NaN
+    for missing values. The external ids and selected properties are lists.
+    Columns are built in one pass over the entries, wrapping the geometries
+    of each entry only once, and can be converted to NumPy arrays or an
+    Arrow table if these libraries are installed.
+    """
+
+    def __init__(self, columns: dict[str, array | list]):
+        """Initialise snapshot."""
+        self._columns = columns
+
+    def __repr__(self):
+        """Return string representation of this snapshot."""
+        return f"<{self.__class__.__name__}(entries={len(self)})>"
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._columns[COLUMN_EXTERNAL_ID])
+
+    def __getitem__(self, name: str) -> array | list:
+        """Return the column with the name."""
+        return self._columns[name]
+
+    @classmethod
+    def from_entries(
+        cls,
+        feed_entries: dict[str, FeedEntry],
+        properties: Iterable[str] = (),
+        *,
+        timestamps: Iterable[str] = (),
+    ) -> FeedSnapshot:
+        """Build a snapshot of the entries by external id.
+
+        Properties are columns named `properties.<name>`. Timestamps are the
+        names of datetime attributes of the entries, and columns of the same
+        name.
+        """
+        properties = tuple(properties)
+        timestamps = tuple(timestamps)
+        external_ids = []
+        geometry_columns = [array("d") for _ in GEOMETRY_COLUMNS]
+        property_columns: list[list] = [[] for _ in properties]
+        timestamp_columns = [array("d") for _ in timestamps]
+        nan = math.nan
+        for external_id, entry in feed_entries.items():
+            external_ids.append(external_id)
+            coordinates, distance, bounding_box = entry.geometry_summary()
+            values = (
+                *(coordinates or (nan, nan)),
+                distance if distance != math.inf else nan,
+                *(bounding_box or (nan, nan, nan, nan)),
+            )
+            for column, value in zip(geometry_columns, values, strict=True):
+                column.append(value)
+            entry_properties = entry.properties or {}
+            for column, name in zip(property_columns, properties, strict=True):
+                column.append(entry_properties.get(name))
+            for column, name in zip(timestamp_columns, timestamps, strict=True):
+                column.append(_posix_timestamp(getattr(entry, name, None)))
+        return cls(
+            {
+                COLUMN_EXTERNAL_ID: external_ids,
+                **dict(zip(GEOMETRY_COLUMNS, geometry_columns, strict=True)),
+                **{
+                    f"{PROPERTY_COLUMN_PREFIX}{name}": column
+                    for name, column in zip(properties, property_columns, strict=True)
+                },
+                **dict(zip(timestamps, timestamp_columns, strict=True)),
+            }
+        )
+
+    @property
+    def columns(self) -> dict[str, array | list]:
+        """Return the columns by name."""
+        return self._columns
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return the columns as NumPy arrays.
+
+        Numeric columns share the memory of the snapshot instead of copying.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        return {
+            name: np.frombuffer(column, dtype=np.float64)
+            if isinstance(column, array)
+            else np.array(column, dtype=object)
+            for name, column in self._columns.items()
+        }
+
+    def to_arrow(self) -> Any:
+        """Return the columns as an Arrow table."""
+        import pyarrow as pa  # noqa: PLC0415
+
+        return pa.table(
+            {
+                name: pa.array(column, type=pa.float64(), from_pandas=True)
+                if isinstance(column, array)
+                else pa.array(column)
+                for name, column in self._columns.items()
+            }
+        )
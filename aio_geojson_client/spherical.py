@@ -0,0 +1,142 @@
+"""Spherical geometry on unit vectors."""
+
+from __future__ import annotations
+
+import math
+
+# Mean earth radius in km, as used for distance calculations.
+EARTH_RADIUS_KM = 6371.0088
+
+Vector = tuple[float, float, float]
+
+
+def to_unit_vector(latitude: float, longitude: float) -> Vector:
+    """Convert coordinates in degrees to a unit vector."""
+    phi = math.radians(latitude)
+    lam = math.radians(longitude)
+    cos_phi = math.cos(phi)
+    return cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi)
+
+
+def _cross(a: Vector, b: Vector) -> Vector:
+    """Calculate the cross product."""
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _dot(a: Vector, b: Vector) -> float:
+    """Calculate the dot product."""
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def angle(a: Vector, b: Vector) -> float:
+    """Calculate the angle in radians between two unit vectors."""
+    cross = _cross(a, b)
+    return math.atan2(math.sqrt(_dot(cross, cross)), _dot(a, b))
+
+
+def angle_to_segment(point: Vector, a: Vector, b: Vector) -> float:
+    """Calculate the angle in radians between a point and the arc a-b.
+
+    This is the cross-track angle if the closest point on the great circle
+    through a and b lies on the arc, and the angle to the closer end
+    otherwise.
+    """
+    normal = _cross(a, b)
+    length = math.sqrt(_dot(normal, normal))
+    if length < 1e-15:
+        return angle(point, a)
+    sin_cross_track = _dot(point, normal) / length
+    # The closest point is on the arc if it is between the planes through
+    # a and b that are perpendicular to the great circle.
+    if _dot(_cross(a, point), normal) >= 0 and _dot(_cross(point, b), normal) >= 0:
+        return abs(math.asin(max(-1.0, min(1.0, sin_cross_track))))
+    return min(angle(point, a), angle(point, b))
+
+
+def arc_latitude_range(a: Vector, b: Vector) -> tuple[float, float]:
+    """Determine the minimum and maximum latitude in degrees along the arc a-b.
+
+    Great-circle arcs bulge towards the poles, beyond the latitudes of their
+    ends, if the point of the great circle closest to a pole is on the arc.
+    """
+    latitudes = [
+        math.degrees(math.asin(max(-1.0, min(1.0, a[2])))),
+        math.degrees(math.asin(max(-1.0, min(1.0, b[2])))),
+    ]
+    normal = _cross(a, b)
+    length = math.sqrt(_dot(normal, normal))
+    if length < 1e-15:
+        return min(latitudes), max(latitudes)
+    normal_z = normal[2] / length
+    horizontal = math.sqrt(max(0.0, 1.0 - normal_z * normal_z))
+    if horizontal < 1e-15:
+        # Along the equator.
+        return min(latitudes), max(latitudes)
+    # The north pole projected onto the plane of the great circle.
+    north = (
+        -normal_z * normal[0] / length / horizontal,
+        -normal_z * normal[1] / length / horizontal,
+        horizontal,
+    )
+    south = (-north[0], -north[1], -north[2])
+    latitudes.extend(
+        math.degrees(math.asin(extreme[2]))
+        for extreme in (north, south)
+        if _dot(_cross(a, extreme), normal) >= 0
+        and _dot(_cross(extreme, b), normal) >= 0
+    )
+    return min(latitudes), max(latitudes)
+
+
+class Outline:
+    """Outline of a geometry, precomputed for distance calculations.
+
+    The vertices are stored as unit vectors, and each edge as the normal of
+    its great circle and the normals of the planes bounding the arc. The
+    distance to the outline then only takes dot products per vertex and
+    edge.
+    """
+
+    __slots__ = ("_edges", "_vertices")
+
+    def __init__(self, vertices: list[Vector]):
+        """Initialise outline."""
+        self._vertices = vertices
+        self._edges: list[tuple[Vector, Vector, Vector]] = []
+        for index in range(1, len(vertices)):
+            a, b = vertices[index - 1], vertices[index]
+            normal = _cross(a, b)
+            length = math.sqrt(_dot(normal, normal))
+            # Skip repeated vertices, which are covered by the vertices.
+            if length < 1e-15:
+                continue
+            normal = (normal[0] / length, normal[1] / length, normal[2] / length)
+            self._edges.append((normal, _cross(normal, a), _cross(b, normal)))
+
+    @classmethod
+    def from_coordinates(cls, coordinates: list[tuple[float, float]]) -> Outline:
+        """Create outline from (latitude, longitude) coordinates in degrees."""
+        return cls([to_unit_vector(*vertex) for vertex in coordinates])
+
+    def angle_to(self, point: Vector) -> float:
+        """Calculate the angle in radians between a unit vector and this outline."""
+        x, y, z = point
+        closest_vertex = max(
+            self._vertices, key=lambda v: x * v[0] + y * v[1] + z * v[2]
+        )
+        distance = angle(point, closest_vertex)
+        sin_distance = math.sin(distance) if distance < math.pi / 2 else 1.0
+        for normal, start, end in self._edges:
+            sin_cross_track = abs(x * normal[0] + y * normal[1] + z * normal[2])
+            if (
+                sin_cross_track < sin_distance
+                and x * start[0] + y * start[1] + z * start[2] >= 0
+                and x * end[0] + y * end[1] + z * end[2] >= 0
+            ):
+                sin_distance = sin_cross_track
+                distance = math.asin(sin_cross_track)
+        return distance
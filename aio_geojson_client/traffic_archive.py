@@ -0,0 +1,139 @@
+"""Traffic archive."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import struct
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Length of the header preceding each response in an archive file.
+HEADER_LENGTH = struct.Struct(">I")
+
+
+class RecordedResponse:
+    """Response recorded at an offset in seconds from the start of recording."""
+
+    __slots__ = ("body", "elapsed", "headers", "offset", "status", "url")
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        *,
+        offset: float,
+        elapsed: float,
+    ):
+        """Initialise recorded response."""
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.offset = offset
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        """Return string representation of this response."""
+        return f"<{self.__class__.__name__}(url={self.url}, status={self.status}, offset={self.offset:.3f})>"
+
+
+class TrafficArchive:
+    """Responses received by feeds, for replaying them later.
+
+    Feeds record every response with its status, headers, raw body and
+    latency. Archives are saved as gzip-compressed files, in which each
+    response is a JSON header followed by the raw body.
+    """
+
+    def __init__(self, responses: list[RecordedResponse] | None = None):
+        """Initialise traffic archive."""
+        self._responses = responses or []
+        self._start: float | None = None
+
+    def __repr__(self):
+        """Return string representation of this archive."""
+        return f"<{self.__class__.__name__}(responses={len(self._responses)})>"
+
+    def __len__(self) -> int:
+        """Return the number of recorded responses."""
+        return len(self._responses)
+
+    def record(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        elapsed: float,
+    ):
+        """Record a response that took the elapsed seconds."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now - elapsed
+        self._responses.append(
+            RecordedResponse(
+                url,
+                status,
+                headers,
+                body,
+                offset=now - elapsed - self._start,
+                elapsed=elapsed,
+            )
+        )
+
+    @property
+    def responses(self) -> list[RecordedResponse]:
+        """Return the recorded responses in order."""
+        return self._responses
+
+    @property
+    def duration(self) -> float:
+        """Return the seconds between the first and last request."""
+        if not self._responses:
+            return 0.0
+        return self._responses[-1].offset - self._responses[0].offset
+
+    def save(self, path: str | os.PathLike):
+        """Save the recorded responses to a file."""
+        with gzip.open(path, "wb") as file:
+            for response in self._responses:
+                header = json.dumps(
+                    {
+                        "url": response.url,
+                        "status": response.status,
+                        "headers": response.headers,
+                        "offset": response.offset,
+                        "elapsed": response.elapsed,
+                        "length": len(response.body),
+                    }
+                ).encode("utf-8")
+                file.write(HEADER_LENGTH.pack(len(header)))
+                file.write(header)
+                file.write(response.body)
+        _LOGGER.debug("Saved %s responses to %s", len(self._responses), path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> TrafficArchive:
+        """Load recorded responses from a file."""
+        responses = []
+        with gzip.open(path, "rb") as file:
+            while prefix := file.read(HEADER_LENGTH.size):
+                (length,) = HEADER_LENGTH.unpack(prefix)
+                header = json.loads(file.read(length))
+                responses.append(
+                    RecordedResponse(
+                        header["url"],
+                        header["status"],
+                        header["headers"],
+                        file.read(header["length"]),
+                        offset=header["offset"],
+                        elapsed=header["elapsed"],
+                    )
+                )
+        return cls(responses)
@@ -0,0 +1 @@
+"""Benchmarks for aio-geojson-client library."""
@@ -0,0 +1,101 @@
+"""Benchmark of the memory retained by feed entries.
+
+Run with `python -m benchmarks.entry_memory`.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+
+import geojson
+
+from aio_geojson_client.feed_entry import FeedEntry
+
+ENTRIES = 10000
+POLYGON_VERTICES = 50
+
+
+class BenchmarkFeedEntry(FeedEntry):
+    """Feed entry reading a title and a category."""
+
+    _detached_properties = ("title", "category")
+
+    @property
+    def title(self) -> str | None:
+        """Return the title of this entry."""
+        return self._search_in_properties("title")
+
+    @property
+    def external_id(self) -> str | None:
+        """Return the external id of this entry."""
+        return self._search_in_feature("id")
+
+
+def _document() -> str:
+    """Create a feed with large properties and polygon geometries."""
+    features = []
+    for index in range(ENTRIES):
+        latitude, longitude = -37.0 + index * 0.0001, 150.0
+        features.append(
+            {
+                "type": "Feature",
+                "id": str(index),
+                "geometry": {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "Point", "coordinates": [longitude, latitude]},
+                        {
+                            "type": "Polygon",
+                            "coordinates": [
+                                [
+                                    [longitude + vertex * 0.001, latitude]
+                                    for vertex in range(POLYGON_VERTICES)
+                                ]
+                            ],
+                        },
+                    ],
+                },
+                "properties": {
+                    "title": f"Title {index}",
+                    "category": "Bushfire",
+                    "description": f"Description {index} " * 20,
+                    "tags": [f"tag{tag}" for tag in range(10)],
+                },
+            }
+        )
+    return json.dumps({"type": "FeatureCollection", "features": features})
+
+
+def _retained_memory(document: str, detach: bool) -> int:
+    """Measure the memory retained by entries after the document is freed."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    feed = geojson.loads(document)
+    entries = [BenchmarkFeedEntry((-37.0, 150.0), feature) for feature in feed.features]
+    if detach:
+        for entry in entries:
+            entry.detach()
+    del feed
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    assert len(entries) == ENTRIES
+    return retained
+
+
+def main():
+    """Run the benchmark."""
+    document = _document()
+    for detach in (False, True):
+        retained = _retained_memory(document, detach)
+        print(  # noqa: T201
+            f"{'detached' if detach else 'attached'}: "
+            f"{retained / 1024 / 1024:.1f} MiB per {ENTRIES} entries"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of the time it takes to import the library.
+
+Run with `python -m benchmarks.import_time`. Exits with an error if a
+dependency that should be loaded lazily is imported, or if the import takes
+longer than the optional budget in milliseconds (`--budget 50`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "aio_geojson_client.feed",
+    "aio_geojson_client.feed_manager",
+    "aio_geojson_client.composite_feed",
+)
+# Dependencies only loaded once fetching or calculating distances.
+LAZY_DEPENDENCIES = ("aiohttp", "geojson", "haversine")
+RUNS = 5
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import the module in a new interpreter, and return cumulative times in µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget", type=float, help="maximum import time in ms")
+    args = parser.parse_args()
+    failed = False
+    for module in MODULES:
+        runs = [_import_times(module) for _ in range(RUNS)]
+        milliseconds = statistics.median(run[module] for run in runs) / 1000
+        loaded = [name for name in LAZY_DEPENDENCIES if name in runs[0]]
+        print(  # noqa: T201
+            f"{module}: {milliseconds:.1f} ms"
+            + (f", loads {', '.join(loaded)}" if loaded else "")
+        )
+        if loaded or (args.budget is not None and milliseconds > args.budget):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
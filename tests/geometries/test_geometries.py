@@ -59,6 +59,8 @@ def test_polygon_equality():
         ]
     )
     assert polygon1 == polygon2
+    assert hash(polygon1) == hash(polygon2)
+    assert len({polygon1, polygon2}) == 1
 
 
 def test_point_in_polygon_1():
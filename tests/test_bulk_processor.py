@@ -0,0 +1,60 @@
+"""Test for the bulk processor."""
+
+from functools import partial
+
+from aio_geojson_client.bulk_processor import BulkProcessor
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_geojson_client.filter_definition import GeoJsonFeedFilterDefinition
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+HOME_COORDINATES = (-37.0, 150.0)
+
+
+def test_process():
+    """Test processing local documents with a feed."""
+    feed = MockGeoJsonFeed(None, HOME_COORDINATES, "", filter_radius=90.0)
+    document = load_fixture("generic_feed_1.json")
+    status, entries = feed.process(document)
+    assert status == UPDATE_OK
+    assert len(entries) == 4
+    status, entries = feed.process(document.encode("utf-8"), nearest=1)
+    assert status == UPDATE_OK
+    assert len(entries) == 1
+    status, entries = feed.process(
+        memoryview(document.encode("utf-8")),
+        GeoJsonFeedFilterDefinition(radius=10000.0),
+    )
+    assert status == UPDATE_OK
+    assert len(entries) == 5
+    status, entries = feed.process("NOT JSON")
+    assert status == UPDATE_ERROR
+    assert entries is None
+
+
+def test_bulk_processor(tmp_path):
+    """Test processing files and buffers across processes, in order."""
+    fixtures = ["generic_feed_1.json", "generic_feed_3.json"] * 3
+    paths = []
+    for index, fixture in enumerate(fixtures):
+        path = tmp_path / f"snapshot_{index}.json"
+        path.write_text(load_fixture(fixture), encoding="utf-8")
+        paths.append(path)
+    (tmp_path / "empty.json").touch()
+    paths.extend([tmp_path / "empty.json", tmp_path / "missing.json"])
+    feed_factory = partial(
+        MockGeoJsonFeed, None, HOME_COORDINATES, "", filter_radius=90.0
+    )
+    with BulkProcessor(feed_factory, max_workers=2) as processor:
+        results = list(processor.process_files(paths))
+        assert [status for status, _ in results] == [UPDATE_OK] * 6 + [UPDATE_ERROR] * 2
+        expected = MockGeoJsonFeed(None, HOME_COORDINATES, "", filter_radius=90.0)
+        for fixture, (_, entries) in zip(fixtures, results, strict=False):
+            _, expected_entries = expected.process(load_fixture(fixture))
+            assert [entry.external_id for entry in entries] == [
+                entry.external_id for entry in expected_entries
+            ]
+        buffers = [load_fixture(fixture).encode("utf-8") for fixture in fixtures]
+        assert [len(entries) for _, entries in processor.process_buffers(buffers)] == [
+            len(entries) for _, entries in results[:6]
+        ]
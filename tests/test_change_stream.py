@@ -0,0 +1,137 @@
+"""Test for the change stream."""
+
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.change_stream import (
+    ChangeSubscription,
+    EntryCreatedEvent,
+    EntryRemovedEvent,
+    EntryUpdatedEvent,
+    StatusEvent,
+)
+from aio_geojson_client.consts import OVERFLOW_COALESCE, OVERFLOW_DROP_OLDEST, UPDATE_OK
+from aio_geojson_client.feed_manager import FeedManagerBase
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+async def _noop(external_id):
+    """Ignore callback."""
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_changes(mock_aiointercept):
+    """Test consuming changes from the feed manager."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+        feed_manager = FeedManagerBase(feed, _noop, _noop, _noop)
+        changes = feed_manager.changes(max_size=2)
+        events = []
+
+        async def _consume():
+            async for event in changes:
+                events.append(event)
+                if isinstance(event, StatusEvent) and len(events) > 6:
+                    break
+
+        consumer = asyncio.create_task(_consume())
+        await feed_manager.update()
+        await feed_manager.update()
+        await consumer
+
+        assert [type(event) for event in events[:6]] == [EntryCreatedEvent] * 5 + [
+            StatusEvent
+        ]
+        assert events[5].status_update.status == UPDATE_OK
+        assert events[5].status_update.created == 5
+        removed = [event for event in events if isinstance(event, EntryRemovedEvent)]
+        assert {event.external_id for event in removed} == {
+            "Title 3",
+            hash((-37.8901, 149.7890)),
+            "7890",
+        }
+        assert all(event.entry is not None for event in removed)
+        updated = [event for event in events if isinstance(event, EntryUpdatedEvent)]
+        assert {event.external_id for event in updated} == {"3456", "4567"}
+        assert changes.delivered == len(events)
+        assert changes.max_lag == 2
+        assert changes.dropped == 0
+
+        await changes.close()
+        assert changes.closed
+        # Closed subscriptions do not receive events anymore.
+        await feed_manager.update()
+        assert changes.lag == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    """Test dropping oldest events on overflow."""
+    subscription = ChangeSubscription(max_size=2, overflow=OVERFLOW_DROP_OLDEST)
+    for external_id in ("1", "2", "3"):
+        await subscription.publish(EntryCreatedEvent(external_id, None))
+    assert subscription.lag == 2
+    assert subscription.dropped == 1
+    await subscription.close()
+    events = [event async for event in subscription]
+    assert [event.external_id for event in events] == ["2", "3"]
+    assert subscription.lag == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce():
+    """Test coalescing events for the same external id."""
+    async with ChangeSubscription(max_size=10, overflow=OVERFLOW_COALESCE) as sub:
+        await sub.publish(EntryCreatedEvent("1", None))
+        await sub.publish(EntryUpdatedEvent("1", None))
+        await sub.publish(EntryCreatedEvent("2", None))
+        await sub.publish(EntryRemovedEvent("2", None))
+        await sub.publish(EntryRemovedEvent("3", None))
+        await sub.publish(EntryCreatedEvent("3", None))
+        await sub.publish(EntryUpdatedEvent("4", None))
+        await sub.publish(EntryRemovedEvent("4", None))
+        assert sub.coalesced == 4
+    events = [event async for event in sub]
+    assert [(type(event), event.external_id) for event in events] == [
+        (EntryCreatedEvent, "1"),
+        (EntryUpdatedEvent, "3"),
+        (EntryRemovedEvent, "4"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_block_until_consumed():
+    """Test backpressure when the queue is full."""
+    subscription = ChangeSubscription(max_size=1)
+    await subscription.publish(EntryCreatedEvent("1", None))
+    producer = asyncio.create_task(subscription.publish(EntryCreatedEvent("2", None)))
+    await asyncio.sleep(0)
+    assert not producer.done()
+    assert (await anext(subscription)).external_id == "1"
+    await producer
+    assert subscription.lag == 1
+    assert repr(subscription) == "<ChangeSubscription(overflow=block, lag=1)>"
+
+
+def test_invalid_configuration():
+    """Test invalid subscription configuration."""
+    with pytest.raises(ValueError, match="Invalid maximum size"):
+        ChangeSubscription(max_size=0)
+    with pytest.raises(ValueError, match="Invalid overflow policy"):
+        ChangeSubscription(overflow="unknown")
@@ -0,0 +1,45 @@
+"""Test for the circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from aio_geojson_client.circuit_breaker import CircuitBreaker
+
+
+def test_circuit_breaker():
+    """Test opening and closing the circuit of a host."""
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+    with patch("aio_geojson_client.circuit_breaker.time.monotonic") as mock_time:
+        mock_time.return_value = 100.0
+        assert circuit_breaker.allow_request("test.url")
+        circuit_breaker.record_failure("test.url")
+        assert circuit_breaker.allow_request("test.url")
+        circuit_breaker.record_failure("test.url")
+        assert circuit_breaker.is_open("test.url")
+        assert not circuit_breaker.allow_request("test.url")
+        # Other hosts are not affected.
+        assert circuit_breaker.allow_request("other.url")
+        # After the recovery timeout, only a single trial request is allowed.
+        mock_time.return_value = 130.0
+        assert circuit_breaker.allow_request("test.url")
+        assert not circuit_breaker.allow_request("test.url")
+        # Trial request failed.
+        circuit_breaker.record_failure("test.url")
+        assert not circuit_breaker.allow_request("test.url")
+        mock_time.return_value = 160.0
+        assert circuit_breaker.allow_request("test.url")
+        # Trial request succeeded.
+        circuit_breaker.record_success("test.url")
+        assert not circuit_breaker.is_open("test.url")
+        assert circuit_breaker.allow_request("test.url")
+    assert (
+        repr(circuit_breaker)
+        == "<CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)>"
+    )
+
+
+def test_invalid_configuration():
+    """Test invalid circuit breaker configuration."""
+    with pytest.raises(ValueError, match="Invalid failure threshold"):
+        CircuitBreaker(failure_threshold=0)
@@ -0,0 +1,200 @@
+"""Test for the composite geojson feed."""
+
+import asyncio
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.composite_feed import CompositeGeoJsonFeed
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_geojson_client.feed_manager import FeedManagerBase
+from aio_geojson_client.filter_definition import GeoJsonFeedFilterDefinition
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_update(mock_aiointercept):
+    """Test merging entries from several feeds."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+    mock_aiointercept.get(
+        "http://test1.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+    mock_aiointercept.get(
+        "http://test1.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed1 = MockGeoJsonFeed(
+            websession, home_coordinates, "http://test1.url/testpath"
+        )
+        feed2 = MockGeoJsonFeed(
+            websession, home_coordinates, "http://test2.url/testpath"
+        )
+        feed = CompositeGeoJsonFeed([feed1, feed2])
+        assert repr(feed).startswith("<CompositeGeoJsonFeed(feeds=[<MockGeoJsonFeed(")
+
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 6
+        # First feed takes precedence.
+        assert entries[0].title == "Title 1"
+        assert entries[5].external_id == "8901"
+        assert feed.last_timestamp is None
+
+        # Failing feed only loses its own entries.
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == ["3456", "4567", "8901"]
+        assert entries[0].title == "Title 1 UPDATED"
+
+        # All feeds failing.
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_override_with_dedupe_distance(mock_aiointercept):
+    """Test deduplicating entries by proximity."""
+    home_coordinates = (-37.0, 150.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed1 = MockGeoJsonFeed(
+            websession, home_coordinates, "http://test1.url/testpath"
+        )
+        feed2 = MockGeoJsonFeed(
+            websession, home_coordinates, "http://test2.url/testpath"
+        )
+        feed = CompositeGeoJsonFeed([feed1, feed2], dedupe_distance=80.0)
+        status, entries = await feed.update_override(
+            filter_overrides=GeoJsonFeedFilterDefinition(radius=500.0)
+        )
+        assert status == UPDATE_OK
+        # Entries at the same location within one feed are kept, but the
+        # entry of the second feed near an entry of the first is removed.
+        assert [entry.external_id for entry in entries] == [
+            "3456",
+            "4567",
+            "Title 3",
+            hash((-37.8901, 149.7890)),
+            "7890",
+        ]
+        # Unsupported overrides are raised instead of failing each feed.
+        with pytest.raises(ValueError, match="must override _entry_timestamp"):
+            await feed.update_override(
+                filter_overrides=GeoJsonFeedFilterDefinition(
+                    time_window=(datetime(2024, 1, 1), None)
+                )
+            )
+        assert sum(map(len, mock_aiointercept.requests.values())) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_no_data_and_exception(mock_aiointercept):
+    """Test feeds without new data keep their previous entries."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed1 = MockGeoJsonFeed(
+            websession, home_coordinates, "http://test1.url/testpath"
+        )
+        feed2 = MockGeoJsonFeed(
+            websession, home_coordinates, "http://test2.url/testpath"
+        )
+        feed = CompositeGeoJsonFeed([feed1, feed2])
+        status, entries = await feed.update()
+        assert len(entries) == 6
+
+        with (
+            patch.object(feed1, "update", new_callable=AsyncMock) as mock_update1,
+            patch.object(feed2, "update", new_callable=AsyncMock) as mock_update2,
+        ):
+            mock_update1.return_value = (UPDATE_OK_NO_DATA, None)
+            mock_update2.return_value = (UPDATE_OK_NO_DATA, None)
+            status, entries = await feed.update()
+            assert status == UPDATE_OK_NO_DATA
+            assert entries is None
+
+            mock_update2.side_effect = ValueError("Bad feed")
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 5
+
+
+@pytest.mark.asyncio
+async def test_feed_manager(mock_aiointercept):
+    """Test the feed manager with a composite feed."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+    generated_entity_external_ids = []
+
+    async def _generate_entity(external_id):
+        """Generate new entity."""
+        generated_entity_external_ids.append(external_id)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = CompositeGeoJsonFeed(
+            [
+                MockGeoJsonFeed(
+                    websession, home_coordinates, "http://test1.url/testpath"
+                ),
+                MockGeoJsonFeed(
+                    websession, home_coordinates, "http://test2.url/testpath"
+                ),
+            ]
+        )
+        feed_manager = FeedManagerBase(feed, _generate_entity, AsyncMock(), AsyncMock())
+        await feed_manager.update()
+        assert len(feed_manager.feed_entries) == 6
+        assert len(generated_entity_external_ids) == 6
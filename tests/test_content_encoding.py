@@ -0,0 +1,69 @@
+"""Test for the content encoding."""
+
+import gzip
+from unittest.mock import patch
+import zlib
+
+import pytest
+
+from aio_geojson_client.content_encoding import ContentNegotiation
+
+BODY = b'{"type": "FeatureCollection", "features": []}' * 100
+
+
+def _decode(negotiation: ContentNegotiation, encoding: str, data: bytes) -> bytes:
+    """Decode data in small chunks."""
+    decoder = negotiation.decoder(encoding)
+    chunks = [
+        decoder.decompress(data[index : index + 7]) for index in range(0, len(data), 7)
+    ]
+    return b"".join([*chunks, decoder.flush()])
+
+
+def test_accept_encoding():
+    """Test the Accept-Encoding header in order of preference."""
+    with patch("importlib.util.find_spec", return_value=None):
+        negotiation = ContentNegotiation()
+        assert negotiation.encodings == ["gzip"]
+        assert negotiation.accept_encoding == "gzip"
+        assert repr(negotiation) == "<ContentNegotiation(encodings=['gzip'])>"
+    with patch("importlib.util.find_spec", return_value=object()):
+        negotiation = ContentNegotiation(["zstd", "br", "gzip", "identity"])
+        assert (
+            negotiation.accept_encoding
+            == "zstd, br;q=0.75, gzip;q=0.5, identity;q=0.25"
+        )
+    assert ContentNegotiation([]).accept_encoding == "identity"
+    with pytest.raises(ValueError, match="Unsupported content encoding"):
+        ContentNegotiation(["compress"])
+
+
+def test_decoder():
+    """Test decoding bodies incrementally."""
+    negotiation = ContentNegotiation(["gzip", "deflate"])
+    assert _decode(negotiation, "gzip", gzip.compress(BODY)) == BODY
+    assert _decode(negotiation, "GZIP ", gzip.compress(BODY)) == BODY
+    assert _decode(negotiation, "deflate", zlib.compress(BODY)) == BODY
+    assert _decode(negotiation, None, BODY) == BODY
+    assert repr(negotiation.decoder("gzip")) == "<ContentDecoder(encoding=gzip)>"
+    with pytest.raises(ValueError, match="Invalid gzip content"):
+        _decode(negotiation, "gzip", BODY)
+    with pytest.raises(ValueError, match="Unsupported content encoding br"):
+        negotiation.decoder("br")
+
+
+@pytest.mark.parametrize(
+    ("encoding", "module_name", "compress"),
+    [
+        ("br", "brotli", "compress"),
+        ("zstd", "zstandard", "compress"),
+    ],
+)
+def test_library_decoder(encoding, module_name, compress):
+    """Test decoding bodies with optional libraries."""
+    module = pytest.importorskip(module_name)
+    negotiation = ContentNegotiation([encoding])
+    assert negotiation.encodings == [encoding]
+    assert _decode(negotiation, encoding, getattr(module, compress)(BODY)) == BODY
+    with pytest.raises(ValueError, match=f"Invalid {encoding} content"):
+        _decode(negotiation, encoding, b"not compressed" * 10)
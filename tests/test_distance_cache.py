@@ -0,0 +1,118 @@
+"""Test for the distance cache."""
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.consts import UPDATE_OK
+from aio_geojson_client.distance_cache import DistanceCache, geometry_fingerprint
+from aio_geojson_client.geojson_distance_helper import GeoJsonDistanceHelper
+from aio_geojson_client.geometries.geometry import Geometry
+from aio_geojson_client.geometries.point import Point
+from aio_geojson_client.geometries.polygon import Polygon
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+POLYGON = [
+    Point(-30.0, 151.0),
+    Point(-30.0, 151.5),
+    Point(-30.5, 151.5),
+    Point(-30.5, 151.0),
+    Point(-30.0, 151.0),
+]
+
+
+def test_geometry_fingerprint():
+    """Test fingerprints only depend on coordinates."""
+    assert geometry_fingerprint(Point(-30.0, 151.0)) == geometry_fingerprint(
+        Point(-30.0, 151.0)
+    )
+    assert geometry_fingerprint(Point(-30.0, 151.0)) != geometry_fingerprint(
+        Point(151.0, -30.0)
+    )
+    assert geometry_fingerprint(Polygon(list(POLYGON))) == geometry_fingerprint(
+        Polygon(list(POLYGON))
+    )
+    assert geometry_fingerprint(Polygon(POLYGON[:1])) != geometry_fingerprint(
+        POLYGON[0]
+    )
+    assert geometry_fingerprint(Geometry()) is None
+
+
+def test_distance_cache():
+    """Test caching distances and containment."""
+    cache = DistanceCache(max_size=3)
+    home_coordinates = (-31.0, 150.0)
+    assert cache.hit_rate is None
+    distance = cache.distance_to_geometry(home_coordinates, Polygon(list(POLYGON)))
+    assert distance == pytest.approx(
+        GeoJsonDistanceHelper.distance_to_geometry(
+            home_coordinates, Polygon(list(POLYGON))
+        )
+    )
+    # Distance and containment are cached.
+    assert len(cache) == 2
+    assert cache.misses == 2
+    with patch.object(GeoJsonDistanceHelper, "distance_to_outline") as mock_outline:
+        assert cache.distance_to_geometry(
+            home_coordinates, Polygon(list(POLYGON))
+        ) == pytest.approx(distance)
+        mock_outline.assert_not_called()
+    assert cache.hits == 1
+    assert not cache.is_inside(home_coordinates, Polygon(list(POLYGON)))
+    assert cache.hits == 2
+    assert cache.distance_to_geometry((-30.2, 151.2), Polygon(list(POLYGON))) == 0.0
+    # Least recently used results are evicted.
+    assert len(cache) == 3
+    assert cache.hit_rate == pytest.approx(2 / 6)
+    assert repr(cache) == "<DistanceCache(size=3, max_size=3)>"
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+
+
+def test_invalid_configuration():
+    """Test invalid cache configuration."""
+    with pytest.raises(ValueError, match="Invalid maximum size"):
+        DistanceCache(max_size=0)
+
+
+@pytest.mark.asyncio
+async def test_update_with_distance_cache(mock_aiointercept):
+    """Test feeds share the distance cache across updates."""
+    home_coordinates = (-37.0, 150.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        cache = DistanceCache()
+        feed1 = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            filter_radius=90.0,
+            distance_cache=cache,
+        )
+        feed2 = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            filter_radius=90.0,
+            distance_cache=cache,
+        )
+        status, entries = await feed1.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 4
+        misses = cache.misses
+        assert misses > 0
+        status, entries = await feed2.update()
+        assert len(entries) == 4
+        assert round(abs(entries[0].distance_to_home - 82.0), 1) == 0
+        assert cache.misses == misses
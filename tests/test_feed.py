@@ -1,18 +1,24 @@
 """Test for the generic geojson feed."""
 
 import asyncio
+import gzip
 from http import HTTPStatus
-from unittest.mock import MagicMock
+import random
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 from aiohttp import ClientOSError
+import geojson
 import pytest
 
-from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_geojson_client.circuit_breaker import CircuitBreaker
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_geojson_client.feed import GeoJsonFeed
 from aio_geojson_client.filter_definition import GeoJsonFeedFilterDefinition
 from aio_geojson_client.geometries.point import Point
 from aio_geojson_client.geometries.polygon import Polygon
-from tests import MockGeoJsonFeed
+from aio_geojson_client.retry_policy import RetryPolicy
+from tests import MockFeedEntry, MockGeoJsonFeed
 from tests.utils import load_fixture
 
 
@@ -275,3 +281,462 @@ async def test_unsupported_object(mock_aiointercept, caplog):
             "Unsupported GeoJSON object found: <class 'geojson.geometry.Point'>"
             in caplog.text
         )
+
+
+@pytest.mark.asyncio
+async def test_update_with_retry(mock_aiointercept):
+    """Test retrying transient errors."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.SERVICE_UNAVAILABLE
+    )
+    mock_aiointercept.get("http://test.url/testpath", exception=True)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0.0),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+
+
+@pytest.mark.asyncio
+async def test_update_with_retry_not_transient(mock_aiointercept):
+    """Test client errors are not retried."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get("http://test.url/testpath", status=HTTPStatus.NOT_FOUND)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0.0),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_with_circuit_breaker(mock_aiointercept):
+    """Test failing fast while the host is unavailable."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+        feed1 = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            retry_policy=RetryPolicy(max_retries=5, base_delay=0.0),
+            circuit_breaker=circuit_breaker,
+        )
+        feed2 = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            circuit_breaker=circuit_breaker,
+        )
+        status, entries = await feed1.update()
+        assert status == UPDATE_ERROR
+        assert circuit_breaker.is_open("test.url")
+        # Circuit opened after 3 failures, remaining retries failed fast.
+        assert sum(map(len, mock_aiointercept.requests.values())) == 3
+        # Other feeds for the same host also fail fast.
+        status, entries = await feed2.update()
+        assert status == UPDATE_ERROR
+        assert sum(map(len, mock_aiointercept.requests.values())) == 3
+
+
+def test_retry_policy():
+    """Test retry delays."""
+    retry_policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+    assert [retry_policy.delay(attempt) for attempt in range(5)] == [
+        1.0,
+        2.0,
+        4.0,
+        5.0,
+        5.0,
+    ]
+    retry_policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert all(0.0 <= retry_policy.delay(attempt) <= 5.0 for attempt in range(5))
+    assert (
+        repr(retry_policy)
+        == "<RetryPolicy(max_retries=3, base_delay=1.0, max_delay=5.0)>"
+    )
+    with pytest.raises(ValueError, match="Invalid number of retries"):
+        RetryPolicy(max_retries=-1)
+
+
+@pytest.mark.asyncio
+async def test_update_nearest(mock_aiointercept):
+    """Test selecting the entries closest to home."""
+    home_coordinates = (-37.0, 150.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+        status, entries = await feed.update(nearest=2)
+        assert status == UPDATE_OK
+        assert [entry.title for entry in entries] == ["Title 2", "Title 1"]
+        status, entries = await feed.update_override(
+            filter_overrides=GeoJsonFeedFilterDefinition(radius=80.0), nearest=3
+        )
+        assert [entry.title for entry in entries] == ["Title 2"]
+
+
+def test_select_nearest():
+    """Test nearest selection matches sorting all entries by distance."""
+    rng = random.Random(3)
+    entries = []
+    for _ in range(200):
+        latitude, longitude = rng.uniform(-40.0, -30.0), rng.uniform(145.0, 155.0)
+        if rng.random() < 0.5:
+            geometry = {"type": "Point", "coordinates": [longitude, latitude]}
+        else:
+            size = rng.uniform(0.01, 1.0)
+            geometry = {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        [longitude, latitude],
+                        [longitude + size, latitude],
+                        [longitude + size, latitude + size],
+                        [longitude, latitude],
+                    ]
+                ],
+            }
+        entries.append(
+            MockFeedEntry(
+                (-35.0, 150.0), geojson.Feature(geometry=geometry, properties={})
+            )
+        )
+    expected = sorted(entries, key=lambda entry: entry.distance_to_home)[:10]
+    distances = {id(entry): entry.distance_to_home for entry in entries}
+    calculated = []
+
+    def distance_to_home(entry):
+        calculated.append(entry)
+        return distances[id(entry)]
+
+    with patch.object(MockFeedEntry, "distance_to_home", property(distance_to_home)):
+        selected = GeoJsonFeed.select_nearest(entries, 10)
+    assert selected == expected
+    # Exact distances are only calculated for a fraction of the entries.
+    assert len(calculated) < len(entries) / 2
+    assert GeoJsonFeed.select_nearest(entries, 0) == []
+    assert len(GeoJsonFeed.select_nearest(entries[:5], 10)) == 5
+
+
+class MockIncrementalGeoJsonFeed(MockGeoJsonFeed):
+    """Mock geojson feed with timestamps per feature."""
+
+    def _feature_timestamp(self, feature):
+        """Determine when the feature was last updated."""
+        return feature.properties.get("updated")
+
+
+def _incremental_feed(updated: list[int]) -> str:
+    """Create a feed with the features' update timestamps."""
+    return geojson.dumps(
+        geojson.FeatureCollection(
+            [
+                geojson.Feature(
+                    id=str(index),
+                    geometry=geojson.Point((150.0 + index * 0.5, -37.0)),
+                    properties={"title": f"Title {index}", "updated": timestamp},
+                )
+                for index, timestamp in enumerate(updated)
+            ]
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_incremental(mock_aiointercept):
+    """Test carrying over entries that have not been updated."""
+    home_coordinates = (-37.0, 150.0)
+    for updated in ([1, 1, 1], [1, 2, 1], [1, 2, 1]):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=_incremental_feed(updated),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockIncrementalGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            filter_radius=50.0,
+            incremental=True,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.title for entry in entries] == ["Title 0", "Title 1"]
+        first_entries = entries
+
+        with patch.object(
+            MockIncrementalGeoJsonFeed,
+            "_new_entry",
+            side_effect=lambda home, feature, global_data: MockFeedEntry(home, feature),
+        ) as mock_new_entry:
+            status, entries = await feed.update()
+            # Only the updated feature was rebuilt.
+            assert mock_new_entry.call_count == 1
+            assert entries[0] is first_entries[0]
+            assert entries[1] is not first_entries[1]
+            assert [entry.title for entry in entries] == ["Title 0", "Title 1"]
+
+            # Changed filter criteria apply to carried over entries.
+            mock_new_entry.reset_mock()
+            status, entries = await feed.update_override(
+                filter_overrides=GeoJsonFeedFilterDefinition(radius=100.0)
+            )
+            assert mock_new_entry.call_count == 0
+            assert [entry.title for entry in entries] == [
+                "Title 0",
+                "Title 1",
+                "Title 2",
+            ]
+
+
+class MockCategoryFilterDefinition(GeoJsonFeedFilterDefinition):
+    """Mock filter definition with categories."""
+
+    def __init__(self, categories: list[str]):
+        """Initialise filter definition."""
+        super().__init__()
+        self._categories = categories
+
+    @property
+    def categories(self) -> list[str]:
+        """Return the categories."""
+        return self._categories
+
+
+class MockCategoryGeoJsonFeed(MockIncrementalGeoJsonFeed):
+    """Mock geojson feed filtering on categories outside the pipeline."""
+
+    def _filter_entries_override(self, entries, filter_overrides=None):
+        """Keep entries whose title ends with one of the categories."""
+        entries = super()._filter_entries_override(entries, filter_overrides)
+        categories = filter_overrides.categories if filter_overrides else []
+        return [
+            entry
+            for entry in entries
+            if any(entry.title.endswith(category) for category in categories)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_update_incremental_filter_overrides(mock_aiointercept):
+    """Test carried over entries are filtered again if overrides change."""
+    home_coordinates = (-37.0, 150.0)
+    for _ in range(3):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=_incremental_feed([1, 1]),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockCategoryGeoJsonFeed(
+            websession, home_coordinates, "http://test.url/testpath", incremental=True
+        )
+        for categories, expected in ((["0"], ["0"]), (["1"], ["1"]), (["1"], ["1"])):
+            status, entries = await feed.update_override(
+                MockCategoryFilterDefinition(categories)
+            )
+            assert status == UPDATE_OK
+            assert [entry.external_id for entry in entries] == expected
+
+
+@pytest.mark.asyncio
+async def test_update_detach_entries(mock_aiointercept):
+    """Test entries detached from the parsed feed."""
+    home_coordinates = (-37.0, 150.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            filter_radius=90.0,
+            detach_entries=True,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 4
+        assert all(entry.detached for entry in entries)
+        assert entries[0].external_id == "3456"
+        assert round(abs(entries[0].distance_to_home - 82.0), 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_skip_unchanged(mock_aiointercept):
+    """Test skipping documents identical to the previous one."""
+    home_coordinates = (-37.0, 150.0)
+    for fixture in ("generic_feed_1.json", "generic_feed_1.json"):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+    mock_aiointercept.get("http://test.url/testpath", status=HTTPStatus.NOT_FOUND)
+    for fixture in (
+        "generic_feed_1.json",
+        "generic_feed_1.json",
+        "generic_feed_3.json",
+    ):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture(fixture),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            skip_unchanged=True,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+        with patch("geojson.loads") as mock_loads:
+            status, entries = await feed.update()
+            assert status == UPDATE_OK_NO_DATA
+            assert entries is None
+            assert not mock_loads.called
+        # An error resets the fingerprint.
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        # Changed filter criteria require filtering the document again.
+        status, entries = await feed.update_override(
+            filter_overrides=GeoJsonFeedFilterDefinition(radius=90.0)
+        )
+        assert status == UPDATE_OK
+        assert len(entries) == 4
+        status, entries = await feed.update_override(
+            filter_overrides=GeoJsonFeedFilterDefinition(radius=90.0)
+        )
+        assert status == UPDATE_OK
+
+
+@pytest.mark.asyncio
+async def test_update_accept_encodings(mock_aiointercept):
+    """Test negotiating content encodings and reporting transferred bytes."""
+    home_coordinates = (-31.0, 151.0)
+    body = load_fixture("generic_feed_1.json").encode("utf-8")
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=gzip.compress(body),
+        headers={"Content-Encoding": "gzip"},
+    )
+    mock_aiointercept.get("http://test.url/testpath", status=HTTPStatus.OK, body=body)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=body,
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            accept_encodings=["gzip"],
+        )
+        assert feed.transfer_statistics is None
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+        request = next(iter(mock_aiointercept.requests.values()))[0]
+        assert request.headers["Accept-Encoding"] == "gzip"
+        assert feed.transfer_statistics == {
+            "compressed_bytes": len(gzip.compress(body)),
+            "uncompressed_bytes": len(body),
+        }
+
+        # The server may ignore the negotiation.
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert feed.transfer_statistics == {
+            "compressed_bytes": len(body),
+            "uncompressed_bytes": len(body),
+        }
+
+        # Invalid compressed content.
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_skip_unchanged_filter_overrides(mock_aiointercept):
+    """Test unchanged documents are filtered again if overrides change."""
+    home_coordinates = (-37.0, 150.0)
+    for _ in range(3):
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=_incremental_feed([1, 1]),
+        )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockCategoryGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            skip_unchanged=True,
+        )
+        status, entries = await feed.update_override(
+            MockCategoryFilterDefinition(["0"])
+        )
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == ["0"]
+        status, entries = await feed.update_override(
+            MockCategoryFilterDefinition(["1"])
+        )
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == ["1"]
+        status, entries = await feed.update_override(
+            MockCategoryFilterDefinition(["1"])
+        )
+        assert status == UPDATE_OK_NO_DATA
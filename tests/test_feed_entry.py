@@ -1,6 +1,10 @@
 """Test for the generic geojson feed entry."""
 
-from tests import MockSimpleFeedEntry
+import geojson
+import pytest
+
+from aio_geojson_client.geometries.point import Point
+from tests import MockFeedEntry, MockSimpleFeedEntry
 
 
 def test_simple_feed_entry():
@@ -12,3 +16,50 @@ def test_simple_feed_entry():
     assert feed_entry.title == "mock title"
     assert feed_entry.external_id == "mock id"
     assert feed_entry.attribution is None
+
+
+class MockDetachedFeedEntry(MockFeedEntry):
+    """Mock feed entry keeping only its title when detached."""
+
+    _detached_properties = ("title",)
+
+
+def test_detach_feed_entry():
+    """Test detaching the entry from its feature."""
+    feature = geojson.Feature(
+        id="1234",
+        geometry=geojson.Point((151.0, -31.0)),
+        properties={"title": "Title 1", "description": "x" * 1000},
+    )
+    feed_entry = MockDetachedFeedEntry((-31.0, 150.0), feature)
+    distance = feed_entry.distance_to_home
+    assert not feed_entry.detached
+    feed_entry.detach()
+    assert feed_entry.detached
+    assert feed_entry.title == "Title 1"
+    assert feed_entry.external_id == "1234"
+    assert feed_entry.properties == {"title": "Title 1"}
+    assert feed_entry.geometries == [Point(-31.0, 151.0)]
+    assert feed_entry.distance_to_home == distance
+    # Detaching again has no effect.
+    feed_entry.detach()
+    assert feed_entry.title == "Title 1"
+    # All properties are kept unless declared otherwise.
+    feed_entry = MockFeedEntry((-31.0, 150.0), feature)
+    feed_entry.detach()
+    assert feed_entry.properties == feature.properties
+
+
+def test_detach_feed_entry_polygon():
+    """Test detached entries keep polygons compactly."""
+    feature = geojson.Feature(
+        geometry=geojson.Polygon(
+            [[(151.0, -31.0), (151.5, -31.0), (151.5, -31.5), (151.0, -31.0)]]
+        ),
+        properties={},
+    )
+    feed_entry = MockFeedEntry((-31.0, 150.0), feature)
+    geometries = feed_entry.geometries
+    feed_entry.detach()
+    assert feed_entry.geometries == geometries
+    assert feed_entry.coordinates == pytest.approx((-31.125, 151.25))
@@ -0,0 +1,104 @@
+"""Test for the feed entry fields."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import geojson
+import pytest
+
+from aio_geojson_client.feed_entry import FeedEntry
+from aio_geojson_client.feed_entry_field import FeedEntryField
+
+mock_parse_date = MagicMock(side_effect=datetime.fromisoformat)
+
+
+class MockSchemaFeedEntry(FeedEntry):
+    """Mock feed entry declaring its fields."""
+
+    title = FeedEntryField("title")
+    external_id = FeedEntryField(("id",), "id", "guid", value_type=str)
+    published = FeedEntryField("published", converter=mock_parse_date)
+    magnitude = FeedEntryField("magnitude", value_type=float, default=0.0)
+    source = FeedEntryField(("properties", "source", "name"))
+
+
+class MockSchemaSubclassFeedEntry(MockSchemaFeedEntry):
+    """Mock feed entry replacing a field."""
+
+    category = FeedEntryField("category")
+
+    @property
+    def magnitude(self) -> float:
+        """Return a fixed magnitude."""
+        return 1.0
+
+
+def _feature(feature_id=None, **properties):
+    """Create a feature."""
+    return geojson.Feature(
+        id=feature_id, geometry=geojson.Point((151.0, -31.0)), properties=properties
+    )
+
+
+def test_fields():
+    """Test extracting declared fields once per entry."""
+    mock_parse_date.reset_mock()
+    entry = MockSchemaFeedEntry(
+        (-31.0, 150.0),
+        _feature(
+            "1234",
+            title="Title 1",
+            guid="5678",
+            published="2024-01-15T10:00:00+00:00",
+            magnitude="4.5",
+            source={"name": "Agency"},
+        ),
+    )
+    assert entry.title == "Title 1"
+    assert entry.external_id == "1234"
+    assert entry.published == datetime.fromisoformat("2024-01-15T10:00:00+00:00")
+    assert entry.published == datetime.fromisoformat("2024-01-15T10:00:00+00:00")
+    assert entry.magnitude == 4.5
+    assert entry.source == "Agency"
+    assert repr(entry) == "<MockSchemaFeedEntry(id=1234)>"
+    mock_parse_date.assert_called_once()
+    # Fields remain available after detaching.
+    entry.detach()
+    assert entry.published.year == 2024
+    mock_parse_date.assert_called_once()
+
+
+def test_fields_fallback_and_default():
+    """Test fallback paths, defaults and invalid values."""
+    entry = MockSchemaFeedEntry(
+        (-31.0, 150.0), _feature(guid=5678, magnitude="invalid", published="invalid")
+    )
+    assert entry.title is None
+    assert entry.external_id == "5678"
+    assert entry.magnitude == 0.0
+    assert entry.published is None
+    assert entry.source is None
+    assert MockSchemaFeedEntry((-31.0, 150.0), None).magnitude == 0.0
+
+
+def test_fields_inheritance():
+    """Test fields are inherited and can be replaced."""
+    entry = MockSchemaSubclassFeedEntry(
+        (-31.0, 150.0), _feature("1234", category="Fire", magnitude=3.0)
+    )
+    assert entry.category == "Fire"
+    assert entry.external_id == "1234"
+    assert entry.magnitude == 1.0
+    assert "magnitude" not in entry.field_values()
+    assert isinstance(MockSchemaFeedEntry.title, FeedEntryField)
+    assert MockSchemaFeedEntry.title.name == "title"
+    assert (
+        repr(MockSchemaFeedEntry.title)
+        == "<FeedEntryField(name=title, paths=(('properties', 'title'),))>"
+    )
+
+
+def test_invalid_field():
+    """Test field without path."""
+    with pytest.raises(ValueError, match="At least one path"):
+        FeedEntryField()
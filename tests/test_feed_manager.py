@@ -10,6 +10,7 @@ import pytest
 from aio_geojson_client.consts import UPDATE_OK_NO_DATA
 from aio_geojson_client.feed_manager import FeedManagerBase
 from aio_geojson_client.filter_definition import GeoJsonFeedFilterDefinition
+from aio_geojson_client.shared_state import StatePublisher, StateReader
 from tests import MockGeoJsonFeed
 from tests.utils import load_fixture
 
@@ -264,3 +265,153 @@ async def test_feed_manager_with_status_callback(mock_aiointercept):
         assert status_update[0].last_update_successful is not None
         assert status_update[0].last_update_successful == last_update_successful
         assert status_update[0].total == 0
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_with_bulk_callbacks(mock_aiointercept):
+    """Test the feed manager with bulk callbacks."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+
+        # This will just record calls and keep track of external ids.
+        single_external_ids = []
+        generated_entities = []
+        updated_entities = []
+        removed_entities = []
+
+        async def _single_entity(external_id):
+            """Record per-id callback."""
+            single_external_ids.append(external_id)
+
+        async def _generate_entities(entries):
+            """Generate new entities."""
+            generated_entities.append(entries)
+
+        async def _update_entities(entries):
+            """Update entities."""
+            updated_entities.append(entries)
+
+        async def _remove_entities(entries):
+            """Remove entities."""
+            removed_entities.append(entries)
+
+        feed_manager = FeedManagerBase(
+            feed,
+            _single_entity,
+            _single_entity,
+            _single_entity,
+            generate_bulk_async_callback=_generate_entities,
+            update_bulk_async_callback=_update_entities,
+            remove_bulk_async_callback=_remove_entities,
+        )
+        await feed_manager.update()
+        assert len(feed_manager.feed_entries) == 5
+        assert len(single_external_ids) == 0
+        assert len(generated_entities) == 1
+        assert len(generated_entities[0]) == 5
+        assert generated_entities[0]["3456"].title == "Title 1"
+        assert len(updated_entities) == 0
+        assert len(removed_entities) == 0
+
+        # Simulate an update with several changes.
+        generated_entities.clear()
+        mock_aiointercept.get(
+            "http://test.url/testpath",
+            status=HTTPStatus.OK,
+            body=load_fixture("generic_feed_2.json"),
+        )
+
+        await feed_manager.update()
+        assert len(feed_manager.feed_entries) == 3
+        assert len(single_external_ids) == 0
+        assert len(generated_entities) == 1
+        assert set(generated_entities[0]) == {"8901"}
+        assert len(updated_entities) == 1
+        assert set(updated_entities[0]) == {"3456", "4567"}
+        assert updated_entities[0]["3456"].title == "Title 1 UPDATED"
+        assert len(removed_entities) == 1
+        assert len(removed_entities[0]) == 3
+        assert removed_entities[0]["Title 3"].title == "Title 3"
+
+        # Simulate an update producing an error.
+        generated_entities.clear()
+        updated_entities.clear()
+        removed_entities.clear()
+        mock_aiointercept.get(
+            "http://test.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+
+        await feed_manager.update()
+        assert len(feed_manager.feed_entries) == 0
+        assert len(generated_entities) == 0
+        assert len(updated_entities) == 0
+        assert len(removed_entities) == 1
+        assert set(removed_entities[0]) == {"3456", "4567", "8901"}
+        assert removed_entities[0]["8901"].title == "Title 6"
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_snapshot(mock_aiointercept):
+    """Test the snapshot of the feed manager entries."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+        callback = async_mock.AsyncMock()
+        feed_manager = FeedManagerBase(feed, callback, callback, callback)
+        assert len(feed_manager.snapshot()) == 0
+
+        await feed_manager.update()
+        snapshot = feed_manager.snapshot(["title"])
+        assert len(snapshot) == 5
+        index = snapshot["external_id"].index("3456")
+        assert snapshot["properties.title"][index] == "Title 1"
+        assert (snapshot["latitude"][index], snapshot["longitude"][index]) == (
+            -37.2345,
+            149.1234,
+        )
+        assert round(abs(snapshot["distance"][index] - 714.4), 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_state_publisher(mock_aiointercept, tmp_path):
+    """Test publishing the entries of the feed manager."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+    path = tmp_path / "state"
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+        callback = async_mock.AsyncMock()
+        with StatePublisher(path) as publisher, StateReader(path) as reader:
+            feed_manager = FeedManagerBase(
+                feed, callback, callback, callback, state_publisher=publisher
+            )
+            await feed_manager.update()
+            state = reader.read()
+            assert state.version == 1
+            assert set(state.external_ids) == set(map(str, feed_manager.feed_entries))
+
+            await feed_manager.update()
+            state = reader.read()
+            assert state.version == 2
+            assert len(state) == 0
@@ -0,0 +1,221 @@
+"""Test for the filter pipeline."""
+
+import asyncio
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import aiohttp
+from haversine import haversine
+import pytest
+
+from aio_geojson_client.consts import UPDATE_OK
+from aio_geojson_client.filter_definition import GeoJsonFeedFilterDefinition
+from aio_geojson_client.filter_pipeline import (
+    BoundingBoxFilterStage,
+    FilterPipeline,
+    GeometryFilterStage,
+    PropertyFilterStage,
+    RadiusFilterStage,
+    TimeWindowFilterStage,
+    bounding_boxes_intersect,
+)
+from aio_geojson_client.geometries.point import Point
+from aio_geojson_client.geometries.polygon import Polygon
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+def _mock_entry(geometries=None, properties=None, distance=0.0):
+    """Create a mock entry."""
+    return MagicMock(
+        geometries=geometries, properties=properties, distance_to_home=distance
+    )
+
+
+def test_bounding_boxes_intersect():
+    """Test intersecting bounding boxes, including the antimeridian."""
+    assert bounding_boxes_intersect((0.0, 0.0, 1.0, 1.0), (0.5, 0.5, 2.0, 2.0))
+    assert not bounding_boxes_intersect((0.0, 0.0, 1.0, 1.0), (1.5, 0.0, 2.0, 1.0))
+    assert not bounding_boxes_intersect((0.0, 0.0, 1.0, 1.0), (0.0, 1.5, 1.0, 2.0))
+    assert bounding_boxes_intersect((0.0, 170.0, 1.0, -170.0), (0.0, 175.0, 1.0, 175.0))
+    assert bounding_boxes_intersect(
+        (0.0, 170.0, 1.0, -170.0), (0.0, -175.0, 1.0, -175.0)
+    )
+    assert not bounding_boxes_intersect((0.0, 170.0, 1.0, -170.0), (0.0, 0.0, 1.0, 1.0))
+
+
+def test_polygon_bounding_box_antimeridian():
+    """Test the bounding box of a polygon crossing the antimeridian."""
+    polygon = Polygon(
+        [
+            Point(-10.0, 175.0),
+            Point(-10.0, -175.0),
+            Point(-20.0, -175.0),
+            Point(-20.0, 175.0),
+            Point(-10.0, 175.0),
+        ]
+    )
+    # The southern edge bulges towards the south pole.
+    assert polygon.bounding_box == pytest.approx((-20.0703, 175.0, -10.0, -175.0))
+
+
+@pytest.mark.parametrize(
+    ("home", "point"),
+    [
+        ((-37.0, 150.0), (-37.0, 151.1)),
+        ((60.0, 179.5), (60.0, -179.5)),
+        ((-60.0, -179.5), (-60.0, 179.5)),
+        ((89.5, 0.0), (89.5, 180.0)),
+    ],
+)
+def test_radius_stage(home, point):
+    """Test the radius prefilter never rejects entries inside the circle."""
+    radius = haversine(home, point) + 0.1
+    entry = _mock_entry([Point(*point)], distance=radius - 0.1)
+    assert RadiusFilterStage(home, radius).accept(entry)
+    far_away = _mock_entry([Point(-point[0], point[1])], distance=10000.0)
+    assert not RadiusFilterStage(home, radius).accept(far_away)
+
+
+def test_radius_stage_skips_distance():
+    """Test distance is not calculated for entries outside the bounding box."""
+    entry = MagicMock(geometries=[Point(-30.0, 150.0)])
+    type(entry).distance_to_home = property(lambda _: pytest.fail("Calculated"))
+    assert not RadiusFilterStage((-37.0, 150.0), 100.0).accept(entry)
+
+
+def test_property_stage():
+    """Test property equality and set membership."""
+    stage = PropertyFilterStage({"category": {"fire", "flood"}, "status": "active"})
+    assert stage.accept(
+        _mock_entry(properties={"category": "fire", "status": "active"})
+    )
+    assert not stage.accept(
+        _mock_entry(properties={"category": "storm", "status": "active"})
+    )
+    assert not stage.accept(_mock_entry(properties={"category": "fire"}))
+    assert not stage.accept(_mock_entry(properties={"category": ["fire"]}))
+    assert not stage.accept(_mock_entry(properties=None))
+
+
+def test_property_stage_unhashable_values():
+    """Test required values that are not hashable, such as lists."""
+    stage = PropertyFilterStage(
+        {"tags": [["fire", "flood"], ["storm"]], "source": {"agency": "RFS"}}
+    )
+    assert stage.accept(
+        _mock_entry(properties={"tags": ["fire", "flood"], "source": {"agency": "RFS"}})
+    )
+    assert not stage.accept(
+        _mock_entry(properties={"tags": ["fire"], "source": {"agency": "RFS"}})
+    )
+    hash(stage.key)
+    pipeline = FilterPipeline([stage])
+    assert pipeline.matches(
+        [
+            PropertyFilterStage(
+                {"tags": [["fire", "flood"], ["storm"]], "source": {"agency": "RFS"}}
+            )
+        ]
+    )
+
+
+def test_time_window_stage():
+    """Test time window, keeping entries without timestamp."""
+    stage = TimeWindowFilterStage(
+        datetime(2024, 1, 1), datetime(2024, 2, 1), lambda entry: entry.timestamp
+    )
+    assert stage.accept(MagicMock(timestamp=datetime(2024, 1, 15)))
+    assert not stage.accept(MagicMock(timestamp=datetime(2023, 12, 31)))
+    assert not stage.accept(MagicMock(timestamp=datetime(2024, 2, 2)))
+    assert stage.accept(MagicMock(timestamp=None))
+
+
+def test_pipeline():
+    """Test evaluation order and statistics."""
+    geometry_stage = GeometryFilterStage()
+    bbox_stage = BoundingBoxFilterStage((0.0, 0.0, 1.0, 1.0))
+    property_stage = PropertyFilterStage({"category": "fire"})
+    pipeline = FilterPipeline([bbox_stage, geometry_stage, property_stage])
+    # Ordered by cost initially.
+    assert pipeline.stages == [property_stage, geometry_stage, bbox_stage]
+    entries = [
+        _mock_entry([Point(0.5, 0.5)], {"category": "fire"}),
+        _mock_entry([Point(5.0, 5.0)], {"category": "fire"}),
+        _mock_entry([Point(5.0, 5.0)], {"category": "fire"}),
+        _mock_entry([Point(5.0, 5.0)], {"category": "fire"}),
+        _mock_entry(None, {"category": "fire"}),
+    ]
+    assert pipeline.filter(entries) == entries[:1]
+    assert pipeline.statistics == {
+        "BoundingBoxFilterStage": 3,
+        "GeometryFilterStage": 1,
+        "PropertyFilterStage": 0,
+    }
+    assert pipeline.evaluated == 5
+    assert pipeline.accepted == 1
+    # Bounding box rejects most entries, so is now evaluated first.
+    assert pipeline.stages[0] == bbox_stage
+    assert pipeline.matches(
+        [
+            GeometryFilterStage(),
+            PropertyFilterStage({"category": "fire"}),
+            BoundingBoxFilterStage((0.0, 0.0, 1.0, 1.0)),
+        ]
+    )
+    assert not pipeline.matches([GeometryFilterStage()])
+
+
+@pytest.mark.asyncio
+async def test_update_with_filter_definition(mock_aiointercept):
+    """Test filtering the feed by bounding box and properties."""
+    home_coordinates = (-37.0, 150.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            filter_definition=GeoJsonFeedFilterDefinition(
+                bbox=(-37.5, 149.0, -37.0, 149.5)
+            ),
+        )
+        assert feed.filter_statistics is None
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.title for entry in entries] == ["Title 1", "Title 2"]
+        assert feed.filter_statistics == {
+            "GeometryFilterStage": 1,
+            "BoundingBoxFilterStage": 3,
+        }
+
+        status, entries = await feed.update_override(
+            filter_overrides=GeoJsonFeedFilterDefinition(
+                radius=90.0, properties={"title": ["Title 2", "Title 3"]}
+            )
+        )
+        assert status == UPDATE_OK
+        assert [entry.title for entry in entries] == ["Title 2"]
+
+        # Time windows require the feed to determine entry timestamps.
+        time_window = GeoJsonFeedFilterDefinition(
+            time_window=(datetime(2024, 1, 1), None)
+        )
+        with pytest.raises(ValueError, match="must override _entry_timestamp"):
+            await feed.update_override(filter_overrides=time_window)
+        with pytest.raises(ValueError, match="must override _entry_timestamp"):
+            feed.process(load_fixture("generic_feed_1.json"), time_window)
+        with pytest.raises(ValueError, match="must override _entry_timestamp"):
+            MockGeoJsonFeed(
+                websession,
+                home_coordinates,
+                "http://test.url/testpath",
+                filter_definition=time_window,
+            )
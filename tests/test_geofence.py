@@ -0,0 +1,166 @@
+"""Test for the geofence."""
+
+import asyncio
+from http import HTTPStatus
+import math
+import random
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.consts import UPDATE_OK
+from aio_geojson_client.filter_definition import GeoJsonFeedFilterDefinition
+from aio_geojson_client.geofence import Geofence
+from aio_geojson_client.geometries.geometry import Geometry
+from aio_geojson_client.geometries.point import Point
+from aio_geojson_client.geometries.polygon import Polygon
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+def _square(latitude, longitude, size):
+    """Create a square polygon."""
+    return Polygon(
+        [
+            Point(latitude, longitude),
+            Point(latitude, longitude + size),
+            Point(latitude + size, longitude + size),
+            Point(latitude + size, longitude),
+            Point(latitude, longitude),
+        ]
+    )
+
+
+def test_contains():
+    """Test points inside a concave polygon with a hole."""
+    # U-shaped polygon.
+    outer = Polygon(
+        [
+            Point(0.0, 0.0),
+            Point(0.0, 3.0),
+            Point(3.0, 3.0),
+            Point(3.0, 2.0),
+            Point(1.0, 2.0),
+            Point(1.0, 1.0),
+            Point(3.0, 1.0),
+            Point(3.0, 0.0),
+            Point(0.0, 0.0),
+        ]
+    )
+    geofence = Geofence([[outer, _square(0.25, 2.25, 0.5)], _square(10.0, 10.0, 1.0)])
+    assert repr(geofence) == "<Geofence(polygons=2)>"
+    assert geofence.contains(Point(0.5, 0.5))
+    assert geofence.contains(Point(2.5, 2.5))
+    # Inside the U.
+    assert not geofence.contains(Point(2.0, 1.5))
+    # Inside the hole.
+    assert not geofence.contains(Point(0.5, 2.5))
+    assert geofence.contains(Point(10.5, 10.5))
+    assert not geofence.contains(Point(5.0, 5.0))
+
+
+def test_contains_antimeridian_and_greenwich():
+    """Test polygons crossing the antimeridian and the prime meridian."""
+    geofence = Geofence([_square(-20.0, 175.0, 10.0), _square(50.0, -2.0, 4.0)])
+    assert geofence.contains(Point(-15.0, 178.0))
+    assert geofence.contains(Point(-15.0, -178.0))
+    assert not geofence.contains(Point(-15.0, 170.0))
+    assert not geofence.contains(Point(-15.0, -170.0))
+    assert geofence.contains(Point(51.0, -1.0))
+    assert geofence.contains(Point(51.0, 1.0))
+    assert not geofence.contains(Point(51.0, 3.0))
+
+
+def test_contains_many_vertices():
+    """Test an indexed polygon with many vertices against ray casting."""
+    rng = random.Random(42)
+    vertices = 2000
+    points = [
+        Point(
+            -33.0 + (0.5 + 0.1 * math.sin(7 * angle)) * math.sin(angle),
+            151.0 + (0.5 + 0.1 * math.sin(7 * angle)) * math.cos(angle),
+        )
+        for angle in (2 * math.pi * i / vertices for i in range(vertices))
+    ]
+    polygon = Polygon([*points, points[0]])
+    geofence = Geofence([polygon])
+    for _ in range(500):
+        point = Point(rng.uniform(-33.7, -32.3), rng.uniform(150.3, 151.7))
+        assert geofence.contains(point) == polygon.is_inside(point)
+
+
+def test_intersects():
+    """Test polygons intersecting the geofence."""
+    geofence = Geofence([_square(0.0, 0.0, 2.0)])
+    # Partially overlapping.
+    assert geofence.intersects(_square(1.0, 1.0, 2.0))
+    # Crossing without any vertex inside the other polygon.
+    assert geofence.intersects(
+        Polygon(
+            [
+                Point(-1.0, 0.5),
+                Point(-1.0, 1.5),
+                Point(3.0, 1.5),
+                Point(3.0, 0.5),
+                Point(-1.0, 0.5),
+            ]
+        )
+    )
+    # Entirely inside, and containing the geofence.
+    assert geofence.intersects(_square(0.5, 0.5, 1.0))
+    assert geofence.intersects(_square(-1.0, -1.0, 4.0))
+    assert not geofence.intersects(_square(3.0, 3.0, 1.0))
+    assert not geofence.intersects(Geometry())
+
+
+def test_from_geojson():
+    """Test creating a geofence from GeoJSON."""
+    geofence = Geofence.from_geojson(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "MultiPolygon",
+                        "coordinates": [
+                            [
+                                [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                                [[1, 1], [2, 1], [2, 2], [1, 2], [1, 1]],
+                            ],
+                            [[[10, 10], [11, 10], [11, 11], [10, 11], [10, 10]]],
+                        ],
+                    },
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0, 0]},
+                },
+            ],
+        }
+    )
+    assert repr(geofence) == "<Geofence(polygons=2)>"
+    assert geofence.contains(Point(3.0, 3.0))
+    assert not geofence.contains(Point(1.5, 1.5))
+    assert geofence.contains(Point(10.5, 10.5))
+
+
+@pytest.mark.asyncio
+async def test_update_with_geofence(mock_aiointercept):
+    """Test filtering the feed by geofence."""
+    home_coordinates = (-37.0, 150.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+        status, entries = await feed.update_override(
+            filter_overrides=GeoJsonFeedFilterDefinition(
+                geofence=Geofence([_square(-37.5, 149.0, 0.5)])
+            )
+        )
+        assert status == UPDATE_OK
+        assert [entry.title for entry in entries] == ["Title 1", "Title 2"]
@@ -1,12 +1,18 @@
 """Tests for base classes."""
 
-from unittest.mock import ANY, MagicMock
+import math
+import random
+from unittest.mock import MagicMock
 
+from haversine import haversine
 import pytest
 
+from aio_geojson_client.filter_pipeline import RadiusFilterStage
 from aio_geojson_client.geojson_distance_helper import GeoJsonDistanceHelper
+from aio_geojson_client.geometries.geometry import Geometry
 from aio_geojson_client.geometries.point import Point
 from aio_geojson_client.geometries.polygon import Polygon
+from aio_geojson_client.spherical import to_unit_vector
 
 
 def test_extract_coordinates_from_point():
@@ -175,8 +181,120 @@ def test_distance_to_unsupported_geometry():
     assert distance == float("inf")
 
 
-def test_perpendicular_point_edge_case():
-    """Test edge case when calculating perpendicular point."""
-    edge = (Point(-31.0, 150.0), Point(-31.0, 150.0))
-    result = GeoJsonDistanceHelper._perpendicular_point(edge, ANY)  # noqa: SLF001
-    assert result is None
+def test_distance_to_outline_repeated_vertex():
+    """Test repeated vertices when calculating distance to the outline."""
+    polygon = Polygon(
+        [
+            Point(-31.0, 150.0),
+            Point(-31.0, 150.0),
+            Point(-31.0, 151.0),
+            Point(-31.0, 150.0),
+        ]
+    )
+    distance = GeoJsonDistanceHelper.distance_to_outline((-31.0, 149.0), polygon)
+    assert distance == pytest.approx(haversine((-31.0, 149.0), (-31.0, 150.0)))
+
+
+def _densified_distance(coordinates, a, b, steps=20000):
+    """Approximate the distance to the great-circle arc a-b by sampling it."""
+    va, vb = to_unit_vector(*a), to_unit_vector(*b)
+    omega = math.acos(
+        max(-1.0, min(1.0, sum(x * y for x, y in zip(va, vb, strict=True))))
+    )
+    distance = float("inf")
+    for step in range(steps + 1):
+        t = step / steps
+        wa = math.sin((1 - t) * omega) / math.sin(omega)
+        wb = math.sin(t * omega) / math.sin(omega)
+        x, y, z = (wa * p + wb * q for p, q in zip(va, vb, strict=True))
+        sample = (
+            math.degrees(math.atan2(z, math.hypot(x, y))),
+            math.degrees(math.atan2(y, x)),
+        )
+        distance = min(distance, haversine(coordinates, sample))
+    return distance
+
+
+@pytest.mark.parametrize(
+    ("coordinates", "a", "b"),
+    [
+        # Near the north pole, the edge bulges towards the pole.
+        ((89.9, 45.0), (89.0, 0.0), (89.0, 90.0)),
+        ((88.0, -100.0), (89.5, -170.0), (89.5, 10.0)),
+        # Near the south pole.
+        ((-89.7, 120.0), (-89.0, 100.0), (-89.0, -140.0)),
+        # Across the antimeridian.
+        ((0.5, 180.0), (0.0, 179.0), (0.0, -179.0)),
+        ((-40.0, -179.9), (-41.0, 178.5), (-39.0, -178.5)),
+        # Across Greenwich.
+        ((51.6, 0.0), (51.0, -1.0), (52.0, 1.0)),
+        # Beyond the end of the edge.
+        ((10.0, 20.0), (0.0, 0.0), (5.0, 5.0)),
+    ],
+)
+def test_distance_to_outline_accuracy(coordinates, a, b):
+    """Test the distance to an edge against a densely sampled edge."""
+    polygon = Polygon([Point(*a), Point(*b)])
+    assert GeoJsonDistanceHelper.distance_to_outline(
+        coordinates, polygon
+    ) == pytest.approx(_densified_distance(coordinates, a, b), abs=0.01)
+
+
+def test_radius_around_bulging_edge():
+    """Test entries are not rejected where an edge bulges beyond its vertices."""
+    home_coordinates = (64.0, 0.0)
+    polygon = Polygon(
+        [
+            Point(60.0, -30.0),
+            Point(60.0, 30.0),
+            Point(50.0, 30.0),
+            Point(50.0, -30.0),
+            Point(60.0, -30.0),
+        ]
+    )
+    distance = GeoJsonDistanceHelper.distance_to_geometry(home_coordinates, polygon)
+    assert distance == pytest.approx(62.8, abs=0.1)
+    assert polygon.bounding_box[2] == pytest.approx(63.435, abs=0.001)
+    entry = MagicMock(geometries=[polygon], distance_to_home=distance)
+    assert RadiusFilterStage(home_coordinates, 100.0).accept(entry)
+    assert (
+        GeoJsonDistanceHelper.minimum_distance_to_geometry(home_coordinates, polygon)
+        <= distance
+    )
+
+
+def test_minimum_distance_to_geometry():
+    """Test the lower bound never exceeds the distance."""
+    rng = random.Random(7)
+    for _ in range(200):
+        latitude = rng.uniform(-80.0, 80.0)
+        longitude = rng.uniform(100.0, 160.0)
+        size = rng.uniform(0.01, 5.0)
+        polygon = Polygon(
+            [
+                Point(latitude, longitude),
+                Point(latitude, longitude + size),
+                Point(latitude + size, longitude + size),
+                Point(latitude + size / 2, longitude),
+                Point(latitude, longitude),
+            ]
+        )
+        home_coordinates = (
+            latitude + rng.uniform(-10.0, 10.0),
+            longitude + rng.uniform(-10.0, 10.0),
+        )
+        assert (
+            GeoJsonDistanceHelper.minimum_distance_to_geometry(
+                home_coordinates, polygon
+            )
+            <= GeoJsonDistanceHelper.distance_to_geometry(home_coordinates, polygon)
+            + 1e-6
+        )
+    point = Point(-30.0, 151.0)
+    assert GeoJsonDistanceHelper.minimum_distance_to_geometry(
+        (-31.0, 150.0), point
+    ) == pytest.approx(146.8, 0.1)
+    assert (
+        GeoJsonDistanceHelper.minimum_distance_to_geometry((-31.0, 150.0), Geometry())
+        == 0.0
+    )
@@ -0,0 +1,80 @@
+"""Test for the geometry interner."""
+
+import gc
+
+import geojson
+from geojson import Feature
+
+from aio_geojson_client.distance_cache import DistanceCache
+from aio_geojson_client.geometries.point import Point
+from aio_geojson_client.geometries.polygon import Polygon
+from aio_geojson_client.geometry_interner import GeometryInterner
+from tests import MockFeedEntry
+
+RING = [[150.0, -30.0], [150.5, -30.0], [150.5, -30.5], [150.0, -30.5], [150.0, -30.0]]
+
+
+def test_geometry_interner():
+    """Test sharing identical geometries."""
+    interner = GeometryInterner()
+    polygon = interner.polygon(RING)
+    assert polygon == Polygon([Point(lat, lon) for lon, lat in RING])
+    assert interner.polygon([list(vertex) for vertex in RING]) is polygon
+    reversed_polygon = interner.polygon(RING[::-1])
+    assert reversed_polygon is not polygon
+    point = interner.point([150.0, -30.0])
+    assert point == Point(-30.0, 150.0)
+    assert interner.point([150.0, -30.0]) is point
+    assert interner.hits == 2
+    assert interner.misses == 3
+    assert len(interner) == 3
+    assert repr(interner) == "<GeometryInterner(size=3)>"
+    # Geometries are freed when no longer used.
+    del polygon, point
+    gc.collect()
+    assert len(interner) == 1
+    assert interner.polygon(RING[::-1]) is reversed_polygon
+
+
+def test_entries_share_geometries():
+    """Test entries with identical geometries share them."""
+    interner = GeometryInterner()
+    entries = []
+    for _ in range(3):
+        entry = MockFeedEntry((-31.0, 150.0), Feature(geometry=geojson.Polygon([RING])))
+        entry.geometry_interner = interner
+        entries.append(entry)
+    polygon = entries[0].geometries[0]
+    assert all(entry.geometries[0] is polygon for entry in entries)
+    # Detached entries keep the shared geometry.
+    entries[1].detach()
+    assert entries[1].geometries[0] is polygon
+    # Distances are cached once for the shared geometry.
+    cache = DistanceCache()
+    for entry in entries:
+        entry.distance_cache = cache
+        assert round(abs(entry.distance_to_home - 55.6), 1) == 0
+    assert cache.misses == 2
+
+
+def test_attached_entries_keep_geometries():
+    """Test entries that are not detached keep their interned geometries."""
+    interner = GeometryInterner()
+    polls = []
+    for _ in range(2):
+        entries = []
+        for _ in range(50):
+            entry = MockFeedEntry(
+                (-31.0, 150.0), Feature(geometry=geojson.Polygon([RING]))
+            )
+            entry.geometry_interner = interner
+            assert entry.geometries is entry.geometries
+            entries.append(entry)
+        polls.append(entries)
+    gc.collect()
+    assert interner.misses == 1
+    assert interner.hits == 99
+    assert len(interner) == 1
+    # Without interner, geometries are wrapped on access again.
+    entry.geometry_interner = None
+    assert entry.geometries is not entry.geometries
@@ -0,0 +1,35 @@
+"""Test importing the library."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Print the heavy dependencies loaded by importing a module.
+SCRIPT = """
+import sys
+import {module}
+print(",".join(name for name in ("aiohttp", "geojson", "haversine") if name in sys.modules))
+"""
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "aio_geojson_client.consts",
+        "aio_geojson_client.feed",
+        "aio_geojson_client.feed_entry",
+        "aio_geojson_client.feed_manager",
+        "aio_geojson_client.composite_feed",
+        "aio_geojson_client.geojson_distance_helper",
+    ],
+)
+def test_lazy_dependencies(module):
+    """Test that heavy dependencies are not loaded on import."""
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
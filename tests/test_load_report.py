@@ -0,0 +1,25 @@
+"""Test for the load report."""
+
+import pytest
+
+from aio_geojson_client.load_report import LoadReport
+
+
+@pytest.mark.asyncio
+async def test_load_report():
+    """Test latency percentiles and callback counts."""
+    report = LoadReport()
+    assert report.latency_percentile(0.5) is None
+    assert report.throughput is None
+    for latency in range(1, 101):
+        report.record_update(latency / 1000)
+    assert report.updates == 100
+    assert report.latency_percentile(0.5) == 0.05
+    assert report.latency_percentile(0.99) == 0.099
+    assert report.latency_percentile(1.0) == 0.1
+    assert report.latency_percentile(0.0) == 0.001
+    await report.generate_callback("1")
+    await report.generate_callback("2")
+    await report.remove_callback("1")
+    assert report.callbacks == {"generate": 2, "update": 0, "remove": 1}
+    assert repr(report) == "<LoadReport(updates=100)>"
@@ -0,0 +1,159 @@
+"""Test for feed mirrors."""
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
+import aiohttp
+from aiointercept import CallbackResult
+import pytest
+
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_geojson_client.mirror import Mirror
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+def test_mirror():
+    """Test mirror latency and error estimates."""
+    mirror = Mirror("http://test.url/testpath")
+    assert mirror.latency is None
+    assert mirror.healthy
+    assert mirror.latency_percentile(0.9) is None
+    for latency in (1.0, 2.0, 3.0, 4.0, 5.0):
+        mirror.record_success(latency)
+    assert mirror.latency == pytest.approx(3.2269)
+    assert mirror.latency_percentile(0.5) == 3.0
+    assert mirror.latency_percentile(0.9) == 5.0
+    assert mirror.latency_percentile(1.0) == 5.0
+    with patch("aio_geojson_client.mirror.time.monotonic") as mock_time:
+        mock_time.return_value = 100.0
+        mirror.record_failure()
+        assert mirror.failures == 1
+        assert not mirror.healthy
+        mock_time.return_value = 160.0
+        assert mirror.healthy
+    mirror.record_abandoned(10.0)
+    assert mirror.failures == 1
+    assert mirror.latency_percentile(1.0) == 10.0
+    mirror.record_success(1.0)
+    assert mirror.failures == 0
+    assert repr(mirror).startswith("<Mirror(url=http://test.url/testpath")
+
+
+def test_rank_mirrors():
+    """Test ranking mirrors by health and latency."""
+    mirror1 = Mirror("http://test1.url/testpath")
+    mirror2 = Mirror("http://test2.url/testpath")
+    mirror3 = Mirror("http://test3.url/testpath")
+    # Configured order without any measurements.
+    assert Mirror.rank([mirror1, mirror2, mirror3]) == [mirror1, mirror2, mirror3]
+    mirror1.record_success(0.5)
+    mirror3.record_success(0.2)
+    assert Mirror.rank([mirror1, mirror2, mirror3]) == [mirror3, mirror1, mirror2]
+    mirror3.record_failure()
+    assert Mirror.rank([mirror1, mirror2, mirror3]) == [mirror1, mirror2, mirror3]
+
+
+@pytest.mark.asyncio
+async def test_update_failover(mock_aiointercept):
+    """Test failing over to the next mirror."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+        repeat=True,
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test1.url/testpath",
+            mirror_urls=["http://test2.url/testpath"],
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 5
+        # The failed mirror is not asked again.
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert sum(map(len, mock_aiointercept.requests.values())) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_all_mirrors_fail(mock_aiointercept):
+    """Test all mirrors failing."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    mock_aiointercept.get("http://test2.url/testpath", status=HTTPStatus.NOT_FOUND)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test1.url/testpath",
+            mirror_urls=["http://test2.url/testpath"],
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+
+
+@pytest.mark.asyncio
+async def test_update_hedged(mock_aiointercept):
+    """Test hedging a slow request with the next mirror."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+        repeat=5,
+    )
+
+    async def _slow_response(url, **kwargs):
+        await asyncio.sleep(5)
+        return CallbackResult(body=load_fixture("generic_feed_1.json"))
+
+    mock_aiointercept.get("http://test1.url/testpath", callback=_slow_response)
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_2.json"),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test1.url/testpath",
+            mirror_urls=["http://test2.url/testpath"],
+            hedge_percentile=0.9,
+        )
+        for _ in range(5):
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 5
+        abandoned = []
+
+        def _record_abandoned(mirror, elapsed):
+            abandoned.append((mirror.url, elapsed, mirror.latency_percentile(0.9)))
+            original_record_abandoned(mirror, elapsed)
+
+        original_record_abandoned = Mirror.record_abandoned
+        # Primary mirror is slow, the hedged request answers first.
+        with patch.object(Mirror, "record_abandoned", _record_abandoned):
+            status, entries = await asyncio.wait_for(feed.update(), timeout=2)
+        assert status == UPDATE_OK
+        assert len(entries) == 3
+        # The abandoned request counts as at least as slow as the hedge delay.
+        assert len(abandoned) == 1
+        url, elapsed, hedge_delay = abandoned[0]
+        assert url == "http://test1.url/testpath"
+        assert elapsed >= hedge_delay
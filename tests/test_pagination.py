@@ -0,0 +1,257 @@
+"""Test for paginated feeds."""
+
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_geojson_client.pagination import LinkPagination, OffsetPagination
+from tests import MockGeoJsonFeed
+
+
+def _page(first_id, count, **kwargs):
+    """Create a page with features."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "id": str(feature_id),
+                "geometry": {"type": "Point", "coordinates": [150.0, -37.0]},
+                "properties": {"title": f"Title {feature_id}"},
+            }
+            for feature_id in range(first_id, first_id + count)
+        ],
+        **kwargs,
+    }
+
+
+@pytest.mark.asyncio
+async def test_link_pagination(mock_aiointercept):
+    """Test following next links."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/items",
+        payload=_page(
+            1,
+            2,
+            links=[
+                {"rel": "self", "href": "http://test.url/items"},
+                {"rel": "next", "href": "http://test.url/items?page=2"},
+            ],
+        ),
+    )
+    mock_aiointercept.get(
+        "http://test.url/items?page=2",
+        payload=_page(
+            3, 2, links=[{"rel": "next", "href": "http://test.url/items?page=3"}]
+        ),
+    )
+    mock_aiointercept.get("http://test.url/items?page=3", payload=_page(5, 1))
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/items",
+            pagination=LinkPagination(),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == ["1", "2", "3", "4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_link_pagination_error(mock_aiointercept):
+    """Test failing to fetch a page."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/items",
+        payload=_page(
+            1, 2, links=[{"rel": "next", "href": "http://test.url/items?page=2"}]
+        ),
+    )
+    mock_aiointercept.get(
+        "http://test.url/items?page=2", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+    mock_aiointercept.get(
+        "http://test.url/items", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/items",
+            pagination=LinkPagination(),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+
+
+@pytest.mark.asyncio
+async def test_link_pagination_max_pages(mock_aiointercept):
+    """Test failing if there are more pages than the maximum."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/items",
+        payload=_page(
+            1, 2, links=[{"rel": "next", "href": "http://test.url/items?page=2"}]
+        ),
+    )
+    mock_aiointercept.get(
+        "http://test.url/items?page=2",
+        payload=_page(
+            3, 2, links=[{"rel": "next", "href": "http://test.url/items?page=3"}]
+        ),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/items",
+            pagination=LinkPagination(max_pages=2),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        assert entries is None
+        assert sum(map(len, mock_aiointercept.requests.values())) == 2
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_with_total(mock_aiointercept):
+    """Test fetching pages concurrently when the total is known."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/items?offset=0&limit=2",
+        payload=_page(1, 2, numberMatched=7),
+    )
+    mock_aiointercept.get("http://test.url/items?offset=2&limit=2", payload=_page(3, 2))
+    mock_aiointercept.get("http://test.url/items?offset=4&limit=2", payload=_page(5, 2))
+    mock_aiointercept.get("http://test.url/items?offset=6&limit=2", payload=_page(7, 1))
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/items",
+            pagination=OffsetPagination(page_size=2, max_concurrency=2),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == [
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_without_total(mock_aiointercept):
+    """Test fetching pages in batches until a page is not full."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/query?resultOffset=0&resultRecordCount=2",
+        payload=_page(1, 2),
+    )
+    mock_aiointercept.get(
+        "http://test.url/query?resultOffset=2&resultRecordCount=2",
+        payload=_page(3, 2),
+    )
+    mock_aiointercept.get(
+        "http://test.url/query?resultOffset=4&resultRecordCount=2",
+        payload=_page(5, 1),
+    )
+    mock_aiointercept.get(
+        "http://test.url/query?resultOffset=6&resultRecordCount=2",
+        payload=_page(0, 0),
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/query",
+            pagination=OffsetPagination(
+                page_size=2,
+                offset_parameter="resultOffset",
+                limit_parameter="resultRecordCount",
+                max_concurrency=3,
+            ),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert [entry.external_id for entry in entries] == ["1", "2", "3", "4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_error(mock_aiointercept):
+    """Test failing to fetch one of the pages."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/items?offset=0&limit=2", payload=_page(1, 2, numberMatched=4)
+    )
+    mock_aiointercept.get(
+        "http://test.url/items?offset=2&limit=2", status=HTTPStatus.NOT_FOUND
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/items",
+            pagination=OffsetPagination(page_size=2),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_max_pages(mock_aiointercept):
+    """Test failing if there are more pages than the maximum."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/items?offset=0&limit=2",
+        payload=_page(1, 2, numberMatched=5),
+    )
+    mock_aiointercept.get("http://test.url/items?offset=2&limit=2", payload=_page(3, 2))
+    mock_aiointercept.get(
+        "http://test.url/items?offset=0&limit=2",
+        payload=_page(1, 2, numberMatched=4),
+    )
+    mock_aiointercept.get("http://test.url/items?offset=2&limit=2", payload=_page(3, 2))
+    mock_aiointercept.get("http://test.url/items?offset=0&limit=2", payload=_page(1, 2))
+    mock_aiointercept.get("http://test.url/items?offset=2&limit=2", payload=_page(3, 2))
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/items",
+            pagination=OffsetPagination(page_size=2, max_pages=2),
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        # All features fit into the maximum number of pages.
+        status, entries = await feed.update()
+        assert status == UPDATE_OK
+        assert len(entries) == 4
+        # Without the total, a full last page may be followed by more pages.
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+
+
+def test_invalid_configuration():
+    """Test invalid pagination configuration."""
+    with pytest.raises(ValueError, match="Invalid page size or concurrency"):
+        OffsetPagination(page_size=0)
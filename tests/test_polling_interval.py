@@ -0,0 +1,109 @@
+"""Test for the adaptive polling interval."""
+
+from datetime import datetime
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_geojson_client.feed_manager import FeedManagerBase
+from aio_geojson_client.polling_interval import AdaptivePollingInterval
+from aio_geojson_client.status_update import StatusUpdate
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+def _status_update(status, created=0, updated=0, removed=0, last_timestamp=None):
+    """Create a status update."""
+    return StatusUpdate(
+        status, None, None, last_timestamp, 0, created, updated, removed
+    )
+
+
+def test_adaptive_polling_interval():
+    """Test adjusting the polling interval."""
+    polling_interval = AdaptivePollingInterval(60.0, 600.0, initial_interval=120.0)
+    assert polling_interval.interval == 120.0
+    # Busy feed speeds up.
+    assert polling_interval.record(_status_update(UPDATE_OK, created=2)) == 60.0
+    assert polling_interval.record(_status_update(UPDATE_OK, removed=1)) == 60.0
+    # Entries that are just still in the feed do not count as changes.
+    assert polling_interval.record(_status_update(UPDATE_OK, updated=5)) == 90.0
+    # Server reporting no new data backs off.
+    assert polling_interval.record(_status_update(UPDATE_OK_NO_DATA)) == 135.0
+    # Errors back off exponentially until the upper bound.
+    assert polling_interval.record(_status_update(UPDATE_ERROR)) == 270.0
+    assert polling_interval.record(_status_update(UPDATE_ERROR)) == 540.0
+    assert polling_interval.record(_status_update(UPDATE_ERROR)) == 600.0
+    assert polling_interval.error_streak == 3
+    assert repr(polling_interval) == (
+        "<AdaptivePollingInterval(interval=600.0, errors=3)>"
+    )
+    assert polling_interval.record(_status_update(UPDATE_OK, created=1)) == 300.0
+    assert polling_interval.error_streak == 0
+
+
+def test_adaptive_polling_interval_last_timestamp():
+    """Test newer last timestamp indicates a change."""
+    polling_interval = AdaptivePollingInterval(10.0, 100.0, initial_interval=40.0)
+    assert (
+        polling_interval.record(
+            _status_update(UPDATE_OK, last_timestamp=datetime(2026, 1, 1, 10, 0))
+        )
+        == 60.0
+    )
+    assert (
+        polling_interval.record(
+            _status_update(UPDATE_OK, last_timestamp=datetime(2026, 1, 1, 10, 5))
+        )
+        == 30.0
+    )
+    assert (
+        polling_interval.record(
+            _status_update(UPDATE_OK, last_timestamp=datetime(2026, 1, 1, 10, 5))
+        )
+        == 45.0
+    )
+
+
+def test_invalid_configuration():
+    """Test invalid polling interval configuration."""
+    with pytest.raises(ValueError, match="Invalid interval bounds"):
+        AdaptivePollingInterval(60.0, 30.0)
+    with pytest.raises(ValueError, match="Invalid speedup or backoff factor"):
+        AdaptivePollingInterval(30.0, 60.0, speedup_factor=2.0)
+
+
+@pytest.mark.asyncio
+async def test_feed_manager_polling_interval(mock_aiointercept):
+    """Test feed manager adjusts the polling interval."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test.url/testpath", status=HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+    async def _noop(external_id):
+        """Ignore callback."""
+
+    async with aiohttp.ClientSession() as websession:
+        feed = MockGeoJsonFeed(websession, home_coordinates, "http://test.url/testpath")
+        feed_manager = FeedManagerBase(
+            feed,
+            _noop,
+            _noop,
+            _noop,
+            polling_interval=AdaptivePollingInterval(
+                30.0, 300.0, initial_interval=60.0
+            ),
+        )
+        await feed_manager.update()
+        assert feed_manager.polling_interval.interval == 30.0
+        await feed_manager.update()
+        assert feed_manager.polling_interval.interval == 60.0
+        assert feed_manager.polling_interval.error_streak == 1
@@ -0,0 +1,137 @@
+"""Test for the rate limiter."""
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK, UPDATE_OK_NO_DATA
+from aio_geojson_client.mirror import Mirror
+from aio_geojson_client.rate_limiter import RateLimiter
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter():
+    """Test spreading out requests to a host."""
+    rate_limiter = RateLimiter(rate=2.0, burst=2, max_wait=1.0)
+    assert repr(rate_limiter) == "<RateLimiter(rate=2.0, burst=2)>"
+    with (
+        patch("aio_geojson_client.rate_limiter.time.monotonic") as mock_time,
+        patch("aio_geojson_client.rate_limiter.asyncio.sleep") as mock_sleep,
+    ):
+        mock_time.return_value = 100.0
+        assert await rate_limiter.acquire("test.url")
+        assert await rate_limiter.acquire("test.url")
+        mock_sleep.assert_not_called()
+
+        # Bucket is empty, wait for the next token.
+        async def advance(delay):
+            mock_time.return_value += delay
+
+        mock_sleep.side_effect = advance
+        assert await rate_limiter.acquire("test.url")
+        mock_sleep.assert_called_once_with(0.5)
+        # Other hosts are not affected.
+        assert await rate_limiter.acquire("other.url")
+        assert mock_sleep.call_count == 1
+        # Deferred host exceeds the maximum wait.
+        rate_limiter.defer("test.url", 5.0)
+        assert not await rate_limiter.acquire("test.url")
+        mock_time.return_value += 5.0
+        assert await rate_limiter.acquire("test.url")
+
+
+def test_invalid_configuration():
+    """Test invalid rate limiter configuration."""
+    with pytest.raises(ValueError, match="Invalid rate"):
+        RateLimiter(rate=0.0)
+    with pytest.raises(ValueError, match="Invalid rate"):
+        RateLimiter(rate=1.0, burst=0)
+
+
+def test_parse_retry_after():
+    """Test parsing the retry after header."""
+    assert RateLimiter.parse_retry_after(None) is None
+    assert RateLimiter.parse_retry_after("120") == 120.0
+    assert RateLimiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert RateLimiter.parse_retry_after("invalid") is None
+
+
+@pytest.mark.asyncio
+async def test_update_with_retry_after(mock_aiointercept):
+    """Test deferring requests after being asked to retry later."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": "60"},
+    )
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        rate_limiter = RateLimiter(rate=10.0, burst=5, max_wait=10.0)
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            rate_limiter=rate_limiter,
+        )
+        status, entries = await feed.update()
+        assert status == UPDATE_ERROR
+        # Host is deferred, no request is sent and previous data is kept.
+        status, entries = await feed.update()
+        assert status == UPDATE_OK_NO_DATA
+        assert entries is None
+        assert sum(map(len, mock_aiointercept.requests.values())) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_rate_limited_mirror(mock_aiointercept):
+    """Test failing over to a mirror on another host due to the rate limit."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test1.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    mock_aiointercept.get(
+        "http://test2.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+    )
+    successes = []
+
+    def _record_success(mirror, latency):
+        successes.append(mirror.url)
+        original_record_success(mirror, latency)
+
+    original_record_success = Mirror.record_success
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        rate_limiter = RateLimiter(rate=0.01, burst=1, max_wait=0.0)
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test1.url/testpath",
+            mirror_urls=["http://test2.url/testpath"],
+            rate_limiter=rate_limiter,
+        )
+        with patch.object(Mirror, "record_success", _record_success):
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            # The first host is rate limited, the mirror on the other is not.
+            status, entries = await feed.update()
+            assert status == UPDATE_OK
+            assert len(entries) == 5
+            # Both hosts are rate limited, previous data is kept.
+            status, entries = await feed.update()
+            assert status == UPDATE_OK_NO_DATA
+            assert entries is None
+        # Requests not sent are not recorded as successes.
+        assert successes == [
+            "http://test1.url/testpath",
+            "http://test2.url/testpath",
+        ]
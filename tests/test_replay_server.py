@@ -0,0 +1,72 @@
+"""Test for the replay server."""
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.feed_manager import FeedManagerBase
+from aio_geojson_client.load_report import LoadReport
+from aio_geojson_client.replay_server import ReplayServer
+from aio_geojson_client.traffic_archive import RecordedResponse, TrafficArchive
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+URL = "http://test.url/testpath"
+
+
+def _archive() -> TrafficArchive:
+    """Create an archive in which the feed changes after 10 seconds."""
+    return TrafficArchive(
+        [
+            RecordedResponse(
+                URL,
+                200,
+                {"Content-Type": "application/json", "Content-Length": "1"},
+                load_fixture(fixture).encode("utf-8"),
+                offset=offset,
+                elapsed=0.5,
+            )
+            for offset, fixture in (
+                (0.0, "generic_feed_1.json"),
+                (10.0, "generic_feed_3.json"),
+            )
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay():
+    """Test replaying an archive to several feed managers."""
+    report = LoadReport()
+    async with (
+        ReplayServer(_archive(), speed=100.0) as server,
+        aiohttp.ClientSession() as websession,
+    ):
+        assert server.url(URL).endswith("/testpath")
+        managers = [
+            FeedManagerBase(
+                MockGeoJsonFeed(websession, (-31.0, 151.0), server.url(URL)),
+                report.generate_callback,
+                report.update_callback,
+                report.remove_callback,
+            )
+            for _ in range(3)
+        ]
+        await report.run(managers, duration=0.3, interval=0.02)
+        async with websession.get(server.url("http://test.url/unknown")) as response:
+            assert response.status == 404
+
+    assert server.requests == report.updates + 1
+    assert report.updates >= 6
+    assert report.throughput > 0
+    assert report.latency_percentile(0.5) >= 0.005
+    callbacks = report.callbacks
+    # Each manager saw both versions of the feed.
+    assert callbacks["generate"] > 15
+    assert callbacks["remove"] >= 3
+    assert report.summary()["updates"] == report.updates
+
+
+def test_invalid_speed():
+    """Test invalid replay speed."""
+    with pytest.raises(ValueError, match="Invalid speed"):
+        ReplayServer(_archive(), speed=0.0)
@@ -0,0 +1,129 @@
+"""Test for the shared state."""
+
+from concurrent.futures import ProcessPoolExecutor
+import math
+import struct
+from unittest.mock import patch
+
+import geojson
+import pytest
+
+from aio_geojson_client.shared_state import SharedState, StatePublisher, StateReader
+from aio_geojson_client.snapshot import FeedSnapshot
+from tests import MockFeedEntry
+
+HOME_COORDINATES = (-31.0, 151.0)
+
+
+def _snapshot(count: int) -> FeedSnapshot:
+    """Create a snapshot of entries with points."""
+    return FeedSnapshot.from_entries(
+        {
+            f"id-{index}": MockFeedEntry(
+                HOME_COORDINATES,
+                geojson.Feature(
+                    id=f"id-{index}", geometry=geojson.Point((151.0, -31.0 - index))
+                ),
+            )
+            for index in range(count)
+        }
+    )
+
+
+def _read_latitudes(path) -> tuple[int, list[str], list[float]]:
+    """Read the published state in another process."""
+    with StateReader(path) as reader:
+        state = reader.read()
+        return state.version, state.external_ids, list(state["latitude"])
+
+
+def test_shared_state(tmp_path):
+    """Test publishing and reading versions of state."""
+    path = tmp_path / "state"
+    with StatePublisher(path, capacity=256) as publisher, StateReader(path) as reader:
+        assert reader.read() is None
+        assert publisher.publish(_snapshot(2)) == 1
+        state = reader.read()
+        assert repr(state) == "<SharedState(version=1, entries=2)>"
+        assert len(state) == 2
+        assert state.external_ids == ["id-0", "id-1"]
+        assert list(state["latitude"]) == [-31.0, -32.0]
+        assert state["distance"][0] == 0.0
+        assert state["latitude"].readonly
+        assert state.valid
+
+        # The previous version stays readable while the next is written.
+        assert publisher.publish(_snapshot(0)) == 2
+        assert state.valid
+        assert list(state["latitude"]) == [-31.0, -32.0]
+        assert len(reader.read()) == 0
+
+        # Growing slots beyond their capacity.
+        assert publisher.publish(_snapshot(20)) == 3
+        assert not state.valid
+        state = reader.read()
+        assert reader.version == 3
+        assert len(state) == 20
+        assert state.external_id(19) == "id-19"
+        assert math.isclose(state["max_latitude"][19], -50.0)
+
+
+def test_shared_state_processes(tmp_path):
+    """Test reading published state in another process."""
+    path = tmp_path / "state"
+    with StatePublisher(path) as publisher:
+        publisher.publish(_snapshot(3))
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            version, external_ids, latitudes = executor.submit(
+                _read_latitudes, path
+            ).result()
+    assert version == 1
+    assert external_ids == ["id-0", "id-1", "id-2"]
+    assert latitudes == [-31.0, -32.0, -33.0]
+
+
+def test_shared_state_invalid(tmp_path):
+    """Test reading a file without shared state."""
+    path = tmp_path / "state"
+    path.write_bytes(bytes(256))
+    with pytest.raises(ValueError, match="Unsupported shared state"):
+        StateReader(path)
+
+
+def test_shared_state_torn_read(tmp_path):
+    """Test retrying reads torn by the publisher."""
+    path = tmp_path / "state"
+    with StatePublisher(path) as publisher, StateReader(path) as reader:
+        publisher.publish(_snapshot(1))
+        original_init = SharedState.__init__
+        calls = []
+
+        def _torn_init(state, *args):
+            calls.append(args[1])
+            if len(calls) == 1:
+                # The publisher overwrites the slot twice while decoding.
+                publisher.publish(_snapshot(2))
+                publisher.publish(_snapshot(3))
+                raise ValueError("Torn")
+            original_init(state, *args)
+
+        with patch.object(SharedState, "__init__", _torn_init):
+            state = reader.read()
+        assert calls == [1, 3]
+        assert state.external_ids == ["id-0", "id-1", "id-2"]
+
+
+def test_shared_state_corrupt(tmp_path):
+    """Test reading a slot that is inconsistent without publisher activity."""
+    path = tmp_path / "state"
+    with StatePublisher(path, capacity=256) as publisher:
+        publisher.publish(_snapshot(1))
+    with open(path, "r+b") as file:
+        # Entry count of the slot of version 1.
+        file.seek(128 + 256)
+        file.write(struct.pack("<Q", 1000))
+    with (
+        StateReader(path) as reader,
+        pytest.raises(ValueError, match="Inconsistent shared state version 1"),
+    ):
+        reader.read()
@@ -0,0 +1,147 @@
+"""Test for the polygon simplification."""
+
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from aio_geojson_client.filter_pipeline import RadiusFilterStage
+from aio_geojson_client.geometries.point import Point
+from aio_geojson_client.geometries.polygon import Polygon
+from aio_geojson_client.simplification import PolygonSimplifier
+from aio_geojson_client.spherical import (
+    EARTH_RADIUS_KM,
+    angle_to_segment,
+    to_unit_vector,
+)
+
+CENTRE = (-33.0, 151.0)
+
+
+def _noisy_circle(vertices: int, radius: float = 0.5) -> Polygon:
+    """Create a closed ring around the centre with small wiggles."""
+    points = []
+    for index in range(vertices):
+        bearing = 2 * math.pi * index / vertices
+        wiggle = 1 + 0.0005 * math.sin(37 * bearing)
+        points.append(
+            Point(
+                CENTRE[0] + radius * wiggle * math.sin(bearing),
+                CENTRE[1] + radius * wiggle * math.cos(bearing),
+            )
+        )
+    return Polygon([*points, points[0]])
+
+
+def _distance_to_outline(coordinates, polygon: Polygon) -> float:
+    """Calculate the spherical distance in km to the full outline."""
+    point = to_unit_vector(*coordinates)
+    vectors = [to_unit_vector(p.latitude, p.longitude) for p in polygon.points]
+    return EARTH_RADIUS_KM * min(
+        angle_to_segment(point, vectors[index - 1], vectors[index])
+        for index in range(1, len(vectors))
+    )
+
+
+def test_angle_to_segment():
+    """Test the angle between a point and an arc."""
+    a = to_unit_vector(0.0, 0.0)
+    b = to_unit_vector(0.0, 10.0)
+    # Closest point on the arc.
+    assert angle_to_segment(to_unit_vector(1.0, 5.0), a, b) == pytest.approx(
+        math.radians(1.0)
+    )
+    # Closest point beyond the end of the arc.
+    assert angle_to_segment(to_unit_vector(0.0, 12.0), a, b) == pytest.approx(
+        math.radians(2.0)
+    )
+    # Arc crossing the antimeridian.
+    a = to_unit_vector(0.0, 175.0)
+    b = to_unit_vector(0.0, -175.0)
+    assert angle_to_segment(to_unit_vector(-1.0, 180.0), a, b) == pytest.approx(
+        math.radians(1.0)
+    )
+
+
+def test_simplify():
+    """Test simplifying a polygon within the tolerance."""
+    polygon = _noisy_circle(5000)
+    simplifier = PolygonSimplifier(100.0)
+    simplified = simplifier.simplify(polygon)
+    assert len(simplified.polygon.points) < len(polygon.points) / 10
+    # Simplified once.
+    assert simplifier.simplify(polygon) is simplified
+    tolerance = simplifier.tolerance / 1000
+    for coordinates in [
+        CENTRE,
+        (-33.2, 151.3),
+        (-33.0, 151.55),
+        (-32.48, 151.0),
+        (-34.0, 152.0),
+    ]:
+        assert simplified.distance_to_outline(coordinates) == pytest.approx(
+            _distance_to_outline(coordinates, polygon), abs=tolerance
+        )
+
+
+def test_simplify_small_polygon():
+    """Test that small polygons are not simplified."""
+    polygon = _noisy_circle(20)
+    assert PolygonSimplifier(100.0).simplify(polygon) is None
+    # Triangles are kept as they are.
+    triangle = Polygon(
+        [
+            Point(-33.0, 151.0),
+            Point(-33.0, 151.1),
+            Point(-33.1, 151.0),
+            Point(-33.0, 151.0),
+        ]
+    )
+    simplified = PolygonSimplifier(100.0, min_vertices=4).simplify(triangle)
+    assert simplified.polygon.points == triangle.points
+    # Degenerate rings are kept as they are.
+    degenerate = [Point(-33.0, 151.0), Point(-33.0, 151.1), Point(-33.0, 151.0)]
+    simplified = PolygonSimplifier(100.0)._simplify(degenerate)  # noqa: SLF001
+    assert simplified.polygon.points == degenerate
+
+
+def test_invalid_configuration():
+    """Test invalid tolerance and minimum number of vertices."""
+    with pytest.raises(ValueError, match="Invalid tolerance"):
+        PolygonSimplifier(0.0)
+    with pytest.raises(ValueError, match="Invalid minimum number of vertices"):
+        PolygonSimplifier(100.0, min_vertices=3)
+
+
+def test_within_radius():
+    """Test the radius decisions on the simplified polygon."""
+    polygon = _noisy_circle(5000)
+    simplifier = PolygonSimplifier(100.0)
+    # Inside the polygon.
+    assert simplifier.within_radius(CENTRE, polygon, 1.0) is True
+    # Clearly inside or outside the radius.
+    assert simplifier.within_radius((-34.0, 151.0), polygon, 100.0) is True
+    assert simplifier.within_radius((-34.0, 151.0), polygon, 10.0) is False
+    # Within the tolerance of the radius.
+    distance = _distance_to_outline((-34.0, 151.0), polygon)
+    assert simplifier.within_radius((-34.0, 151.0), polygon, distance) is None
+
+
+def test_radius_filter_stage():
+    """Test that the radius filter stage matches the full-resolution result."""
+    polygon = _noisy_circle(5000)
+    simplifier = PolygonSimplifier(100.0)
+    for home, radius in [
+        (CENTRE, 1.0),
+        ((-34.0, 151.0), 100.0),
+        ((-34.0, 151.0), 10.0),
+        ((-34.0, 151.0), _distance_to_outline((-34.0, 151.0), polygon) + 0.01),
+        ((-34.0, 151.0), _distance_to_outline((-34.0, 151.0), polygon) - 0.01),
+    ]:
+        entry = MagicMock(geometries=[polygon], distance_cache=None)
+        stage = RadiusFilterStage(home, radius, simplifier)
+        expected = (
+            polygon.is_inside(Point(*home))
+            or _distance_to_outline(home, polygon) <= radius
+        )
+        assert stage.accept(entry) is expected
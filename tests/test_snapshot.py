@@ -0,0 +1,124 @@
+"""Test for the feed snapshot."""
+
+from datetime import UTC, datetime
+import math
+
+import geojson
+import pytest
+
+from aio_geojson_client.snapshot import FeedSnapshot
+from tests import MockFeedEntry
+
+HOME_COORDINATES = (-31.0, 151.0)
+
+
+class MockTimestampFeedEntry(MockFeedEntry):
+    """Feed entry with a timestamp."""
+
+    @property
+    def updated(self) -> datetime | None:
+        """Return the updated timestamp of this entry."""
+        value = self._search_in_properties("updated")
+        return datetime.fromisoformat(value) if value else None
+
+
+def _entries() -> dict[str, MockFeedEntry]:
+    """Create entries with a point, a polygon and no geometry."""
+    features = [
+        geojson.Feature(
+            id="1",
+            geometry=geojson.Point((151.0, -31.0)),
+            properties={"title": "Point", "updated": "2026-01-01T00:00:00+00:00"},
+        ),
+        geojson.Feature(
+            id="2",
+            geometry=geojson.Polygon(
+                [[(150.0, -30.0), (150.5, -30.0), (150.5, -30.5), (150.0, -30.0)]]
+            ),
+            properties={"title": "Polygon"},
+        ),
+        geojson.Feature(id="3", geometry=None, properties={}),
+    ]
+    return {
+        feature.id: MockTimestampFeedEntry(HOME_COORDINATES, feature)
+        for feature in features
+    }
+
+
+def test_snapshot():
+    """Test building columns from entries."""
+    entries = _entries()
+    snapshot = FeedSnapshot.from_entries(entries, ["title"], timestamps=["updated"])
+    assert repr(snapshot) == "<FeedSnapshot(entries=3)>"
+    assert len(snapshot) == 3
+    assert list(snapshot.columns) == [
+        "external_id",
+        "latitude",
+        "longitude",
+        "distance",
+        "min_latitude",
+        "min_longitude",
+        "max_latitude",
+        "max_longitude",
+        "properties.title",
+        "updated",
+    ]
+    assert snapshot["external_id"] == ["1", "2", "3"]
+    assert snapshot["properties.title"] == ["Point", "Polygon", None]
+    assert snapshot["latitude"][0] == -31.0
+    assert snapshot["distance"][0] == 0.0
+    assert snapshot["distance"][1] == pytest.approx(entries["2"].distance_to_home)
+    assert snapshot["latitude"][1] == pytest.approx(entries["2"].coordinates[0])
+    assert list(snapshot["min_latitude"])[:2] == [-31.0, -30.5]
+    assert list(snapshot["max_longitude"])[:2] == [151.0, 150.5]
+    assert snapshot["updated"][0] == datetime(2026, 1, 1, tzinfo=UTC).timestamp()
+    for name in ("latitude", "distance", "max_longitude", "updated"):
+        assert math.isnan(snapshot[name][2])
+    assert math.isnan(snapshot["updated"][1])
+
+
+def test_snapshot_empty():
+    """Test building columns without entries."""
+    snapshot = FeedSnapshot.from_entries({})
+    assert len(snapshot) == 0
+    assert len(snapshot["distance"]) == 0
+
+
+def test_geometry_summary_antimeridian():
+    """Test the bounding box of geometries on both sides of the antimeridian."""
+    feature = geojson.Feature(
+        id="1",
+        geometry=geojson.GeometryCollection(
+            [
+                geojson.Point((179.5, -17.0)),
+                geojson.Polygon(
+                    [[(179.0, -18.0), (-179.0, -18.0), (-179.0, -19.0), (179.0, -18.0)]]
+                ),
+            ]
+        ),
+    )
+    coordinates, distance, bounding_box = MockFeedEntry(
+        (-17.0, 179.5), feature
+    ).geometry_summary()
+    assert coordinates == (-17.0, 179.5)
+    assert distance == 0.0
+    assert bounding_box == (-19.0, -180.0, -17.0, 180.0)
+
+
+def test_snapshot_numpy():
+    """Test converting columns to NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    snapshot = FeedSnapshot.from_entries(_entries(), ["title"])
+    arrays = snapshot.to_numpy()
+    assert arrays["latitude"].dtype == np.float64
+    assert arrays["latitude"][0] == -31.0
+    assert list(arrays["external_id"]) == ["1", "2", "3"]
+
+
+def test_snapshot_arrow():
+    """Test converting columns to an Arrow table."""
+    pytest.importorskip("pyarrow")
+    table = FeedSnapshot.from_entries(_entries(), ["title"]).to_arrow()
+    assert table.num_rows == 3
+    assert table.column("external_id").to_pylist() == ["1", "2", "3"]
+    assert table.column("latitude").to_pylist()[2] is None
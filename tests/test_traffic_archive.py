@@ -0,0 +1,56 @@
+"""Test for the traffic archive."""
+
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+from aio_geojson_client.consts import UPDATE_ERROR, UPDATE_OK
+from aio_geojson_client.traffic_archive import TrafficArchive
+from tests import MockGeoJsonFeed
+from tests.utils import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_record_and_load(mock_aiointercept, tmp_path):
+    """Test recording responses, and saving and loading them."""
+    home_coordinates = (-31.0, 151.0)
+    mock_aiointercept.get(
+        "http://test.url/testpath",
+        status=HTTPStatus.OK,
+        body=load_fixture("generic_feed_1.json"),
+        headers={"Content-Type": "application/geo+json"},
+    )
+    mock_aiointercept.get("http://test.url/testpath", status=HTTPStatus.NOT_FOUND)
+
+    async with aiohttp.ClientSession(loop=asyncio.get_running_loop()) as websession:
+        archive = TrafficArchive()
+        feed = MockGeoJsonFeed(
+            websession,
+            home_coordinates,
+            "http://test.url/testpath",
+            traffic_archive=archive,
+        )
+        status, _ = await feed.update()
+        assert status == UPDATE_OK
+        status, _ = await feed.update()
+        assert status == UPDATE_ERROR
+
+    assert len(archive) == 2
+    assert repr(archive) == "<TrafficArchive(responses=2)>"
+    path = tmp_path / "traffic.gz"
+    archive.save(path)
+    loaded = TrafficArchive.load(path)
+    assert len(loaded) == 2
+    assert loaded.duration == pytest.approx(archive.duration)
+    for recorded, response in zip(archive.responses, loaded.responses, strict=True):
+        assert response.url == recorded.url == "http://test.url/testpath"
+        assert response.status == recorded.status
+        assert response.headers == recorded.headers
+        assert response.body == recorded.body
+        assert response.offset == recorded.offset
+        assert response.elapsed == recorded.elapsed
+    assert loaded.responses[0].body == load_fixture("generic_feed_1.json").encode()
+    assert loaded.responses[0].headers["Content-Type"] == "application/geo+json"
+    assert loaded.responses[1].status == HTTPStatus.NOT_FOUND